@@ -10,6 +10,13 @@ import src.model
 from src.utils.statistics import print_wallets_stats
 from src.utils.logs import ProgressTracker, create_progress_tracker
 from src.utils.config_browser import run
+from src.model.onchain.provider_pool import get_provider_pool
+from src.model.onchain.rpc_cache import save_rpc_cache
+from src.model.onchain.ws_subscriber import start_chain_subscriber, stop_chain_subscribers
+from src.model.offchain.cex.exchange_client import close_exchange_client
+from src.model.offchain.cex.dispatcher import close_withdrawal_dispatcher
+from src.model.projects.camp_loyalty.verifier import close_quest_verifier
+from src.utils.session_manager import close_session_manager
 
 
 async def start():
@@ -168,6 +175,10 @@ async def start():
         )
     logger.info(f"Accounts order: {account_order}")
 
+    # Shared WebSocket subscriptions drive receipt and balance waiters of all accounts
+    if config.RPCS.CAMP_NETWORK_WS:
+        start_chain_subscriber(config.RPCS.CAMP_NETWORK_WS)
+
     semaphore = asyncio.Semaphore(value=threads)
     tasks = []
 
@@ -197,6 +208,13 @@ async def start():
         )
 
     await asyncio.gather(*tasks)
+    await close_quest_verifier()
+    await stop_chain_subscribers()
+    await get_provider_pool().close_all()
+    save_rpc_cache()
+    await close_withdrawal_dispatcher()
+    await close_exchange_client()
+    await close_session_manager()
 
     logger.success("Saved accounts and private keys to a file.")
 
@@ -228,6 +246,7 @@ async def account_flow(
 
         result = await wrapper(instance.initialize, config)
         if not result:
+            await instance.close()
             raise Exception("Failed to initialize")
 
         result = await wrapper(instance.flow, config)
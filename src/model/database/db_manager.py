@@ -1,11 +1,11 @@
 import asyncio
-import json
 import random
 from typing import List
 from tabulate import tabulate
 from loguru import logger
 
 from src.model.database.instance import Database
+from src.utils import json_codec
 from src.utils.config import get_config
 from src.utils.reader import read_private_keys
 from src.utils.proxy_parser import Proxy  # Добавляем импорт
@@ -235,7 +235,7 @@ async def show_database_contents():
         table_data = []
         for wallet in all_wallets:
             tasks = (
-                json.loads(wallet["tasks"])
+                json_codec.loads(wallet["tasks"])
                 if isinstance(wallet["tasks"], str)
                 else wallet["tasks"]
             )
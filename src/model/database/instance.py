@@ -1,4 +1,3 @@
-import json
 from typing import Optional, List, Dict
 from sqlalchemy import create_engine, Column, Integer, String
 from sqlalchemy.ext.declarative import declarative_base
@@ -6,6 +5,8 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from loguru import logger
 
+from src.utils import json_codec
+
 Base = declarative_base()
 
 
@@ -70,7 +71,7 @@ class Database:
                 private_key=private_key,
                 proxy=proxy,
                 status="pending",
-                tasks=json.dumps(tasks),
+                tasks=json_codec.dumps(tasks),
             )
             session.add(wallet)
             await session.commit()
@@ -92,13 +93,13 @@ class Database:
                 logger.error(f"Wallet {private_key[:4]}...{private_key[-4:]} not found")
                 return
 
-            tasks = json.loads(wallet.tasks)
+            tasks = json_codec.loads(wallet.tasks)
             for task in tasks:
                 if task["name"] == task_name:
                     task["status"] = new_status
                     break
 
-            wallet.tasks = json.dumps(tasks)
+            wallet.tasks = json_codec.dumps(tasks)
 
             # Проверяем, все ли задачи выполнены
             if all(task["status"] == "completed" for task in tasks):
@@ -120,7 +121,7 @@ class Database:
             if not wallet:
                 return
 
-            wallet.tasks = json.dumps([])
+            wallet.tasks = json_codec.dumps([])
             wallet.status = "pending"
             await session.commit()
             logger.info(
@@ -156,7 +157,7 @@ class Database:
             wallet = await self._get_wallet(session, private_key)
             if not wallet:
                 return []
-            return json.loads(wallet.tasks)
+            return json_codec.loads(wallet.tasks)
 
     async def get_pending_tasks(self, private_key: str) -> List[str]:
         """
@@ -197,7 +198,7 @@ class Database:
                     "private_key": wallet.private_key,
                     "proxy": wallet.proxy,
                     "status": wallet.status,
-                    "tasks": json.loads(wallet.tasks),
+                    "tasks": json_codec.loads(wallet.tasks),
                 }
                 for wallet in wallets
             ]
@@ -236,7 +237,7 @@ class Database:
             if not wallet:
                 return
 
-            current_tasks = json.loads(wallet.tasks)
+            current_tasks = json_codec.loads(wallet.tasks)
             current_task_names = {task["name"] for task in current_tasks}
 
             # Добавляем только новые задачи
@@ -244,7 +245,7 @@ class Database:
                 if task not in current_task_names:
                     current_tasks.append({"name": task, "status": "pending"})
 
-            wallet.tasks = json.dumps(current_tasks)
+            wallet.tasks = json_codec.dumps(current_tasks)
             wallet.status = (
                 "pending"  # Если добавили новые задачи, статус снова pending
             )
@@ -319,7 +320,7 @@ class Database:
                     "private_key": wallet.private_key,
                     "proxy": wallet.proxy,
                     "status": wallet.status,
-                    "tasks": json.loads(wallet.tasks),
+                    "tasks": json_codec.loads(wallet.tasks),
                 }
                 for wallet in wallets
             ]
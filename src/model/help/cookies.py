@@ -1,12 +1,15 @@
 import json
 from datetime import datetime, timedelta
-from typing import Optional, Dict
-from sqlalchemy import create_engine, Column, Integer, String, DateTime
+from typing import Any, Iterable, Optional, Dict, Set
+from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, UniqueConstraint
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from loguru import logger
 
+from src.utils import json_codec
+
 Base = declarative_base()
 
 
@@ -19,6 +22,25 @@ class Cookie(Base):
     expires_at = Column(DateTime)
 
 
+class CompletedRule(Base):
+    __tablename__ = "loyalty_completed_rules"
+    __table_args__ = (UniqueConstraint("private_key", "rule_id"),)
+    id = Column(Integer, primary_key=True)
+    private_key = Column(String, index=True)
+    rule_id = Column(String)
+    completed_at = Column(DateTime)
+
+
+class LoyaltySession(Base):
+    __tablename__ = "loyalty_sessions"
+    id = Column(Integer, primary_key=True)
+    private_key = Column(String, unique=True)
+    session_token = Column(String)
+    user_info = Column(Text)
+    created_at = Column(DateTime)
+    expires_at = Column(DateTime)
+
+
 class CookieDatabase:
     def __init__(self):
         self.engine = create_async_engine(
@@ -208,3 +230,133 @@ class CookieDatabase:
             select(Cookie).filter_by(private_key=private_key)
         )
         return result.scalar_one_or_none()
+
+    async def get_completed_rules(self, private_key: str) -> Set[str]:
+        """
+        Get Loyalty rule IDs a wallet completed in earlier runs
+
+        :param private_key: Private key of the wallet
+        :return: Set of completed rule IDs
+        """
+        from sqlalchemy import select
+
+        async with self.session() as session:
+            result = await session.execute(
+                select(CompletedRule.rule_id).filter_by(private_key=private_key)
+            )
+            return set(result.scalars().all())
+
+    async def add_completed_rules(self, private_key: str, rule_ids: Iterable[str]) -> None:
+        """
+        Remember Loyalty rules a wallet has completed
+
+        :param private_key: Private key of the wallet
+        :param rule_ids: Completed rule IDs, already stored ones are ignored
+        """
+        rule_ids = set(rule_ids)
+        if not rule_ids:
+            return
+
+        now = datetime.now()
+        # Concurrent writers of the same wallet may store the same rule, the
+        # unique constraint keeps the first row
+        statement = (
+            sqlite_insert(CompletedRule)
+            .values(
+                [
+                    {"private_key": private_key, "rule_id": rule_id, "completed_at": now}
+                    for rule_id in rule_ids
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=["private_key", "rule_id"])
+        )
+        async with self.session() as session:
+            await session.execute(statement)
+            await session.commit()
+
+    async def save_loyalty_session(
+        self,
+        private_key: str,
+        session_token: str,
+        user_info: Any,
+        expiration_hours: float = 24,
+    ) -> None:
+        """
+        Save a Loyalty next-auth session token and the user info of a wallet
+
+        :param private_key: Private key of the wallet
+        :param session_token: Value of the __Secure-next-auth.session-token cookie
+        :param user_info: Loyalty user info returned by /api/users
+        :param expiration_hours: Session expiration time in hours (default: 24 hours)
+        """
+        from sqlalchemy import select
+
+        now = datetime.now()
+        async with self.session() as session:
+            result = await session.execute(
+                select(LoyaltySession).filter_by(private_key=private_key)
+            )
+            saved = result.scalar_one_or_none()
+            if saved is None:
+                saved = LoyaltySession(private_key=private_key)
+                session.add(saved)
+
+            saved.session_token = session_token
+            saved.user_info = json_codec.dumps(user_info)
+            saved.created_at = now
+            saved.expires_at = now + timedelta(hours=expiration_hours)
+            await session.commit()
+
+    async def get_valid_loyalty_session(self, private_key: str) -> Optional[Dict]:
+        """
+        Get the saved Loyalty session of a wallet if it has not expired
+
+        :param private_key: Private key of the wallet
+        :return: Dictionary with session_token and user_info, None if there is no valid session
+        """
+        from sqlalchemy import select
+
+        async with self.session() as session:
+            result = await session.execute(
+                select(LoyaltySession).filter_by(private_key=private_key)
+            )
+            saved = result.scalar_one_or_none()
+
+            if not saved or saved.expires_at < datetime.now():
+                return None
+
+            return {
+                "session_token": saved.session_token,
+                "user_info": json_codec.loads(saved.user_info),
+            }
+
+    async def update_loyalty_user_info(self, private_key: str, user_info: Any) -> None:
+        """
+        Replace the user info of a saved Loyalty session, keeping its expiration
+
+        :param private_key: Private key of the wallet
+        :param user_info: Loyalty user info returned by /api/users
+        """
+        from sqlalchemy import update
+
+        async with self.session() as session:
+            await session.execute(
+                update(LoyaltySession)
+                .where(LoyaltySession.private_key == private_key)
+                .values(user_info=json_codec.dumps(user_info))
+            )
+            await session.commit()
+
+    async def delete_loyalty_session(self, private_key: str) -> None:
+        """
+        Delete the saved Loyalty session of a wallet
+
+        :param private_key: Private key of the wallet
+        """
+        from sqlalchemy import delete
+
+        async with self.session() as session:
+            await session.execute(
+                delete(LoyaltySession).where(LoyaltySession.private_key == private_key)
+            )
+            await session.commit()
@@ -1,12 +1,14 @@
 import asyncio
 import base64
 from dataclasses import dataclass
-import json
 import random
 import time
 from loguru import logger
+from functools import lru_cache
 from curl_cffi.requests import AsyncSession, Response
+from src.utils import json_codec
 from src.utils.config import Config
+from src.utils.session_manager import SessionKey, get_session_manager
 
 
 class DiscordInviter:
@@ -18,8 +20,15 @@ class DiscordInviter:
         self.session: AsyncSession | None = None
 
     async def invite(self, invite_code: str) -> dict:
-        self.session = await create_client(self.proxy)
+        async with get_session_manager().session(
+            discord_session_key(self.proxy), lambda: _build_session(self.proxy)
+        ) as self.session:
+            try:
+                return await self._invite(invite_code)
+            finally:
+                self.session = None
 
+    async def _invite(self, invite_code: str) -> dict:
         for retry in range(self.config.SETTINGS.ATTEMPTS):
             try:
                 if not await init_cf(self.account_index, self.session):
@@ -98,7 +107,7 @@ class DiscordInviter:
                     logger.error(f"{self.account_index} | Captcha detected. Can't solve it.")
                     return None
 
-                elif response.status_code == 200 and response.json()["type"] == 0:
+                elif response.status_code == 200 and json_codec.response_json(response)["type"] == 0:
                     logger.success(f"{self.account_index} | Account joined the server!")
                     return True
 
@@ -137,8 +146,10 @@ def calculate_nonce() -> str:
     return str((int(unix_ts) * 1000 - 1420070400000) * 4194304)
 
 
+# Same value for every request, encoded once
+@lru_cache(maxsize=1)
 def create_x_super_properties() -> str:
-    return base64.b64encode(json.dumps({
+    return base64.b64encode(json_codec.dumps_bytes({
    "os":"Windows",
    "browser":"Chrome",
    "device":"",
@@ -154,7 +165,7 @@ def create_x_super_properties() -> str:
    "client_build_number":370533,
    "client_event_source":None,
    "has_client_mods":False
-}, separators=(',', ':')).encode('utf-8')).decode('utf-8')
+})).decode('utf-8')
 
 
 async def get_guild_ids(client: AsyncSession, invite_code: str, account_index: int, discord_token: str) -> tuple[str, str, bool]:
@@ -184,8 +195,9 @@ async def get_guild_ids(client: AsyncSession, invite_code: str, account_index: i
             logger.error(f"{account_index} | Account needs verification (Email code etc).")
             return "verification_failed", "", False
 
-        location_guild_id = response.json()['guild_id']
-        location_channel_id = response.json()['channel']['id']
+        invite = json_codec.response_json(response)
+        location_guild_id = invite['guild_id']
+        location_channel_id = invite['channel']['id']
 
         return location_guild_id, location_channel_id, True
 
@@ -195,12 +207,12 @@ async def get_guild_ids(client: AsyncSession, invite_code: str, account_index: i
     
 
 def create_x_context_properties(location_guild_id: str, location_channel_id: str) -> str:
-    return base64.b64encode(json.dumps({
+    return base64.b64encode(json_codec.dumps_bytes({
         "location": "Accept Invite Page",
         "location_guild_id": location_guild_id,
         "location_channel_id": location_channel_id,
         "location_channel_type": 0
-    }, separators=(',', ':')).encode('utf-8')).decode('utf-8')
+    })).decode('utf-8')
 
 
 async def init_cf(account_index: int, client: AsyncSession) -> bool:
@@ -250,7 +262,11 @@ async def set_response_cookies(client: AsyncSession, response: Response) -> bool
         logger.error(f"Failed to set response cookies: {err}")
         return False
 
-async def create_client(proxy: str) -> AsyncSession:
+def discord_session_key(proxy: str) -> SessionKey:
+    return SessionKey("curl_cffi", proxy, "chrome131-discord", verify=False)
+
+
+def _build_session(proxy: str) -> AsyncSession:
     session = AsyncSession(
                 impersonate="chrome131",
                 verify=False,
@@ -266,6 +282,13 @@ async def create_client(proxy: str) -> AsyncSession:
 
     return session
 
+
+async def create_client(proxy: str) -> AsyncSession:
+    """Lease a pooled Discord session, give it back with get_session_manager().release."""
+    return await get_session_manager().acquire(
+        discord_session_key(proxy), lambda: _build_session(proxy)
+    )
+
 HEADERS = {
     'accept': '*/*',
     'accept-language': 'en-GB,en-US;q=0.9,en;q=0.8,ru;q=0.7,zh-TW;q=0.6,zh;q=0.5',
@@ -3,7 +3,9 @@ from loguru import logger
 from src.utils.client import create_twitter_client
 from curl_cffi.requests import AsyncSession
 
+from src.utils import json_codec
 from src.utils.config import Config
+from src.utils.session_manager import get_session_manager
 from src.utils.decorators import retry_async
 
 
@@ -32,9 +34,16 @@ class Twitter:
         self.csrf_token: str | None = None
         self.username: str | None = None
 
+    async def close(self):
+        """Give the HTTP session back to the session manager"""
+        if self.session is not None:
+            await get_session_manager().release(self.session)
+            self.session = None
+
     @retry_async(default_value=False)
     async def initialize(self):
         try:
+            await self.close()
             self.session, self.csrf_token = await create_twitter_client(
                 self.proxy, self.auth_token, self.config.OTHERS.SKIP_SSL_VERIFICATION
             )
@@ -173,7 +182,7 @@ class Twitter:
                 if not should_continue:
                     return False
 
-            if response.json()["screen_name"].lower() == username.lower():
+            if json_codec.response_json(response)["screen_name"].lower() == username.lower():
                 logger.success(
                     f"[{self.account_index}] Successfully followed user: {username}"
                 )
@@ -218,7 +227,7 @@ class Twitter:
                     return False
 
             rest_id = (
-                response.json()
+                json_codec.response_json(response)
                 .get("data", {})
                 .get("create_retweet", {})
                 .get("retweet_results", {})
@@ -352,7 +361,7 @@ class Twitter:
                 if not should_continue:
                     return False
 
-            response_json = response.json()
+            response_json = json_codec.response_json(response)
 
             tweet_id = (
                 response_json.get("data", {})
@@ -498,7 +507,7 @@ class Twitter:
                 if not should_continue:
                     return False
 
-            response_json = response.json()
+            response_json = json_codec.response_json(response)
 
             tweet_id = (
                 response_json.get("data", {})
@@ -570,11 +579,11 @@ class Twitter:
             )
             await self._update_cookies()
 
-            data_item = response.json().get("data", {})
+            data_item = json_codec.response_json(response).get("data", {})
             if not data_item:
                 raise Exception(f"{response.text}")
 
-            data = response.json()["data"]["user"]["result"]
+            data = data_item["user"]["result"]
             user_info = {}
 
             user_info["user_id"] = data.get("rest_id", None)
@@ -621,7 +630,7 @@ class Twitter:
                 if not should_continue:
                     return None
 
-            response_json = response.json()
+            response_json = json_codec.response_json(response)
 
             # Extract username from the response
             username = (
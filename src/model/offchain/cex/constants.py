@@ -31,4 +31,15 @@ EXCHANGE_PARAMS = {
 }
 
 # Supported exchanges
-SUPPORTED_EXCHANGES = ["okx", "bitget"]
\ No newline at end of file
+SUPPORTED_EXCHANGES = ["okx", "bitget"]
+# Markets and currency networks are reloaded from the exchange at most this often (seconds)
+MARKETS_TTL = 600
+
+# Exchange API calls per second shared by all wallets
+EXCHANGE_REQUESTS_PER_SECOND = 2
+
+# Workers of the withdrawal dispatcher, the exchange rate limiter sets the actual pace
+WITHDRAWAL_DISPATCHER_WORKERS = 3
+
+# Window (seconds) over which the dispatcher submit rate is measured
+SUBMIT_RATE_WINDOW = 300
@@ -0,0 +1,142 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from loguru import logger
+
+from src.model.offchain.cex.exchange_client import ExchangeClient
+from src.model.offchain.cex.constants import (
+    WITHDRAWAL_DISPATCHER_WORKERS,
+    SUBMIT_RATE_WINDOW,
+)
+
+
+@dataclass
+class WithdrawalRequest:
+    account_index: int
+    currency: str
+    amount: float
+    address: str
+    params: Dict
+    # Started by the dispatcher right after the withdrawal is made
+    wait_for_arrival: Optional[Callable[[], Awaitable[bool]]] = None
+    submitted: asyncio.Future = field(default=None, repr=False)
+    arrived: Optional[asyncio.Task] = field(default=None, repr=False)
+
+    def __post_init__(self):
+        if self.submitted is None:
+            self.submitted = asyncio.get_running_loop().create_future()
+
+
+class WithdrawalDispatcher:
+    """
+    Submits withdrawals of all wallets from one queue.
+
+    Wallet flows put a request in the queue and await its future instead of calling
+    the exchange themselves. A few workers drain the queue as fast as the rate
+    limiter of the shared exchange client allows, and arrival checks of made
+    withdrawals run in the background so they never hold back the queue.
+    """
+
+    def __init__(self, client: ExchangeClient, workers: int = WITHDRAWAL_DISPATCHER_WORKERS):
+        self.client = client
+        self.workers_count = workers
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._workers: List[asyncio.Task] = []
+        self._submit_times = deque()
+
+        self.submitted = 0
+        self.failed = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests waiting to be submitted."""
+        return self._queue.qsize()
+
+    @property
+    def submit_rate(self) -> float:
+        """Withdrawals made per minute over the last SUBMIT_RATE_WINDOW seconds."""
+        now = time.monotonic()
+        while self._submit_times and self._submit_times[0] < now - SUBMIT_RATE_WINDOW:
+            self._submit_times.popleft()
+        return len(self._submit_times) * 60 / SUBMIT_RATE_WINDOW
+
+    async def submit(self, request: WithdrawalRequest) -> Any:
+        """
+        Queue a withdrawal and wait until the exchange accepts it.
+
+        Returns:
+            Withdrawal info returned by ccxt. Exchange errors are raised as is.
+        """
+        self._ensure_workers()
+        await self._queue.put(request)
+        logger.info(
+            f"[{request.account_index}] Withdrawal queued (queue depth: {self.queue_depth}, rate: {self.submit_rate:.1f}/min)"
+        )
+        return await request.submitted
+
+    def _ensure_workers(self) -> None:
+        self._workers = [worker for worker in self._workers if not worker.done()]
+        while len(self._workers) < self.workers_count:
+            self._workers.append(asyncio.create_task(self._worker()))
+
+    async def _worker(self) -> None:
+        while True:
+            request = await self._queue.get()
+            try:
+                if request.submitted.done():
+                    continue
+                try:
+                    withdrawal = await self.client.withdraw(
+                        request.currency, request.amount, request.address, request.params
+                    )
+                except Exception as e:
+                    self.failed += 1
+                    request.submitted.set_exception(e)
+                    continue
+
+                self.submitted += 1
+                self._submit_times.append(time.monotonic())
+                if request.wait_for_arrival is not None:
+                    request.arrived = asyncio.create_task(request.wait_for_arrival())
+                request.submitted.set_result(withdrawal)
+            finally:
+                self._queue.task_done()
+
+    async def close(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if self.submitted or self.failed:
+            logger.info(
+                f"Withdrawal dispatcher closed (submitted: {self.submitted}, failed: {self.failed})"
+            )
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "queue_depth": self.queue_depth,
+            "submit_rate": self.submit_rate,
+            "submitted": self.submitted,
+            "failed": self.failed,
+        }
+
+
+_dispatcher: Optional[WithdrawalDispatcher] = None
+
+
+def get_withdrawal_dispatcher(client: ExchangeClient) -> WithdrawalDispatcher:
+    """Get the withdrawal dispatcher shared by every wallet of the run."""
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = WithdrawalDispatcher(client)
+    return _dispatcher
+
+
+async def close_withdrawal_dispatcher() -> None:
+    """Stop the dispatcher workers if the dispatcher was started."""
+    global _dispatcher
+    if _dispatcher is not None:
+        await _dispatcher.close()
+        _dispatcher = None
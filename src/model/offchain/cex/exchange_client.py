@@ -0,0 +1,140 @@
+import asyncio
+import time
+from typing import Dict, Optional
+import ccxt.async_support as ccxt
+from loguru import logger
+
+from src.utils.config import ExchangesConfig
+from src.utils.rate_limiter import RateLimiter
+from src.model.offchain.cex.constants import (
+    EXCHANGE_PARAMS,
+    SUPPORTED_EXCHANGES,
+    MARKETS_TTL,
+    EXCHANGE_REQUESTS_PER_SECOND,
+)
+
+
+class ExchangeClient:
+    """
+    One ccxt exchange session shared by every wallet of the run.
+
+    Markets and currency networks are loaded once per MARKETS_TTL, every
+    exchange API call goes through one rate limiter, and the funding balance is
+    fetched once and then tracked locally: each withdrawal reserves its amount
+    instead of every wallet fetching the balance again.
+    """
+
+    def __init__(self, config: ExchangesConfig):
+        self.config = config
+        self.name = config.name.lower()
+        if self.name not in SUPPORTED_EXCHANGES:
+            raise ValueError(f"Unsupported exchange: {self.name}")
+
+        self.exchange = getattr(ccxt, self.name)()
+        self.exchange.apiKey = config.apiKey
+        self.exchange.secret = config.secretKey
+        if config.passphrase:
+            self.exchange.password = config.passphrase
+
+        self.limiter = RateLimiter(EXCHANGE_REQUESTS_PER_SECOND)
+        self._markets_expire_at = 0.0
+        self._markets_lock = asyncio.Lock()
+        # Funding balance as last fetched minus withdrawals made since, and amounts
+        # reserved by wallets whose withdrawals are not made yet
+        self._balances: Dict[str, float] = {}
+        self._reserved: Dict[str, float] = {}
+        self._balance_lock = asyncio.Lock()
+        self._authenticated = False
+
+        self.api_calls = 0
+
+    async def _call(self, method: str, *args, **kwargs):
+        async with self.limiter:
+            self.api_calls += 1
+            return await getattr(self.exchange, method)(*args, **kwargs)
+
+    async def check_auth(self) -> None:
+        """Test exchange authentication once per run, loading the funding balance with it."""
+        async with self._balance_lock:
+            if not self._authenticated:
+                await self._refresh_balances()
+
+    async def get_currency_networks(self, currency: str) -> Optional[Dict]:
+        """Get withdrawal networks of a currency, reloading markets once per TTL."""
+        async with self._markets_lock:
+            if time.monotonic() >= self._markets_expire_at:
+                await self._call("load_markets", True)
+                self._markets_expire_at = time.monotonic() + MARKETS_TTL
+
+        currency_info = self.exchange.currencies.get(currency)
+        if currency_info is None:
+            return None
+        return currency_info["networks"]
+
+    async def _refresh_balances(self) -> None:
+        params = EXCHANGE_PARAMS[self.name]["balance"]
+        balances = await self._call("fetch_balance", params=params)
+        self._balances = {
+            currency: float(balance["total"] or 0)
+            for currency, balance in balances.items()
+            if isinstance(balance, dict) and "total" in balance
+        }
+        self._authenticated = True
+
+    async def reserve(self, currency: str, amount: float) -> Optional[float]:
+        """
+        Reserve amount from the locally tracked funding balance.
+        The balance is fetched from the exchange only on first use or when the
+        local one is too low (it may have been topped up).
+
+        Returns:
+            Available funding balance before the reservation, or None if it is insufficient
+        """
+        async with self._balance_lock:
+            if not self._authenticated or self.get_balance(currency) < amount:
+                await self._refresh_balances()
+
+            balance = self.get_balance(currency)
+            if balance < amount:
+                return None
+            self._reserved[currency] = self._reserved.get(currency, 0) + amount
+            return balance
+
+    def get_balance(self, currency: str) -> float:
+        """Locally tracked funding balance available for new reservations."""
+        return self._balances.get(currency, 0) - self._reserved.get(currency, 0)
+
+    def commit(self, currency: str, amount: float) -> None:
+        """Debit a reservation whose withdrawal was made."""
+        self._reserved[currency] = max(0, self._reserved.get(currency, 0) - amount)
+        self._balances[currency] = self._balances.get(currency, 0) - amount
+
+    def release(self, currency: str, amount: float) -> None:
+        """Give back a reservation whose withdrawal was not made."""
+        self._reserved[currency] = max(0, self._reserved.get(currency, 0) - amount)
+
+    async def withdraw(self, currency: str, amount: float, address: str, params: Dict):
+        return await self._call("withdraw", currency, amount, address, params=params)
+
+    async def close(self) -> None:
+        await self.exchange.close()
+        logger.info(f"{self.config.name} session closed ({self.api_calls} API calls)")
+
+
+_exchange_client: Optional[ExchangeClient] = None
+
+
+def get_exchange_client(config: ExchangesConfig) -> ExchangeClient:
+    """Get the exchange client shared by every wallet of the run."""
+    global _exchange_client
+    if _exchange_client is None:
+        _exchange_client = ExchangeClient(config)
+    return _exchange_client
+
+
+async def close_exchange_client() -> None:
+    """Close the shared exchange session if it was opened."""
+    global _exchange_client
+    if _exchange_client is not None:
+        await _exchange_client.close()
+        _exchange_client = None
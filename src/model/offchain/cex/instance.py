@@ -1,19 +1,22 @@
 import random
 import ccxt.async_support as ccxt
 import asyncio
-import time
 from decimal import Decimal
+from functools import partial
 from src.utils.config import Config
 from eth_account import Account
 from loguru import logger
-from web3 import Web3
 from src.model.offchain.cex.constants import (
     CEX_WITHDRAWAL_RPCS,
     NETWORK_MAPPINGS,
     EXCHANGE_PARAMS,
-    SUPPORTED_EXCHANGES
 )
+from src.model.offchain.cex.exchange_client import get_exchange_client
+from src.model.offchain.cex.dispatcher import WithdrawalRequest, get_withdrawal_dispatcher
 from typing import Dict, Optional
+from src.model.onchain.web3_custom import Web3Custom
+from src.model.onchain.balance_watcher import get_balance_watcher
+from src.model.onchain.provider_pool import get_provider_pool
 
 
 class CexWithdraw:
@@ -22,19 +25,10 @@ class CexWithdraw:
         self.private_key = private_key
         self.config = config
         
-        # Setup exchange based on config
-        exchange_name = config.EXCHANGES.name.lower()
-        if exchange_name not in SUPPORTED_EXCHANGES:
-            raise ValueError(f"Unsupported exchange: {exchange_name}")
-            
-        # Initialize exchange
-        self.exchange = getattr(ccxt, exchange_name)()
-            
-        # Setup exchange credentials
-        self.exchange.apiKey = config.EXCHANGES.apiKey
-        self.exchange.secret = config.EXCHANGES.secretKey
-        if config.EXCHANGES.passphrase:
-            self.exchange.password = config.EXCHANGES.passphrase
+        # Exchange session shared by all wallets (markets cache, rate limiter, funding balance)
+        self.client = get_exchange_client(config.EXCHANGES)
+        self.exchange = self.client.exchange
+        self.dispatcher = get_withdrawal_dispatcher(self.client)
         
         self.account = Account.from_key(private_key)
         self.address = self.account.address
@@ -58,22 +52,20 @@ class CexWithdraw:
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit"""
-        await self.exchange.close()
+        """Async context manager exit. The shared exchange session is closed at the end of the run"""
+        pass
 
     async def check_auth(self) -> None:
         """Test exchange authentication"""
         logger.info(f"[{self.account_index}] Testing exchange authentication...")
         try:
-            await self.exchange.fetch_balance()
+            await self.client.check_auth()
             logger.success(f"[{self.account_index}] Authentication successful")
         except ccxt.AuthenticationError as e:
             logger.error(f"[{self.account_index}] Authentication error: {str(e)}")
-            await self.exchange.close()
             raise
         except Exception as e:
             logger.error(f"[{self.account_index}] Unexpected error during authentication: {str(e)}")
-            await self.exchange.close()
             raise
             
     async def get_chains_info(self) -> Dict:
@@ -81,17 +73,15 @@ class CexWithdraw:
         logger.info(f"[{self.account_index}] Getting withdrawal networks data...")
         
         try:
-            await self.exchange.load_markets()
-            
             chains_info = {}
             withdrawal_config = self.config.EXCHANGES.withdrawals[0]
             currency = withdrawal_config.currency.upper()
             
-            if currency not in self.exchange.currencies:
+            networks = await self.client.get_currency_networks(currency)
+            if networks is None:
                 logger.error(f"[{self.account_index}] Currency {currency} not found on {self.config.EXCHANGES.name}")
                 return {}
-                
-            networks = self.exchange.currencies[currency]["networks"]
+
             # logger.info(f"[{self.account_index}] Available networks for {currency}:")
             
             for key, info in networks.items():
@@ -114,7 +104,6 @@ class CexWithdraw:
             return chains_info
         except Exception as e:
             logger.error(f"[{self.account_index}] Error getting chains info: {str(e)}")
-            await self.exchange.close()
             raise
         
     def _is_withdrawal_enabled(self, key: str, info: Dict) -> bool:
@@ -135,62 +124,81 @@ class CexWithdraw:
         return info["limits"]["withdraw"]["min"]
         
     async def check_balance(self, amount: float) -> bool:
-        """Check if exchange has enough balance for withdrawal"""
+        """
+        Check if exchange has enough balance for withdrawal and reserve it
+        from the funding balance tracked by the shared exchange client
+        """
         try:
-            # Get exchange-specific balance parameters
-            exchange_name = self.config.EXCHANGES.name.lower()
-            params = EXCHANGE_PARAMS[exchange_name]["balance"]
-            
-            balances = await self.exchange.fetch_balance(params=params)
             withdrawal_config = self.config.EXCHANGES.withdrawals[0]
             currency = withdrawal_config.currency.upper()
             
-            balance = float(balances[currency]["total"])
-            logger.info(f"[{self.account_index}] Exchange balance: {balance:.8f} {currency}")
-            
-            if balance < amount:
-                logger.error(f"[{self.account_index}] Insufficient balance for withdrawal {balance} {currency} < {amount} {currency}")
-                await self.exchange.close()
+            balance = await self.client.reserve(currency, amount)
+            if balance is None:
+                logger.error(f"[{self.account_index}] Insufficient balance for withdrawal {self.client.get_balance(currency)} {currency} < {amount} {currency}")
                 return False
-                
+
+            logger.info(f"[{self.account_index}] Exchange balance: {balance:.8f} {currency}")
             return True
             
         except Exception as e:
             logger.error(f"[{self.account_index}] Error checking balance: {str(e)}")
-            await self.exchange.close()
             raise
 
-    async def get_eth_balance(self) -> Decimal:
-        """Get ETH balance for the wallet address"""
-        if self.web3 is None:
-            raise ValueError(f"[{self.account_index}] Web3 instance not initialized. Network must be selected first.")
+    async def get_web3(self, network: str) -> Web3Custom:
+        """Get the pooled async provider of a withdrawal network."""
+        rpc_url = CEX_WITHDRAWAL_RPCS.get(network)
+        if not rpc_url:
+            raise ValueError(f"[{self.account_index}] No RPC URL found for network: {network}")
+
+        web3 = await get_provider_pool().get(
+            self.account_index,
+            [rpc_url],
+            False,
+            "",
+            self.config.OTHERS.SKIP_SSL_VERIFICATION,
+        )
+        if web3 is None:
+            raise ConnectionError(f"[{self.account_index}] Failed to connect to {network} RPC")
+        return web3
 
-        balance_wei = self.web3.eth.get_balance(self.address)
-        return Decimal(self.web3.from_wei(balance_wei, 'ether'))
+    async def get_eth_balance(self, network: Optional[str] = None) -> Decimal:
+        """Get ETH balance for the wallet address on a network (default: the selected one)"""
+        if network is None:
+            if self.web3 is None:
+                raise ValueError(f"[{self.account_index}] Web3 instance not initialized. Network must be selected first.")
+            web3 = self.web3
+        else:
+            web3 = await self.get_web3(network)
+
+        balance_wei = await web3.web3.eth.get_balance(self.address)
+        return Decimal(web3.web3.from_wei(balance_wei, 'ether'))
 
     async def wait_for_balance_update(self, initial_balance: Decimal, timeout: int = 600) -> bool:
         """
         Wait for the balance to increase from the initial balance.
+        Arrivals are detected by the shared balance watcher of the selected network.
         Returns True if balance increased, False if timeout reached.
         """
-        start_time = time.time()
         logger.info(f"[{self.account_index}] Waiting for funds to arrive. Initial balance: {initial_balance} ETH")
-        
-        while time.time() - start_time < timeout:
-            try:
-                current_balance = await self.get_eth_balance()
-                if current_balance > initial_balance:
-                    increase = current_balance - initial_balance
-                    logger.success(f"[{self.account_index}] Funds received! Balance increased by {increase} ETH")
-                    return True
-                
-                logger.info(f"[{self.account_index}] Current balance: {current_balance} ETH. Waiting...")
-                await asyncio.sleep(10)  # Check every 10 seconds
-                
-            except Exception as e:
-                logger.error(f"[{self.account_index}] Error checking balance: {str(e)}")
-                await asyncio.sleep(5)
-                
+
+        try:
+            web3 = self.web3 or await self.get_web3(self.network)
+        except Exception as e:
+            logger.error(f"[{self.account_index}] Error connecting to {self.network} RPC: {str(e)}")
+            return False
+
+        received = await get_balance_watcher(web3.chain_id).wait_for_increase(
+            web3.web3,
+            self.address,
+            initial_balance,
+            timeout,
+            lambda wei: Decimal(web3.web3.from_wei(wei, 'ether')),
+        )
+
+        if received:
+            logger.success(f"[{self.account_index}] Funds received! Balance increased from {initial_balance} ETH")
+            return True
+
         logger.warning(f"[{self.account_index}] Timeout reached after {timeout} seconds. Funds not received.")
         return False
 
@@ -237,14 +245,12 @@ class CexWithdraw:
             network, exchange_network, network_info = random.choice(available_networks)
             logger.info(f"[{self.account_index}] Selected network for withdrawal: {network} ({exchange_network})")
             
-            # Update web3 instance with the correct RPC URL for the selected network
+            # Use the pooled async provider of the selected network
             self.network = network
-            rpc_url = CEX_WITHDRAWAL_RPCS.get(self.network)
-            if not rpc_url:
+            if not CEX_WITHDRAWAL_RPCS.get(self.network):
                 logger.error(f"[{self.account_index}] No RPC URL found for network: {self.network}")
                 return False
-            self.web3 = Web3(Web3.HTTPProvider(rpc_url))
-            # logger.info(f"[{self.account_index}] Updated web3 provider to: {rpc_url}")
+            self.web3 = await self.get_web3(self.network)
             
             # Ensure withdrawal amount respects network minimum
             min_amount = max(withdrawal_config.min_amount, network_info["withdrawMin"])
@@ -252,99 +258,114 @@ class CexWithdraw:
             
             if min_amount > max_amount:
                 logger.error(f"[{self.account_index}] Network minimum ({network_info['withdrawMin']}) is higher than configured maximum ({max_amount})")
-                await self.exchange.close()
                 return False
                 
             amount = round(random.uniform(min_amount, max_amount), random.randint(5, 12))
+            # The funding account pays the amount plus the network fee
+            total_cost = amount + float(network_info["withdrawFee"] or 0)
             
-            # Check if we have enough balance for withdrawal
-            if not await self.check_balance(amount):
-                return False
-                
             # Check if destination wallet balance exceeds maximum on ANY network
             # This prevents withdrawals if the wallet already has sufficient funds on any chain
             if not await self.check_all_networks_balance(withdrawal_config.max_balance):
                 logger.warning(f"[{self.account_index}] Skipping withdrawal as destination wallet balance exceeds maximum on at least one network")
-                await self.exchange.close()
                 return False
+
+            # Check if we have enough balance for withdrawal (reserves it in the shared client)
+            if not await self.check_balance(total_cost):
+                return False
+            reserved = True
              
             max_retries = withdrawal_config.retries
             
-            for attempt in range(max_retries):
-                try:
-                    # Get initial balance before withdrawal
-                    initial_balance = await self.get_eth_balance()
-                    logger.info(f"[{self.account_index}] Attempting withdrawal {attempt + 1}/{max_retries}")
-                    logger.info(f"[{self.account_index}] Withdrawing {amount} {currency} to {self.address}")
-                    
-                    # Get exchange-specific withdrawal parameters
-                    params = {
-                        'network': exchange_network,
-                        'fee': network_info["withdrawFee"],
-                        **EXCHANGE_PARAMS[exchange_name]["withdraw"]
-                    }
-                    
-                    withdrawal = await self.exchange.withdraw(
-                        currency,
-                        amount,
-                        self.address,
-                        params=params
-                    )
-                    
-                    logger.success(f"[{self.account_index}] Withdrawal initiated successfully")
-                    
-                    # Wait for funds to arrive if configured
-                    if withdrawal_config.wait_for_funds:
-                        funds_received = await self.wait_for_balance_update(
-                            initial_balance,
-                            timeout=withdrawal_config.max_wait_time
+            try:
+                for attempt in range(max_retries):
+                    try:
+                        # Every new withdrawal after one that didn't arrive needs its own reservation
+                        if not reserved:
+                            if not await self.check_balance(total_cost):
+                                return False
+                            reserved = True
+
+                        # Get initial balance before withdrawal
+                        initial_balance = await self.get_eth_balance()
+                        logger.info(f"[{self.account_index}] Attempting withdrawal {attempt + 1}/{max_retries}")
+                        logger.info(f"[{self.account_index}] Withdrawing {amount} {currency} to {self.address}")
+                        
+                        # Get exchange-specific withdrawal parameters
+                        params = {
+                            'network': exchange_network,
+                            'fee': network_info["withdrawFee"],
+                            **EXCHANGE_PARAMS[exchange_name]["withdraw"]
+                        }
+                        
+                        # The withdrawal is made by the shared dispatcher, arrival is
+                        # tracked in the background as soon as it is made
+                        request = WithdrawalRequest(
+                            account_index=self.account_index,
+                            currency=currency,
+                            amount=amount,
+                            address=self.address,
+                            params=params,
+                            wait_for_arrival=(
+                                partial(
+                                    self.wait_for_balance_update,
+                                    initial_balance,
+                                    timeout=withdrawal_config.max_wait_time
+                                )
+                                if withdrawal_config.wait_for_funds
+                                else None
+                            ),
                         )
-                        if funds_received:
-                            await self.exchange.close()
-                            return True
+                        withdrawal = await self.dispatcher.submit(request)
+                        self.client.commit(currency.upper(), total_cost)
+                        reserved = False
                         
-                        logger.warning(f"[{self.account_index}] Funds not received yet, will retry withdrawal")
-                    else:
-                        await self.exchange.close()
-                        return True  # If not waiting for funds, consider it successful
-                    
-                except ccxt.NetworkError as e:
-                    if attempt == max_retries - 1:
-                        logger.error(f"[{self.account_index}] Network error on final attempt: {str(e)}")
-                        await self.exchange.close()
-                        raise
-                    logger.warning(f"[{self.account_index}] Network error, retrying: {str(e)}")
-                    await asyncio.sleep(5)
-                    
-                except ccxt.ExchangeError as e:
-                    error_msg = str(e).lower()
-                    if "insufficient balance" in error_msg:
-                        logger.error(f"[{self.account_index}] Insufficient balance in exchange account")
-                        await self.exchange.close()
-                        return False
-                    if "whitelist" in error_msg or "not in withdraw whitelist" in error_msg:
-                        logger.error(f"[{self.account_index}] Address not in whitelist: {str(e)}")
-                        await self.exchange.close()
-                        return False
-                    if attempt == max_retries - 1:
-                        logger.error(f"[{self.account_index}] Exchange error on final attempt: {str(e)}")
-                        await self.exchange.close()
+                        logger.success(f"[{self.account_index}] Withdrawal initiated successfully")
+                        
+                        # Wait for funds to arrive if configured
+                        if withdrawal_config.wait_for_funds:
+                            funds_received = await request.arrived
+                            if funds_received:
+                                return True
+                            
+                            logger.warning(f"[{self.account_index}] Funds not received yet, will retry withdrawal")
+                        else:
+                            return True  # If not waiting for funds, consider it successful
+                        
+                    except ccxt.NetworkError as e:
+                        if attempt == max_retries - 1:
+                            logger.error(f"[{self.account_index}] Network error on final attempt: {str(e)}")
+                            raise
+                        logger.warning(f"[{self.account_index}] Network error, retrying: {str(e)}")
+                        await asyncio.sleep(5)
+                        
+                    except ccxt.ExchangeError as e:
+                        error_msg = str(e).lower()
+                        if "insufficient balance" in error_msg:
+                            logger.error(f"[{self.account_index}] Insufficient balance in exchange account")
+                            return False
+                        if "whitelist" in error_msg or "not in withdraw whitelist" in error_msg:
+                            logger.error(f"[{self.account_index}] Address not in whitelist: {str(e)}")
+                            return False
+                        if attempt == max_retries - 1:
+                            logger.error(f"[{self.account_index}] Exchange error on final attempt: {str(e)}")
+                            raise
+                        logger.warning(f"[{self.account_index}] Exchange error, retrying: {str(e)}")
+                        await asyncio.sleep(5)
+                        
+                    except Exception as e:
+                        logger.error(f"[{self.account_index}] Unexpected error during withdrawal: {str(e)}")
                         raise
-                    logger.warning(f"[{self.account_index}] Exchange error, retrying: {str(e)}")
-                    await asyncio.sleep(5)
-                    
-                except Exception as e:
-                    logger.error(f"[{self.account_index}] Unexpected error during withdrawal: {str(e)}")
-                    await self.exchange.close()
-                    raise
+            finally:
+                # Return the reservation of a withdrawal that was never made
+                if reserved:
+                    self.client.release(currency.upper(), total_cost)
                     
             logger.error(f"[{self.account_index}] Withdrawal failed after {max_retries} attempts")
-            await self.exchange.close()
             return False
             
         except Exception as e:
             logger.error(f"[{self.account_index}] Fatal error during withdrawal process: {str(e)}")
-            await self.exchange.close()
             raise 
 
     async def check_all_networks_balance(self, max_balance: float) -> bool:
@@ -356,34 +377,27 @@ class CexWithdraw:
         if not withdrawal_config.networks:
             raise ValueError("No networks specified in withdrawal configuration")
             
-        # Store the current network and web3 instance to restore later
-        original_network = self.network
-        original_web3 = self.web3
-        
-        try:
-            # Check balance on each network
-            for network in withdrawal_config.networks:
-                rpc_url = CEX_WITHDRAWAL_RPCS.get(network)
-                if not rpc_url:
-                    logger.warning(f"[{self.account_index}] No RPC URL found for network: {network}, skipping balance check")
-                    continue
-                    
-                # Set up web3 for this network
-                self.network = network
-                self.web3 = Web3(Web3.HTTPProvider(rpc_url))
-                
-                try:
-                    current_balance = await self.get_eth_balance()
-                    if current_balance >= Decimal(str(max_balance)):
-                        logger.warning(f"[{self.account_index}] Destination wallet balance on {network} ({current_balance}) exceeds maximum allowed ({max_balance})")
-                        return False
-                    logger.info(f"[{self.account_index}] Balance on {network}: {current_balance} ETH (below max: {max_balance})")
-                except Exception as e:
-                    logger.warning(f"[{self.account_index}] Error checking balance on {network}: {str(e)}")
-                    
-            return True
-            
-        finally:
-            # Restore original network and web3 instance
-            self.network = original_network
-            self.web3 = original_web3 
\ No newline at end of file
+        async def get_network_balance(network: str) -> Optional[Decimal]:
+            if not CEX_WITHDRAWAL_RPCS.get(network):
+                logger.warning(f"[{self.account_index}] No RPC URL found for network: {network}, skipping balance check")
+                return None
+            try:
+                return await self.get_eth_balance(network)
+            except Exception as e:
+                logger.warning(f"[{self.account_index}] Error checking balance on {network}: {str(e)}")
+                return None
+
+        # Check balance on all networks concurrently
+        balances = await asyncio.gather(
+            *[get_network_balance(network) for network in withdrawal_config.networks]
+        )
+
+        for network, current_balance in zip(withdrawal_config.networks, balances):
+            if current_balance is None:
+                continue
+            if current_balance >= Decimal(str(max_balance)):
+                logger.warning(f"[{self.account_index}] Destination wallet balance on {network} ({current_balance}) exceeds maximum allowed ({max_balance})")
+                return False
+            logger.info(f"[{self.account_index}] Balance on {network}: {current_balance} ETH (below max: {max_balance})")
+
+        return True
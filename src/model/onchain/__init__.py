@@ -1,5 +1,34 @@
 from .web3_custom import Web3Custom
 from .constants import Balance
+from .nonce_manager import NonceManager, get_nonce_manager
+from .receipt_watcher import ReceiptWatcher, get_receipt_watcher
+from .balance_watcher import BalanceWatcher, get_balance_watcher
+from .contract_cache import CachedContract, get_contract
+from .provider_pool import ProviderPool, get_provider_pool
+from .gas_cache import GasLimitCache, get_gas_limit_cache
+from .rpc_cache import RpcCache, get_rpc_cache
+from .hedging import HedgePolicy, get_hedge_policy
+from .ws_subscriber import ChainSubscriber, get_chain_subscriber
 
-__all__ = ["Web3Custom", "Balance"]
-
+__all__ = [
+    "Web3Custom",
+    "Balance",
+    "NonceManager",
+    "get_nonce_manager",
+    "ReceiptWatcher",
+    "get_receipt_watcher",
+    "BalanceWatcher",
+    "get_balance_watcher",
+    "CachedContract",
+    "get_contract",
+    "ProviderPool",
+    "get_provider_pool",
+    "GasLimitCache",
+    "get_gas_limit_cache",
+    "RpcCache",
+    "get_rpc_cache",
+    "HedgePolicy",
+    "get_hedge_policy",
+    "ChainSubscriber",
+    "get_chain_subscriber",
+]
@@ -0,0 +1,215 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from loguru import logger
+from hexbytes import HexBytes
+from web3 import AsyncWeb3
+from src.model.onchain.ws_subscriber import get_chain_subscriber
+
+
+# With log sources configured, every Nth new block still gets a full balance sweep
+# to catch plain native transfers that don't emit a watched event
+FULL_SWEEP_EVERY = 5
+
+
+@dataclass
+class BalanceWaiter:
+    address: str
+    initial_balance: Any
+    convert: Callable[[int], Any]
+    web3: AsyncWeb3 = field(repr=False)
+    future: asyncio.Future = field(repr=False)
+
+
+class BalanceWatcher:
+    """
+    Detects native balance increases for many addresses on one chain.
+
+    Waiters register an address with its balance before the transfer. On every new
+    block the watcher does one batched balance sweep of the watched addresses (or
+    only of the recipients of watched events, like Crusty Swap `Distribution`) and
+    wakes up waiters as soon as their funds land.
+    """
+
+    def __init__(self, chain_id: int, poll_interval: float = 5.0):
+        self.chain_id = chain_id
+        self.poll_interval = poll_interval
+
+        self._waiters: List[BalanceWaiter] = []
+        self._log_sources: Set[Tuple[str, str]] = set()
+        self._unchecked: Set[str] = set()
+        self._last_block: Optional[int] = None
+        self._blocks_seen = 0
+        self._task: Optional[asyncio.Task] = None
+
+        self.sweeps = 0
+        self.rpc_calls = 0
+        self.arrivals = 0
+
+    @property
+    def waiters_count(self) -> int:
+        """Number of outstanding waiters."""
+        return len(self._waiters)
+
+    def add_log_source(self, contract_address: str, topic: str) -> None:
+        """
+        Watch an event whose first indexed argument is the recipient.
+        Only recipients of such events get a balance check on most blocks.
+        """
+        self._log_sources.add((AsyncWeb3.to_checksum_address(contract_address), topic))
+
+    async def wait_for_increase(
+        self,
+        web3: AsyncWeb3,
+        address: str,
+        initial_balance: Any,
+        timeout: float,
+        convert: Optional[Callable[[int], Any]] = None,
+    ) -> bool:
+        """
+        Wait until the native balance of address is above initial_balance.
+
+        Args:
+            web3: Web3 instance of the caller, used to poll while it waits
+            address: Address to watch
+            initial_balance: Balance before the transfer, in the units of convert
+            timeout: Maximum time to wait in seconds
+            convert: Converts a balance in wei to the units of initial_balance (default: wei)
+
+        Returns:
+            True if the balance increased, False on timeout
+        """
+        waiter = BalanceWaiter(
+            address=AsyncWeb3.to_checksum_address(address),
+            initial_balance=initial_balance,
+            convert=convert or (lambda wei: wei),
+            web3=web3,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        self._waiters.append(waiter)
+        self._unchecked.add(waiter.address)
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(waiter.future), timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+    async def _run(self) -> None:
+        while self._waiters:
+            try:
+                await self._tick()
+            except Exception as e:
+                logger.warning(
+                    f"Balance watcher for chain {self.chain_id} error: {str(e)}"
+                )
+            await self._wait_next_block()
+        self._last_block = None
+
+    async def _wait_next_block(self) -> None:
+        """Wake up on the next block pushed over WebSocket, or poll over HTTP without one."""
+        subscriber = get_chain_subscriber(self.chain_id)
+        if subscriber is None or not await subscriber.wait_for_block(
+            self.poll_interval * 5
+        ):
+            await asyncio.sleep(self.poll_interval)
+
+    async def _tick(self) -> None:
+        # Poll with the web3 of the latest waiter, web3 of finished waiters may be closed
+        web3 = self._waiters[-1].web3
+
+        subscriber = get_chain_subscriber(self.chain_id)
+        if subscriber is not None:
+            block_number = subscriber.latest_block
+        else:
+            self.rpc_calls += 1
+            block_number = await web3.eth.block_number
+        if self._last_block is not None and block_number <= self._last_block:
+            return
+
+        first_sweep = self._last_block is None
+        from_block = block_number if first_sweep else self._last_block + 1
+        self._last_block = block_number
+        self._blocks_seen += 1
+
+        addresses = {waiter.address for waiter in self._waiters}
+        if self._log_sources and not first_sweep and self._blocks_seen % FULL_SWEEP_EVERY:
+            recipients = await self._get_event_recipients(web3, from_block, block_number)
+            # New waiters are always checked once, their funds may have landed earlier
+            addresses &= recipients | self._unchecked
+        self._unchecked.clear()
+
+        if addresses:
+            await self._sweep(web3, list(addresses))
+
+    async def _get_event_recipients(
+        self, web3: AsyncWeb3, from_block: int, to_block: int
+    ) -> Set[str]:
+        recipients = set()
+        subscriber = get_chain_subscriber(self.chain_id)
+        for contract_address, topic in self._log_sources:
+            logs = None
+            if subscriber is not None:
+                # Logs pushed over WebSocket, None if they don't cover the whole range
+                await subscriber.subscribe_logs(contract_address, topic)
+                logs = subscriber.drain_logs(contract_address, topic, from_block)
+            if logs is None:
+                self.rpc_calls += 1
+                logs = await web3.eth.get_logs(
+                    {
+                        "fromBlock": from_block,
+                        "toBlock": to_block,
+                        "address": contract_address,
+                        "topics": [topic],
+                    }
+                )
+            for log in logs:
+                if len(log["topics"]) > 1:
+                    recipient = AsyncWeb3.to_hex(HexBytes(log["topics"][1])[-20:])
+                    recipients.add(AsyncWeb3.to_checksum_address(recipient))
+        return recipients
+
+    async def _sweep(self, web3: AsyncWeb3, addresses: List[str]) -> None:
+        """One batched balance read of the given addresses."""
+        self.sweeps += 1
+        self.rpc_calls += len(addresses)
+        balances = await asyncio.gather(
+            *[web3.eth.get_balance(address) for address in addresses],
+            return_exceptions=True,
+        )
+        balances = {
+            address: balance
+            for address, balance in zip(addresses, balances)
+            if not isinstance(balance, BaseException)
+        }
+
+        for waiter in list(self._waiters):
+            balance_wei = balances.get(waiter.address)
+            if balance_wei is None or waiter.future.done():
+                continue
+            if waiter.convert(balance_wei) > waiter.initial_balance:
+                self.arrivals += 1
+                waiter.future.set_result(True)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "waiters": self.waiters_count,
+            "arrivals": self.arrivals,
+            "sweeps": self.sweeps,
+            "rpc_calls": self.rpc_calls,
+        }
+
+
+_balance_watchers: Dict[int, BalanceWatcher] = {}
+
+
+def get_balance_watcher(chain_id: int) -> BalanceWatcher:
+    """Get the process-wide balance watcher for a chain."""
+    if chain_id not in _balance_watchers:
+        _balance_watchers[chain_id] = BalanceWatcher(chain_id)
+    return _balance_watchers[chain_id]
@@ -0,0 +1,139 @@
+import hashlib
+import json
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+from eth_abi import decode, encode
+from eth_utils import (
+    function_abi_to_4byte_selector,
+    get_abi_input_types,
+    get_abi_output_types,
+)
+from web3 import AsyncWeb3
+from web3.contract import AsyncContract
+
+
+# Memo of ABI object id -> (ABI object, hash). The ABI object is kept alive so its id can't be reused
+_abi_hashes: Dict[int, Tuple[list, str]] = {}
+MAX_ABI_HASHES = 256
+
+
+def abi_hash(abi: list) -> str:
+    """Stable hash of an ABI, computed once per ABI object."""
+    cached = _abi_hashes.get(id(abi))
+    if cached is not None and cached[0] is abi:
+        return cached[1]
+
+    digest = hashlib.sha1(
+        json.dumps(abi, sort_keys=True, separators=(",", ":")).encode()
+    ).hexdigest()
+    if len(_abi_hashes) >= MAX_ABI_HASHES:
+        _abi_hashes.clear()
+    _abi_hashes[id(abi)] = (abi, digest)
+    return digest
+
+
+def _align_argument(abi_input: dict, value: Any) -> Any:
+    """Turn dict arguments of tuple (struct) inputs into tuples in ABI order."""
+    abi_type = abi_input["type"]
+    if not abi_type.startswith("tuple"):
+        return value
+    if abi_type != "tuple":
+        # Array of tuples
+        item_input = {**abi_input, "type": abi_type[: abi_type.rindex("[")]}
+        return [_align_argument(item_input, item) for item in value]
+    components = abi_input["components"]
+    if isinstance(value, dict):
+        value = [value[component["name"]] for component in components]
+    return tuple(
+        _align_argument(component, item) for component, item in zip(components, value)
+    )
+
+
+class CachedFunction:
+    """Precomputed selector and argument types of one contract function."""
+
+    def __init__(self, fn_abi: dict):
+        self.name = fn_abi["name"]
+        self.inputs = fn_abi.get("inputs", [])
+        self.selector = function_abi_to_4byte_selector(fn_abi)
+        self.input_types = get_abi_input_types(fn_abi)
+        self.output_types = get_abi_output_types(fn_abi)
+
+    def encode(self, *args) -> str:
+        """Calldata: the precomputed selector followed by ABI-encoded arguments."""
+        args = [_align_argument(abi_input, arg) for abi_input, arg in zip(self.inputs, args)]
+        return AsyncWeb3.to_hex(self.selector + encode(self.input_types, args))
+
+    def decode_output(self, data: bytes) -> Any:
+        result = decode(self.output_types, data)
+        return result[0] if len(result) == 1 else result
+
+
+class CachedContract:
+    """
+    Parsed contract ABI, shared by every account of the process.
+
+    Function selectors and argument types are built once, calldata is produced by
+    encoding only the arguments. Web3 contract objects are built at most once per
+    web3 instance for code that still needs them.
+    """
+
+    def __init__(self, address: Optional[str], abi: list):
+        self.address = AsyncWeb3.to_checksum_address(address) if address else None
+        self.abi = abi
+
+        self._functions: Dict[str, List[CachedFunction]] = {}
+        for item in abi:
+            if item.get("type") == "function":
+                self._functions.setdefault(item["name"], []).append(
+                    CachedFunction(item)
+                )
+        self._contracts = weakref.WeakKeyDictionary()
+
+    def function(self, name: str, args_count: Optional[int] = None) -> CachedFunction:
+        functions = self._functions[name]
+        if args_count is not None:
+            for function in functions:
+                if len(function.input_types) == args_count:
+                    return function
+        return functions[0]
+
+    def encode(self, fn_name: str, *args) -> str:
+        """Encode calldata for a function call."""
+        return self.function(fn_name, len(args)).encode(*args)
+
+    async def call(
+        self, web3: AsyncWeb3, fn_name: str, *args, block_identifier="latest"
+    ) -> Any:
+        """eth_call a view function and decode its result."""
+        function = self.function(fn_name, len(args))
+        data = await web3.eth.call(
+            {"to": self.address, "data": function.encode(*args)}, block_identifier
+        )
+        return function.decode_output(data)
+
+    def contract(self, web3: AsyncWeb3) -> AsyncContract:
+        """Web3 contract object bound to the given web3 instance."""
+        contract = self._contracts.get(web3)
+        if contract is None:
+            if self.address:
+                contract = web3.eth.contract(address=self.address, abi=self.abi)
+            else:
+                contract = web3.eth.contract(abi=self.abi)
+            self._contracts[web3] = contract
+        return contract
+
+
+_contracts: Dict[Tuple[Optional[int], Optional[str], str], CachedContract] = {}
+
+
+def get_contract(
+    chain_id: Optional[int], address: Optional[str], abi: list
+) -> CachedContract:
+    """Get the process-wide cached contract for (chain, address, ABI hash)."""
+    key = (chain_id, address.lower() if address else None, abi_hash(abi))
+    contract = _contracts.get(key)
+    if contract is None:
+        contract = CachedContract(address, abi)
+        _contracts[key] = contract
+    return contract
@@ -0,0 +1,96 @@
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple, Union
+from loguru import logger
+
+
+# Gas limit = highest observed gasUsed (or live estimate) times this margin
+GAS_SAFETY_MARGIN = 1.2
+# Estimates are skipped once a call has this many successful receipts
+MIN_GAS_SAMPLES = 3
+# Only the most recent receipts of a call are kept
+MAX_GAS_SAMPLES = 20
+# Node errors that a too low gas limit or a changed call can cause
+GAS_ERRORS = (
+    "out of gas",
+    "intrinsic gas too low",
+    "gas required exceeds",
+    "execution reverted",
+)
+
+
+def _selector(data: Union[str, bytes, None]) -> str:
+    if not data:
+        return "0x"
+    if isinstance(data, (bytes, bytearray)):
+        return "0x" + bytes(data[:4]).hex()
+    return data[:10].lower()
+
+
+def is_gas_error(error: Exception) -> bool:
+    """Check if the node rejected a transaction because of its gas limit or a revert."""
+    message = str(error).lower()
+    return any(fragment in message for fragment in GAS_ERRORS)
+
+
+class GasLimitCache:
+    """
+    Learns gas limits of repeated calls from the gasUsed of their receipts.
+
+    Calls are keyed by (chain, to, function selector): the same NFT mint or
+    Crusty Swap deposit costs the same gas for every account, so after a few
+    receipts the estimate_gas round trip is skipped.
+    """
+
+    def __init__(self):
+        self._samples: Dict[Tuple[int, str, str], Deque[int]] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(chain_id: int, to: Optional[str], data) -> Tuple[int, str, str]:
+        return (chain_id, (to or "").lower(), _selector(data))
+
+    def learned(self, chain_id: int, to: Optional[str], data) -> Optional[int]:
+        """Learned gas limit for a call, or None if there are not enough samples yet."""
+        samples = self._samples.get(self._key(chain_id, to, data))
+        if not samples or len(samples) < MIN_GAS_SAMPLES:
+            return None
+        return int(max(samples) * GAS_SAFETY_MARGIN)
+
+    def get(self, chain_id: int, to: Optional[str], data) -> Optional[int]:
+        """Same as learned, counted in the hit rate."""
+        gas_limit = self.learned(chain_id, to, data)
+        if gas_limit is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return gas_limit
+
+    def record(self, chain_id: int, to: Optional[str], data, gas_used: int) -> None:
+        """Remember the gasUsed of a successful transaction."""
+        key = self._key(chain_id, to, data)
+        if key not in self._samples:
+            self._samples[key] = deque(maxlen=MAX_GAS_SAMPLES)
+        self._samples[key].append(gas_used)
+
+    def invalidate(self, chain_id: int, to: Optional[str], data) -> None:
+        """Forget a call whose learned gas limit turned out to be too low."""
+        if self._samples.pop(self._key(chain_id, to, data), None) is not None:
+            logger.warning(
+                f"Learned gas limit for {to} ({_selector(data)}) on chain {chain_id} dropped, using live estimates"
+            )
+
+    def stats(self) -> Dict[str, int]:
+        return {"calls": len(self._samples), "hits": self.hits, "misses": self.misses}
+
+
+_gas_limit_cache: Optional[GasLimitCache] = None
+
+
+def get_gas_limit_cache() -> GasLimitCache:
+    """Get the process-wide gas limit cache."""
+    global _gas_limit_cache
+    if _gas_limit_cache is None:
+        _gas_limit_cache = GasLimitCache()
+    return _gas_limit_cache
@@ -0,0 +1,160 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+from loguru import logger
+
+
+# A duplicate is sent once a call is slower than this percentile of its endpoint
+HEDGE_PERCENTILE = 0.95
+# Until an endpoint has enough samples, this delay (seconds) is used instead
+DEFAULT_HEDGE_DELAY = 2.0
+MIN_LATENCY_SAMPLES = 20
+MAX_LATENCY_SAMPLES = 200
+# Hedged duplicates may add at most this share of extra requests (plus a small burst)
+HEDGE_BUDGET = 0.1
+HEDGE_BUDGET_BURST = 5
+# An endpoint with this many failures in a row is skipped for UNHEALTHY_COOLDOWN seconds
+MAX_CONSECUTIVE_FAILURES = 3
+UNHEALTHY_COOLDOWN = 30
+
+
+class EndpointStats:
+    def __init__(self):
+        self.latencies: Deque[float] = deque(maxlen=MAX_LATENCY_SAMPLES)
+        self.consecutive_failures = 0
+        self.unhealthy_until = 0.0
+
+    def percentile(self, q: float) -> Optional[float]:
+        if len(self.latencies) < MIN_LATENCY_SAMPLES:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class HedgePolicy:
+    """
+    Hedged requests for idempotent reads.
+
+    A read goes to the primary endpoint first. If it hasn't answered within the
+    learned latency percentile of that endpoint, the same read goes to a second
+    healthy endpoint and whichever answers first wins. The share of duplicated
+    requests is capped by HEDGE_BUDGET.
+    """
+
+    def __init__(self):
+        self._endpoints: Dict[str, EndpointStats] = {}
+
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def _stats(self, endpoint: str) -> EndpointStats:
+        if endpoint not in self._endpoints:
+            self._endpoints[endpoint] = EndpointStats()
+        return self._endpoints[endpoint]
+
+    def hedge_delay(self, endpoint: str) -> float:
+        """How long to wait for the endpoint before sending a duplicate."""
+        delay = self._stats(endpoint).percentile(HEDGE_PERCENTILE)
+        return DEFAULT_HEDGE_DELAY if delay is None else delay
+
+    def is_healthy(self, endpoint: str) -> bool:
+        return self._stats(endpoint).unhealthy_until <= time.monotonic()
+
+    def _budget_allows(self) -> bool:
+        return self.hedges < self.requests * HEDGE_BUDGET + HEDGE_BUDGET_BURST
+
+    def _record(self, endpoint: str, latency: Optional[float]) -> None:
+        stats = self._stats(endpoint)
+        if latency is not None:
+            stats.latencies.append(latency)
+            stats.consecutive_failures = 0
+            return
+        stats.consecutive_failures += 1
+        if stats.consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
+            stats.unhealthy_until = time.monotonic() + UNHEALTHY_COOLDOWN
+            stats.consecutive_failures = 0
+            logger.warning(
+                f"RPC {endpoint} failed {MAX_CONSECUTIVE_FAILURES} times in a row, not hedging to it for {UNHEALTHY_COOLDOWN}s"
+            )
+
+    async def _timed(self, endpoint: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        start = time.monotonic()
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            # Lost to the other request: it would have taken at least this long.
+            # Without these censored samples the percentile only sees winners and drifts down
+            self._stats(endpoint).latencies.append(time.monotonic() - start)
+            raise
+        except Exception:
+            self._record(endpoint, None)
+            raise
+        self._record(endpoint, time.monotonic() - start)
+        return result
+
+    async def run(
+        self,
+        primary: Tuple[str, Callable[[], Awaitable[Any]]],
+        backups: List[Tuple[str, Callable[[], Awaitable[Any]]]],
+    ) -> Any:
+        """
+        Run a read on the primary endpoint, hedging to a backup if it is slow.
+
+        Args:
+            primary: (endpoint, call) pair of the primary endpoint
+            backups: (endpoint, call) pairs of other endpoints serving the same data
+        """
+        self.requests += 1
+        endpoint, call = primary
+        primary_task = asyncio.create_task(self._timed(endpoint, call))
+        tasks = {primary_task}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.hedge_delay(endpoint))
+            if done:
+                return primary_task.result()
+
+            backup = next(
+                (backup for backup in backups if self.is_healthy(backup[0])), None
+            )
+            if backup is None or not self._budget_allows():
+                return await primary_task
+
+            self.hedges += 1
+            backup_task = asyncio.create_task(self._timed(*backup))
+            tasks.add(backup_task)
+
+            while tasks:
+                done, tasks = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is backup_task:
+                            self.hedge_wins += 1
+                        return task.result()
+            # Both failed, surface the error of the primary endpoint
+            return primary_task.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+        }
+
+
+_hedge_policy: Optional[HedgePolicy] = None
+
+
+def get_hedge_policy() -> HedgePolicy:
+    """Get the process-wide hedging policy."""
+    global _hedge_policy
+    if _hedge_policy is None:
+        _hedge_policy = HedgePolicy()
+    return _hedge_policy
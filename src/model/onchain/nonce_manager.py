@@ -0,0 +1,99 @@
+import asyncio
+from typing import Dict, Optional, Tuple
+from loguru import logger
+from web3 import AsyncWeb3
+
+
+# Node error fragments that mean our local nonce view is out of sync with the chain
+NONCE_TOO_LOW_ERRORS = (
+    "nonce too low",
+    "nonce is too low",
+    "invalid nonce",
+    "nonce has already been used",
+)
+REPLACEMENT_ERRORS = (
+    "replacement transaction underpriced",
+    "replacement fee too low",
+)
+ALREADY_KNOWN_ERRORS = (
+    "already known",
+    "known transaction",
+    "already imported",
+)
+
+
+def _error_matches(error: Exception, fragments: Tuple[str, ...]) -> bool:
+    message = str(error).lower()
+    return any(fragment in message for fragment in fragments)
+
+
+def is_nonce_error(error: Exception) -> bool:
+    """Check if the node rejected a transaction because of its nonce."""
+    return _error_matches(error, NONCE_TOO_LOW_ERRORS + REPLACEMENT_ERRORS)
+
+
+def is_already_known_error(error: Exception) -> bool:
+    """Check if the node already has this exact transaction in its mempool."""
+    return _error_matches(error, ALREADY_KNOWN_ERRORS)
+
+
+class NonceManager:
+    """
+    Hands out nonces locally for one (chain, address) pair.
+
+    The first nonce is taken from the `pending` transaction count, every next one
+    is incremented locally, so one sender can have many transactions in flight
+    without a get_transaction_count round trip per transaction.
+    """
+
+    def __init__(self, chain_id: int, address: str):
+        self.chain_id = chain_id
+        self.address = address
+        self._next_nonce: Optional[int] = None
+        self._lock = asyncio.Lock()
+
+    async def _fetch_pending_nonce(self, web3: AsyncWeb3) -> int:
+        return await web3.eth.get_transaction_count(self.address, "pending")
+
+    async def get_nonce(self, web3: AsyncWeb3) -> int:
+        """Reserve the next nonce for this address."""
+        async with self._lock:
+            if self._next_nonce is None:
+                self._next_nonce = await self._fetch_pending_nonce(web3)
+            nonce = self._next_nonce
+            self._next_nonce += 1
+            return nonce
+
+    async def reconcile(self, web3: AsyncWeb3) -> int:
+        """Resync the local counter with the `pending` count of the node."""
+        async with self._lock:
+            pending_nonce = await self._fetch_pending_nonce(web3)
+            if self._next_nonce is not None and pending_nonce != self._next_nonce:
+                logger.warning(
+                    f"Nonce for {self.address} on chain {self.chain_id} resynced: local {self._next_nonce}, pending {pending_nonce}"
+                )
+            self._next_nonce = pending_nonce
+            return pending_nonce
+
+    def release(self, nonce: int) -> None:
+        """
+        Give back a nonce that was reserved but never broadcast.
+        Only the last reserved nonce can be released, otherwise a gap would appear.
+        """
+        if self._next_nonce is not None and nonce == self._next_nonce - 1:
+            self._next_nonce = nonce
+
+    def reset(self) -> None:
+        """Forget the local counter, the next get_nonce will read it from the node."""
+        self._next_nonce = None
+
+
+_nonce_managers: Dict[Tuple[int, str], NonceManager] = {}
+
+
+def get_nonce_manager(chain_id: int, address: str) -> NonceManager:
+    """Get the process-wide nonce manager for a (chain, address) pair."""
+    key = (chain_id, address.lower())
+    if key not in _nonce_managers:
+        _nonce_managers[key] = NonceManager(chain_id, address)
+    return _nonce_managers[key]
@@ -0,0 +1,97 @@
+import asyncio
+from typing import Dict, Optional, Tuple
+from loguru import logger
+from src.model.onchain.web3_custom import Web3Custom
+
+
+class ProviderPool:
+    """
+    Keeps connected Web3Custom providers for reuse.
+
+    Providers are keyed by (RPC URLs, proxy, SSL flag), so every call with the same
+    connection settings reuses one provider and its HTTP session instead of building
+    a new one and paying the connection probe of connect_web3 again.
+    """
+
+    def __init__(self):
+        self._providers: Dict[Tuple, Web3Custom] = {}
+        self._locks: Dict[Tuple, asyncio.Lock] = {}
+
+        self.created = 0
+        self.reused = 0
+
+    async def get(
+        self,
+        account_index: int,
+        rpc_urls: list[str],
+        use_proxy: bool,
+        proxy: str,
+        ssl: bool = False,
+    ) -> Optional[Web3Custom]:
+        """
+        Get a connected provider, creating it on first use.
+
+        Args:
+            account_index: Account index used for logs of a new provider
+            rpc_urls: RPC URLs to connect to
+            use_proxy: Whether to use the proxy for RPC requests
+            proxy: Proxy in user:pass@ip:port format
+            ssl: SSL verification flag passed to Web3Custom
+
+        Returns:
+            Web3Custom instance or None if it failed to connect
+        """
+        key = (tuple(rpc_urls), proxy if use_proxy and proxy else "", ssl)
+
+        provider = self._providers.get(key)
+        if provider is not None:
+            self.reused += 1
+            return provider
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            provider = self._providers.get(key)
+            if provider is not None:
+                self.reused += 1
+                return provider
+
+            try:
+                provider = await Web3Custom.create(
+                    account_index, list(rpc_urls), use_proxy, proxy, ssl
+                )
+            except Exception as e:
+                # Not pooled, the next call tries to connect again
+                logger.error(f"{account_index} | {str(e)}: {', '.join(rpc_urls)}")
+                return None
+            self._providers[key] = provider
+            self.created += 1
+            return provider
+
+    async def close_all(self) -> None:
+        """Disconnect every pooled provider."""
+        providers = list(self._providers.values())
+        self._providers.clear()
+        for provider in providers:
+            await provider.cleanup()
+        if providers:
+            logger.info(
+                f"Provider pool closed {len(providers)} providers (created: {self.created}, reused: {self.reused})"
+            )
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "providers": len(self._providers),
+            "created": self.created,
+            "reused": self.reused,
+        }
+
+
+_provider_pool: Optional[ProviderPool] = None
+
+
+def get_provider_pool() -> ProviderPool:
+    """Get the process-wide provider pool."""
+    global _provider_pool
+    if _provider_pool is None:
+        _provider_pool = ProviderPool()
+    return _provider_pool
@@ -0,0 +1,212 @@
+import asyncio
+import time
+from typing import Dict, Optional, Set
+from hexbytes import HexBytes
+from loguru import logger
+from web3 import AsyncWeb3
+from web3.exceptions import TimeExhausted
+from web3.types import TxReceipt
+from src.model.onchain.ws_subscriber import get_chain_subscriber
+
+
+# If the watcher falls behind by more blocks than this, pending hashes are looked up directly
+MAX_BLOCKS_PER_TICK = 20
+# After a failed eth_getBlockReceipts call, blocks are resolved with receipt lookups
+# for this many seconds, doubled after every next failure up to the maximum
+BLOCK_RECEIPTS_RETRY_DELAY = 30
+MAX_BLOCK_RECEIPTS_RETRY_DELAY = 600
+
+
+class ReceiptWatcher:
+    """
+    Resolves transaction receipts for one chain.
+
+    Instead of one wait_for_transaction_receipt polling loop per transaction, the
+    watcher tracks new blocks once and matches every pending transaction against
+    the receipts of each new block (eth_getBlockReceipts, or one batch of receipt
+    lookups per block if the node doesn't support it).
+    """
+
+    def __init__(self, chain_id: int, poll_interval: float = 2.0):
+        self.chain_id = chain_id
+        self.poll_interval = poll_interval
+
+        self._pending: Dict[HexBytes, asyncio.Future] = {}
+        # Callers currently waiting on each hash
+        self._waiters: Dict[HexBytes, int] = {}
+        self._web3_by_hash: Dict[HexBytes, AsyncWeb3] = {}
+        self._unchecked: Set[HexBytes] = set()
+        self._last_block: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._block_receipts_retry_at = 0.0
+        self._block_receipts_retry_delay = BLOCK_RECEIPTS_RETRY_DELAY
+
+        self.rpc_calls = 0
+        self.resolved = 0
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    async def wait_for_receipt(
+        self, web3: AsyncWeb3, tx_hash, timeout: float = 120
+    ) -> TxReceipt:
+        """
+        Wait for the receipt of a transaction.
+
+        Args:
+            web3: Web3 instance of the caller, used to poll while it waits
+            tx_hash: Transaction hash
+            timeout: Maximum time to wait in seconds
+
+        Raises:
+            TimeExhausted: If the receipt didn't appear in time
+        """
+        tx_hash = HexBytes(tx_hash)
+        self._web3_by_hash[tx_hash] = web3
+
+        future = self._pending.get(tx_hash)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[tx_hash] = future
+            self._unchecked.add(tx_hash)
+        self._waiters[tx_hash] = self._waiters.get(tx_hash, 0) + 1
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            raise TimeExhausted(
+                f"Transaction {tx_hash.hex()} is not in the chain after {timeout} seconds"
+            )
+        finally:
+            self._release_waiter(tx_hash, future)
+
+    def _release_waiter(self, tx_hash: HexBytes, future: asyncio.Future) -> None:
+        """Stop tracking a hash once its last waiter is gone."""
+        self._waiters[tx_hash] -= 1
+        if self._waiters[tx_hash] > 0:
+            return
+        del self._waiters[tx_hash]
+        if not future.done() and self._pending.get(tx_hash) is future:
+            self._pending.pop(tx_hash, None)
+            self._web3_by_hash.pop(tx_hash, None)
+            self._unchecked.discard(tx_hash)
+
+    async def _run(self) -> None:
+        while self._pending:
+            try:
+                await self._tick()
+            except Exception as e:
+                logger.warning(
+                    f"Receipt watcher for chain {self.chain_id} error: {str(e)}"
+                )
+            await self._wait_next_block()
+        self._last_block = None
+
+    async def _wait_next_block(self) -> None:
+        """Wake up on the next block pushed over WebSocket, or poll over HTTP without one."""
+        subscriber = get_chain_subscriber(self.chain_id)
+        if subscriber is None or not await subscriber.wait_for_block(
+            self.poll_interval * 5
+        ):
+            await asyncio.sleep(self.poll_interval)
+
+    async def _tick(self) -> None:
+        # Poll with the web3 of the latest waiter, web3 of finished waiters may be closed
+        web3 = next(reversed(self._web3_by_hash.values()))
+
+        # Read the head first, so a transaction mined after the lookups below lands
+        # in a later block that the next tick scans
+        block_number = self._pushed_block_number()
+        if block_number is None:
+            self.rpc_calls += 1
+            block_number = await web3.eth.block_number
+
+        # Freshly registered transactions may already be mined in an old block
+        if self._unchecked:
+            unchecked = list(self._unchecked)
+            self._unchecked.clear()
+            await self._lookup_receipts(web3, unchecked)
+
+        if self._last_block is None:
+            self._last_block = block_number
+            return
+        if block_number <= self._last_block:
+            return
+
+        if block_number - self._last_block > MAX_BLOCKS_PER_TICK:
+            await self._lookup_receipts(web3, list(self._pending))
+        else:
+            for number in range(self._last_block + 1, block_number + 1):
+                if not self._pending:
+                    break
+                await self._resolve_block(web3, number)
+        self._last_block = block_number
+
+    def _pushed_block_number(self) -> Optional[int]:
+        subscriber = get_chain_subscriber(self.chain_id)
+        return subscriber.latest_block if subscriber is not None else None
+
+    async def _resolve_block(self, web3: AsyncWeb3, block_number: int) -> None:
+        if time.monotonic() >= self._block_receipts_retry_at:
+            try:
+                self.rpc_calls += 1
+                receipts = await web3.eth.get_block_receipts(block_number)
+                for receipt in receipts:
+                    self._resolve(HexBytes(receipt["transactionHash"]), receipt)
+                self._block_receipts_retry_delay = BLOCK_RECEIPTS_RETRY_DELAY
+                return
+            except Exception as e:
+                # Unsupported or a transient error, try eth_getBlockReceipts again later
+                logger.info(
+                    f"eth_getBlockReceipts failed on chain {self.chain_id} ({str(e)}), using receipt lookups for {self._block_receipts_retry_delay}s"
+                )
+                self._block_receipts_retry_at = (
+                    time.monotonic() + self._block_receipts_retry_delay
+                )
+                self._block_receipts_retry_delay = min(
+                    self._block_receipts_retry_delay * 2,
+                    MAX_BLOCK_RECEIPTS_RETRY_DELAY,
+                )
+
+        await self._lookup_receipts(web3, list(self._pending))
+
+    async def _lookup_receipts(self, web3: AsyncWeb3, tx_hashes: list) -> None:
+        """Look up receipts of many transactions in one concurrent batch."""
+        if not tx_hashes:
+            return
+        self.rpc_calls += len(tx_hashes)
+        receipts = await asyncio.gather(
+            *[web3.eth.get_transaction_receipt(tx_hash) for tx_hash in tx_hashes],
+            return_exceptions=True,
+        )
+        for tx_hash, receipt in zip(tx_hashes, receipts):
+            if not isinstance(receipt, BaseException) and receipt is not None:
+                self._resolve(tx_hash, receipt)
+
+    def _resolve(self, tx_hash: HexBytes, receipt: TxReceipt) -> None:
+        future = self._pending.pop(tx_hash, None)
+        self._web3_by_hash.pop(tx_hash, None)
+        if future is not None and not future.done():
+            future.set_result(receipt)
+            self.resolved += 1
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "pending": self.pending_count,
+            "resolved": self.resolved,
+            "rpc_calls": self.rpc_calls,
+        }
+
+
+_receipt_watchers: Dict[int, ReceiptWatcher] = {}
+
+
+def get_receipt_watcher(chain_id: int) -> ReceiptWatcher:
+    """Get the process-wide receipt watcher for a chain."""
+    if chain_id not in _receipt_watchers:
+        _receipt_watchers[chain_id] = ReceiptWatcher(chain_id)
+    return _receipt_watchers[chain_id]
@@ -0,0 +1,172 @@
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from loguru import logger
+
+
+RPC_CACHE_FILE = "data/rpc_cache.json"
+
+
+@dataclass(frozen=True)
+class CacheRule:
+    """How long a cached RPC result stays valid. ttl None means it never changes."""
+
+    ttl: Optional[float]
+    persist: bool = False
+
+
+IMMUTABLE = CacheRule(ttl=None, persist=True)
+
+
+def seconds(ttl: float, persist: bool = False) -> CacheRule:
+    return CacheRule(ttl=ttl, persist=persist)
+
+
+# Methods that are not listed here are never cached
+RPC_CACHE_RULES: Dict[str, CacheRule] = {
+    "eth_chainId": IMMUTABLE,
+    # Only deployed contracts are kept, an empty address is read again
+    "eth_getCode": IMMUTABLE,
+    "decimals": IMMUTABLE,
+    "minimumDeposit": seconds(600, persist=True),
+}
+
+
+class RpcCache:
+    """
+    Read-through cache of RPC results that are constant or slow-changing.
+
+    Every method has a TTL rule (immutable or N seconds). Entries of
+    persistent rules are saved to disk, so a restarted run starts warm. Hits and
+    misses are counted per method.
+    """
+
+    def __init__(self, path: str = RPC_CACHE_FILE):
+        self.path = path
+        self._entries: Dict[str, Tuple[Any, Optional[float]]] = {}
+        self._loaded = False
+        self._dirty = False
+
+        self.hits: Dict[str, int] = {}
+        self.misses: Dict[str, int] = {}
+
+    @staticmethod
+    def _key(scope: Any, method: str, params: tuple) -> str:
+        return f"{scope}|{method}|{json.dumps(list(params), default=str)}"
+
+    async def get(
+        self,
+        scope: Any,
+        method: str,
+        params: tuple,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Get a cached result or read it with fetch.
+
+        Args:
+            scope: What the result belongs to, a chain id or an RPC URL
+            method: RPC or contract method name, looked up in RPC_CACHE_RULES
+            params: Call parameters, part of the key
+            fetch: Coroutine function doing the actual call
+        """
+        rule = RPC_CACHE_RULES.get(method)
+        if rule is None:
+            return await fetch()
+
+        self._load()
+        key = self._key(scope, method, params)
+        cached = self._entries.get(key)
+        if cached is not None and (cached[1] is None or cached[1] > time.time()):
+            self.hits[method] = self.hits.get(method, 0) + 1
+            return cached[0]
+
+        self.misses[method] = self.misses.get(method, 0) + 1
+        value = await fetch()
+        self.set(scope, method, params, value)
+        return value
+
+    def set(self, scope: Any, method: str, params: tuple, value: Any) -> None:
+        rule = RPC_CACHE_RULES.get(method)
+        if rule is None:
+            return
+        expires_at = None if rule.ttl is None else time.time() + rule.ttl
+        self._entries[self._key(scope, method, params)] = (value, expires_at)
+        if rule.persist:
+            self._dirty = True
+
+    def invalidate(self, scope: Any, method: str, params: tuple) -> None:
+        if self._entries.pop(self._key(scope, method, params), None) is not None:
+            self._dirty = True
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                entries = json.load(file)
+            now = time.time()
+            for key, (value, expires_at) in entries.items():
+                if expires_at is None or expires_at > now:
+                    self._entries.setdefault(key, (value, expires_at))
+        except Exception as e:
+            logger.warning(f"Failed to load RPC cache from {self.path}: {str(e)}")
+
+    def save(self) -> None:
+        """Write entries of persistent rules to disk."""
+        if not self._dirty:
+            return
+        now = time.time()
+        entries = {}
+        for key, (value, expires_at) in self._entries.items():
+            method = key.split("|")[1]
+            rule = RPC_CACHE_RULES.get(method)
+            if rule and rule.persist and (expires_at is None or expires_at > now):
+                entries[key] = [value, expires_at]
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as file:
+                json.dump(entries, file)
+            self._dirty = False
+        except Exception as e:
+            logger.warning(f"Failed to save RPC cache to {self.path}: {str(e)}")
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Hits, misses and hit rate per method."""
+        stats = {}
+        for method in set(self.hits) | set(self.misses):
+            hits = self.hits.get(method, 0)
+            misses = self.misses.get(method, 0)
+            stats[method] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / (hits + misses), 3),
+            }
+        return stats
+
+
+_rpc_cache: Optional[RpcCache] = None
+
+
+def get_rpc_cache() -> RpcCache:
+    """Get the process-wide RPC cache."""
+    global _rpc_cache
+    if _rpc_cache is None:
+        _rpc_cache = RpcCache()
+    return _rpc_cache
+
+
+def save_rpc_cache() -> None:
+    """Persist the RPC cache and log its hit rates."""
+    if _rpc_cache is None:
+        return
+    _rpc_cache.save()
+    for method, stats in sorted(_rpc_cache.stats().items()):
+        logger.info(
+            f"RPC cache | {method}: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.0%})"
+        )
@@ -1,13 +1,36 @@
 from decimal import Decimal
-from typing import Dict, Optional, Union
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
 from loguru import logger
 from web3 import AsyncWeb3
+from web3.exceptions import TransactionNotFound
 from eth_account.signers.local import LocalAccount
 from src.utils.decorators import retry_async
-from src.model.onchain.constants import Balance
+from src.model.onchain.constants import (
+    Balance,
+    ERC20_BALANCE_OF_ABI,
+    ERC20_APPROVE_ABI,
+    ERC20_DECIMALS_ABI,
+)
+from src.model.onchain.contract_cache import get_contract
+from src.model.onchain.gas_cache import (
+    get_gas_limit_cache,
+    is_gas_error,
+    GAS_SAFETY_MARGIN,
+)
+from src.model.onchain.rpc_cache import get_rpc_cache
+from src.utils.singleflight import get_singleflight
+from src.model.onchain.hedging import get_hedge_policy
+from src.model.onchain.receipt_watcher import get_receipt_watcher
+from src.model.onchain.balance_watcher import get_balance_watcher
+from src.model.onchain.nonce_manager import (
+    get_nonce_manager,
+    is_nonce_error,
+    is_already_known_error,
+)
 import asyncio
 import traceback
 from eth_account.messages import encode_defunct
+from hexbytes import HexBytes
 
 
 class Web3Custom:
@@ -18,13 +41,32 @@ class Web3Custom:
         use_proxy: bool,
         proxy: str,
         ssl: bool = False,
+        hedge_requests: bool = False,
     ):
         self.account_index = account_index
         self.RPC_URLS = RPC_URLS
         self.use_proxy = use_proxy
         self.proxy = proxy
         self.ssl = ssl
+        self.hedge_requests = hedge_requests
         self.web3 = None
+        self.chain_id: Optional[int] = None
+        # Web3 instances of the other RPC URLs, used as hedging backups
+        self._backup_web3s: Dict[str, AsyncWeb3] = {}
+
+    def _create_web3(self, rpc_url: str) -> AsyncWeb3:
+        proxy_settings = (
+            (f"http://{self.proxy}") if (self.use_proxy and self.proxy) else None
+        )
+        return AsyncWeb3(
+            AsyncWeb3.AsyncHTTPProvider(
+                rpc_url,
+                request_kwargs={
+                    "proxy": proxy_settings,
+                    "ssl": self.ssl,
+                },
+            )
+        )
 
     async def connect_web3(self) -> None:
         """
@@ -34,23 +76,22 @@ class Web3Custom:
         for rpc_url in self.RPC_URLS:
             for attempt in range(3):
                 try:
-                    proxy_settings = (
-                        (f"http://{self.proxy}")
-                        if (self.use_proxy and self.proxy)
-                        else None
-                    )
-                    self.web3 = AsyncWeb3(
-                        AsyncWeb3.AsyncHTTPProvider(
-                            rpc_url,
-                            request_kwargs={
-                                "proxy": proxy_settings,
-                                "ssl": self.ssl,
-                            },
-                        )
-                    )
+                    self.web3 = self._create_web3(rpc_url)
+
+                    # Test connection with one live call: eth_chainId on a new RPC,
+                    # eth_blockNumber once its chain id is in the RPC cache
+                    probed = False
 
-                    # Test connection
-                    await self.web3.eth.chain_id
+                    async def probe_chain_id() -> int:
+                        nonlocal probed
+                        probed = True
+                        return await self.web3.eth.chain_id
+
+                    self.chain_id = await get_rpc_cache().get(
+                        rpc_url, "eth_chainId", (), probe_chain_id
+                    )
+                    if not probed:
+                        await self.web3.eth.block_number
                     return
 
                 except Exception as e:
@@ -64,6 +105,17 @@ class Web3Custom:
         raise Exception("Failed to connect to any RPC URL")
 
     @retry_async(attempts=3, delay=3.0, default_value=None)
+    async def get_chain_id(self) -> int:
+        """Chain id of the connected RPC, read once and kept in the RPC cache."""
+        if self.chain_id is None:
+            self.chain_id = await get_rpc_cache().get(
+                self.web3.provider.endpoint_uri,
+                "eth_chainId",
+                (),
+                lambda: self.web3.eth.chain_id,
+            )
+        return self.chain_id
+
     async def get_balance(self, address: str) -> Balance:
         """
         Get balance of an address.
@@ -71,16 +123,45 @@ class Web3Custom:
         Returns:
             Balance object with wei, gwei and ether values
         """
-        wei_balance = await self.web3.eth.get_balance(address)
+        wei_balance = await self.hedged_read(
+            lambda web3: web3.eth.get_balance(address)
+        )
         return Balance.from_wei(wei_balance)
 
+    async def hedged_read(self, fn: Callable[[AsyncWeb3], Awaitable[Any]]) -> Any:
+        """
+        Run an idempotent read. With hedge_requests enabled and more than one RPC
+        URL, a read slower than the learned latency percentile of the current RPC
+        is duplicated to another RPC and the first answer wins.
+
+        Args:
+            fn: Read to run, called with the web3 instance of an RPC
+        """
+        if not self.hedge_requests or len(self.RPC_URLS) < 2:
+            return await fn(self.web3)
+
+        primary_url = self.web3.provider.endpoint_uri
+        backups = [
+            (url, lambda url=url: fn(self._get_backup_web3(url)))
+            for url in self.RPC_URLS
+            if url != primary_url
+        ]
+        return await get_hedge_policy().run(
+            (primary_url, lambda: fn(self.web3)), backups
+        )
+
+    def _get_backup_web3(self, rpc_url: str) -> AsyncWeb3:
+        if rpc_url not in self._backup_web3s:
+            self._backup_web3s[rpc_url] = self._create_web3(rpc_url)
+        return self._backup_web3s[rpc_url]
+
     @retry_async(attempts=3, delay=5.0, default_value=None)
     async def get_token_balance(
         self,
         wallet_address: str,
         token_address: str,
         token_abi: list = None,
-        decimals: int = 18,
+        decimals: Optional[int] = None,
         symbol: str = "TOKEN",
     ) -> Balance:
         """
@@ -90,7 +171,7 @@ class Web3Custom:
             wallet_address: Address to check balance for
             token_address: Token contract address
             token_abi: Token ABI (optional)
-            decimals: Token decimals (default is 18 for most ERC20 tokens)
+            decimals: Token decimals, read from the token through the RPC cache if not given
             symbol: Token symbol (optional)
 
         Returns:
@@ -98,33 +179,70 @@ class Web3Custom:
         """
         if token_abi is None:
             # Use minimal ERC20 ABI if none provided
-            token_abi = [
-                {
-                    "constant": True,
-                    "inputs": [{"name": "_owner", "type": "address"}],
-                    "name": "balanceOf",
-                    "outputs": [{"name": "balance", "type": "uint256"}],
-                    "type": "function",
-                }
-            ]
+            token_abi = ERC20_BALANCE_OF_ABI
 
-        token_contract = self.web3.eth.contract(
-            address=self.web3.to_checksum_address(token_address), abi=token_abi
+        token_contract = get_contract(self.chain_id, token_address, token_abi)
+        wei_balance = await self.hedged_read(
+            lambda web3: token_contract.call(web3, "balanceOf", wallet_address)
         )
-        wei_balance = await token_contract.functions.balanceOf(wallet_address).call()
+        if decimals is None:
+            decimals = await self.get_token_decimals(token_address)
 
         return Balance.from_wei(wei_balance, decimals=decimals, symbol=symbol)
 
+    async def get_token_decimals(self, token_address: str) -> int:
+        """Get decimals of an ERC20 token, read once and kept in the RPC cache."""
+        token_contract = get_contract(self.chain_id, token_address, ERC20_DECIMALS_ABI)
+        return await get_rpc_cache().get(
+            self.chain_id,
+            "decimals",
+            (token_address.lower(),),
+            lambda: token_contract.call(self.web3, "decimals"),
+        )
+
+    async def is_contract(self, address: str) -> bool:
+        """Check if there is contract code at address. Deployed code is cached for good."""
+        cache = get_rpc_cache()
+        params = (address.lower(),)
+
+        async def has_code() -> bool:
+            code = await self.web3.eth.get_code(AsyncWeb3.to_checksum_address(address))
+            return len(code) > 0
+
+        if await cache.get(self.chain_id, "eth_getCode", params, has_code):
+            return True
+        # Nothing deployed yet, it may be later
+        cache.invalidate(self.chain_id, "eth_getCode", params)
+        return False
+
+    async def shared_read(
+        self, method: str, params: tuple, fn: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Run an idempotent read, sharing one in-flight call with identical reads
+        (same endpoint, method and params) of other accounts.
+        """
+        key = (self.web3.provider.endpoint_uri, method, params)
+        return await get_singleflight().do(key, fn)
+
     @retry_async(attempts=3, delay=5.0, default_value=None)
     async def get_gas_params(self) -> Dict[str, int]:
         try:
             # Try EIP-1559 first
-            latest_block = await self.web3.eth.get_block("latest")
+            latest_block = await self.shared_read(
+                "eth_getBlockByNumber",
+                ("latest",),
+                lambda: self.hedged_read(lambda web3: web3.eth.get_block("latest")),
+            )
 
             # Check if the network supports EIP-1559
             if "baseFeePerGas" in latest_block:
                 base_fee = latest_block["baseFeePerGas"]
-                max_priority_fee = await self.web3.eth.max_priority_fee
+                max_priority_fee = await self.shared_read(
+                    "eth_maxPriorityFeePerGas",
+                    (),
+                    lambda: self.hedged_read(lambda web3: web3.eth.max_priority_fee),
+                )
                 max_fee = base_fee + max_priority_fee
 
                 return {
@@ -133,7 +251,9 @@ class Web3Custom:
                 }
             else:
                 # Fallback to legacy gas pricing
-                gas_price = await self.web3.eth.gas_price
+                gas_price = await self.shared_read(
+                    "eth_gasPrice", (), lambda: self.web3.eth.gas_price
+                )
                 return {"gasPrice": gas_price}
 
         except Exception as e:
@@ -168,36 +288,48 @@ class Web3Custom:
             explorer_url: Explorer URL for logging (optional)
         """
         try:
-            nonce = await self.web3.eth.get_transaction_count(wallet.address)
             gas_params = await self.get_gas_params()
             if gas_params is None:
                 raise Exception("Failed to get gas parameters")
 
             transaction = {
                 "from": wallet.address,
-                "nonce": nonce,
                 "chainId": chain_id,
                 **tx_data,
                 **gas_params,
             }
+            # Nonce is always assigned by the local nonce manager
+            transaction.pop("nonce", None)
 
             # Add type 2 only for EIP-1559 transactions
             if "maxFeePerGas" in gas_params:
                 transaction["type"] = 2
 
-            signed_txn = self.web3.eth.account.sign_transaction(transaction, wallet.key)
-            tx_hash = await self.web3.eth.send_raw_transaction(
-                signed_txn.raw_transaction
-            )
+            tx_hash = await self.send_with_gas_fallback(transaction, wallet, chain_id)
 
             logger.info(
                 f"{self.account_index} | Waiting for transaction confirmation..."
             )
-            receipt = await self.web3.eth.wait_for_transaction_receipt(
-                tx_hash, poll_latency=2
-            )
+            receipt = await self.wait_for_transaction_receipt(tx_hash)
+
+            # Out of gas with a learned limit: the call got more expensive
+            if (
+                receipt["status"] != 1
+                and self._uses_learned_gas(transaction, chain_id)
+                and receipt["gasUsed"] >= transaction["gas"]
+            ):
+                tx_hash = await self._resend_with_live_estimate(
+                    transaction, wallet, chain_id, "out of gas"
+                )
+                receipt = await self.wait_for_transaction_receipt(tx_hash)
+            elif receipt["status"] != 1 and self._uses_learned_gas(transaction, chain_id):
+                # Reverted without the estimate_gas pre-check, estimate the call live next time
+                get_gas_limit_cache().invalidate(
+                    chain_id, transaction.get("to"), transaction.get("data")
+                )
 
             if receipt["status"] == 1:
+                self.record_gas_used(transaction, receipt, chain_id)
                 tx_hex = tx_hash.hex()
                 success_msg = f"Transaction successful!"
                 if explorer_url:
@@ -212,6 +344,19 @@ class Web3Custom:
             )
             raise
 
+    async def wait_for_transaction_receipt(self, tx_hash, timeout: float = 120):
+        """
+        Wait for a transaction receipt through the shared receipt watcher of this chain.
+        Same result as web3.eth.wait_for_transaction_receipt, without a polling loop per transaction.
+
+        Args:
+            tx_hash: Transaction hash
+            timeout: Maximum time to wait in seconds
+        """
+        return await get_receipt_watcher(await self.get_chain_id()).wait_for_receipt(
+            self.web3, tx_hash, timeout
+        )
+
     @retry_async(attempts=3, delay=5.0, backoff=2.0, default_value=None)
     async def approve_token(
         self,
@@ -238,36 +383,13 @@ class Web3Custom:
         try:
             if token_abi is None:
                 # Use minimal ERC20 ABI if none provided
-                token_abi = [
-                    {
-                        "constant": True,
-                        "inputs": [
-                            {"name": "_owner", "type": "address"},
-                            {"name": "_spender", "type": "address"},
-                        ],
-                        "name": "allowance",
-                        "outputs": [{"name": "", "type": "uint256"}],
-                        "type": "function",
-                    },
-                    {
-                        "constant": False,
-                        "inputs": [
-                            {"name": "_spender", "type": "address"},
-                            {"name": "_value", "type": "uint256"},
-                        ],
-                        "name": "approve",
-                        "outputs": [{"name": "", "type": "bool"}],
-                        "type": "function",
-                    },
-                ]
-
-            token_contract = self.web3.eth.contract(
-                address=self.web3.to_checksum_address(token_address), abi=token_abi
-            )
+                token_abi = ERC20_APPROVE_ABI
+
+            token_contract = get_contract(chain_id, token_address, token_abi)
 
-            current_allowance = await token_contract.functions.allowance(
-                wallet.address, spender_address
-            ).call()
+            current_allowance = await token_contract.call(
+                self.web3, "allowance", wallet.address, spender_address
+            )
 
             if current_allowance >= amount:
                 logger.info(
@@ -275,19 +397,12 @@ class Web3Custom:
                 )
                 return None
 
-            gas_params = await self.get_gas_params()
-            if gas_params is None:
-                raise Exception("Failed to get gas parameters")
-
-            approve_tx = await token_contract.functions.approve(
-                spender_address, amount
-            ).build_transaction(
-                {
-                    "from": wallet.address,
-                    "nonce": await self.web3.eth.get_transaction_count(wallet.address),
-                    "chainId": chain_id,
-                    **gas_params,
-                }
+            approve_tx = {
+                "to": token_contract.address,
+                "data": token_contract.encode("approve", spender_address, amount),
+            }
+            approve_tx["gas"] = await self.estimate_gas(
+                {"from": wallet.address, "chainId": chain_id, **approve_tx}
             )
 
             return await self.execute_transaction(
@@ -321,24 +436,42 @@ class Web3Custom:
             token_address: Token address (if waiting for token balance)
             token_abi: Token ABI (optional, for tokens)
             timeout: Maximum time to wait in seconds
-            check_interval: How often to check balance in seconds
-            log_interval: How often to log progress in seconds
+            check_interval: How often to check token balance in seconds
+            log_interval: How often to log token balance progress in seconds
             account_index: Optional account index for logging
         """
 
         logger.info(
             f"{self.account_index} | Waiting for balance to increase (max wait time: {timeout} seconds)..."
         )
-        start_time = asyncio.get_event_loop().time()
 
-        while asyncio.get_event_loop().time() - start_time < timeout:
-            # Get current balance (either native coin or token)
-            if token_address:
-                current_balance = await self.get_token_balance(
-                    wallet_address, token_address, token_abi
+        # Native coin arrivals are detected by the shared per-chain balance watcher
+        if not token_address:
+            chain_id = await self.get_chain_id()
+            if isinstance(initial_balance, Balance):
+                convert = Balance.from_wei
+            else:
+                convert = lambda wei: float(self.web3.from_wei(wei, "ether"))
+
+            increased = await get_balance_watcher(chain_id).wait_for_increase(
+                self.web3, wallet_address, initial_balance, timeout, convert
+            )
+            if increased:
+                logger.success(
+                    f"{self.account_index} | Balance of {wallet_address} increased from {initial_balance}"
                 )
             else:
-                current_balance = await self.get_balance(wallet_address)
+                logger.error(
+                    f"{self.account_index} | Balance didn't increase after {timeout} seconds"
+                )
+            return increased
+
+        start_time = asyncio.get_event_loop().time()
+
+        while asyncio.get_event_loop().time() - start_time < timeout:
+            current_balance = await self.get_token_balance(
+                wallet_address, token_address, token_abi
+            )
 
             if current_balance > initial_balance:
                 logger.success(
@@ -361,17 +494,118 @@ class Web3Custom:
 
     @retry_async(attempts=3, delay=10.0, default_value=None)
     async def estimate_gas(self, transaction: dict) -> int:
-        """Estimate gas for transaction and add some buffer."""
+        """
+        Gas limit for a transaction. Learned from receipts of the same call
+        (chain, to, selector) when there are enough of them, otherwise estimated
+        live. Both get a safety margin.
+        """
+        chain_id = transaction.get("chainId") or await self.get_chain_id()
+
+        learned = get_gas_limit_cache().get(
+            chain_id, transaction.get("to"), transaction.get("data")
+        )
+        if learned is not None:
+            return learned
+
         try:
             estimated = await self.web3.eth.estimate_gas(transaction)
-            # Добавляем 10% к estimated gas для безопасности
-            return int(estimated * 2.2)
+            return int(estimated * GAS_SAFETY_MARGIN)
         except Exception as e:
             logger.warning(
                 f"{self.account_index} | Error estimating gas: {e}."
             )
             raise e
 
+    def record_gas_used(
+        self, transaction: dict, receipt, chain_id: Optional[int] = None
+    ) -> None:
+        """Teach the gas limit cache the gasUsed of a successful transaction."""
+        if receipt["status"] != 1:
+            return
+        get_gas_limit_cache().record(
+            chain_id or transaction.get("chainId", self.chain_id),
+            transaction.get("to"),
+            transaction.get("data"),
+            receipt["gasUsed"],
+        )
+
+    async def send_with_gas_fallback(
+        self,
+        transaction: dict,
+        wallet: LocalAccount,
+        chain_id: int,
+        on_signed: Optional[Callable[[HexBytes], None]] = None,
+        nonce: Optional[int] = None,
+    ) -> HexBytes:
+        """
+        sign_and_send that falls back to a live gas estimate when the node
+        rejects a transaction sent with a learned gas limit because of its gas
+        or a revert. Any other error is raised, and nothing is resent if the
+        node knows the signed transaction anyway.
+        """
+        signed = []
+
+        def remember(tx_hash: HexBytes) -> None:
+            signed.append(tx_hash)
+            if on_signed is not None:
+                on_signed(tx_hash)
+
+        try:
+            return await self.sign_and_send(
+                transaction, wallet, chain_id, nonce=nonce, on_signed=remember
+            )
+        except Exception as e:
+            if not self._uses_learned_gas(transaction, chain_id) or not is_gas_error(e):
+                raise
+            # The broadcast may have reached the node before the error
+            for tx_hash in reversed(signed):
+                if await self._is_known_transaction(tx_hash):
+                    return tx_hash
+            return await self._resend_with_live_estimate(
+                transaction, wallet, chain_id, str(e), on_signed, nonce
+            )
+
+    async def _is_known_transaction(self, tx_hash: HexBytes) -> bool:
+        try:
+            await self.web3.eth.get_transaction(tx_hash)
+            return True
+        except TransactionNotFound:
+            return False
+
+    def _uses_learned_gas(self, transaction: dict, chain_id: int) -> bool:
+        learned = get_gas_limit_cache().learned(
+            chain_id, transaction.get("to"), transaction.get("data")
+        )
+        return learned is not None and transaction.get("gas") == learned
+
+    async def _resend_with_live_estimate(
+        self,
+        transaction: dict,
+        wallet: LocalAccount,
+        chain_id: int,
+        reason: str,
+        on_signed: Optional[Callable[[HexBytes], None]] = None,
+        nonce: Optional[int] = None,
+    ) -> HexBytes:
+        """Drop the learned gas limit of a call and send the transaction again with a live estimate."""
+        logger.warning(
+            f"{self.account_index} | Learned gas limit {transaction['gas']} failed ({reason}), retrying with a live estimate..."
+        )
+        get_gas_limit_cache().invalidate(
+            chain_id, transaction.get("to"), transaction.get("data")
+        )
+        transaction.pop("nonce", None)
+        estimate_params = {
+            key: transaction[key]
+            for key in ("from", "to", "data", "value")
+            if key in transaction
+        }
+        estimated = await self.web3.eth.estimate_gas(estimate_params)
+        transaction["gas"] = int(estimated * GAS_SAFETY_MARGIN)
+        return await self.sign_and_send(
+            transaction, wallet, chain_id, nonce=nonce, on_signed=on_signed
+        )
+
     @classmethod
     async def create(
         cls,
@@ -380,11 +614,12 @@ class Web3Custom:
         use_proxy: bool,
         proxy: str,
         ssl: bool = False,
+        hedge_requests: bool = False,
     ) -> "Web3Custom":
         """
         Async factory method for creating a class instance.
         """
-        instance = cls(account_index, RPC_URLS, use_proxy, proxy, ssl)
+        instance = cls(account_index, RPC_URLS, use_proxy, proxy, ssl, hedge_requests)
         await instance.connect_web3()
         return instance
 
@@ -400,6 +635,10 @@ class Web3Custom:
                 )
                 return
 
+            for backup_web3 in self._backup_web3s.values():
+                await backup_web3.provider.disconnect()
+            self._backup_web3s.clear()
+
             if hasattr(self.web3, "provider"):
                 provider = self.web3.provider
 
@@ -448,8 +687,7 @@ class Web3Custom:
             params: Parameters for the function
             abi: Contract ABI
         """
-        contract = self.web3.eth.contract(abi=abi)
-        return contract.encodeABI(fn_name=function_name, args=[params])
+        return get_contract(self.chain_id, None, abi).encode(function_name, params)
 
     async def send_transaction(
         self,
@@ -470,7 +708,7 @@ class Web3Custom:
             chain_id: Chain ID (optional)
         """
         if chain_id is None:
-            chain_id = await self.web3.eth.chain_id
+            chain_id = await self.get_chain_id()
 
         # Get gas estimate
         tx_params = {
@@ -491,11 +729,57 @@ class Web3Custom:
         gas_params = await self.get_gas_params()
         tx_params.update(gas_params)
 
-        # Get nonce
-        tx_params["nonce"] = await self.web3.eth.get_transaction_count(wallet.address)
-
-        # Sign and send transaction
-        signed_tx = self.web3.eth.account.sign_transaction(tx_params, wallet.key)
-        tx_hash = await self.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
+        # Sign and send transaction with a locally assigned nonce
+        tx_hash = await self.send_with_gas_fallback(tx_params, wallet, chain_id)
 
         return tx_hash.hex()
+
+    async def sign_and_send(
+        self,
+        transaction: Dict,
+        wallet: LocalAccount,
+        chain_id: int,
+        nonce: Optional[int] = None,
+        on_signed: Optional[Callable[[HexBytes], None]] = None,
+    ) -> HexBytes:
+        """
+        Sign and broadcast a transaction using the process-wide nonce manager.
+
+        Args:
+            transaction: Transaction dict without nonce
+            wallet: Wallet instance (eth_account.LocalAccount)
+            chain_id: Chain ID for the transaction
+            nonce: Explicit nonce to replace an already pending transaction (optional)
+            on_signed: Called with the hash of every signed transaction before it is
+                broadcast, so a caller can look it up even if the broadcast errors (optional)
+
+        Returns:
+            Transaction hash
+        """
+        nonce_manager = get_nonce_manager(chain_id, wallet.address)
+
+        for attempt in range(2):
+            if nonce is None:
+                transaction["nonce"] = await nonce_manager.get_nonce(self.web3)
+            else:
+                transaction["nonce"] = nonce
+
+            signed_tx = self.web3.eth.account.sign_transaction(transaction, wallet.key)
+            if on_signed is not None:
+                on_signed(signed_tx.hash)
+            try:
+                return await self.web3.eth.send_raw_transaction(
+                    signed_tx.raw_transaction
+                )
+            except Exception as e:
+                # Node already has exactly this transaction, nothing to resend
+                if is_already_known_error(e):
+                    return signed_tx.hash
+
+                await nonce_manager.reconcile(self.web3)
+                if attempt == 0 and nonce is None and is_nonce_error(e):
+                    logger.warning(
+                        f"{self.account_index} | Nonce {transaction['nonce']} rejected: {str(e)}. Retrying with synced nonce..."
+                    )
+                    continue
+                raise
@@ -0,0 +1,179 @@
+import asyncio
+from typing import Dict, List, Optional, Set, Tuple
+from loguru import logger
+from web3 import AsyncWeb3, WebSocketProvider
+
+
+# Reconnect delays grow up to this many seconds
+MAX_RECONNECT_DELAY = 60
+# Pushed logs nobody drains are dropped past this many, HTTP get_logs covers the gap
+MAX_BUFFERED_LOGS = 10000
+
+
+def _to_int(value) -> int:
+    return int(value, 16) if isinstance(value, str) else int(value)
+
+
+class ChainSubscriber:
+    """
+    One persistent WebSocket connection to an RPC, shared by all accounts.
+
+    Subscribes to `newHeads` and to filtered logs. Receipt and balance watchers
+    wake up on pushed blocks and read pushed logs instead of polling. While the
+    socket is down, `connected` is False and the watchers fall back to HTTP
+    polling; the subscriber keeps reconnecting in the background.
+    """
+
+    def __init__(self, ws_url: str):
+        self.ws_url = ws_url
+        self.chain_id: Optional[int] = None
+        self.latest_block: Optional[int] = None
+        self.connected = False
+
+        self._web3: Optional[AsyncWeb3] = None
+        self._task: Optional[asyncio.Task] = None
+        self._new_block = asyncio.Event()
+        self._log_filters: Set[Tuple[str, str]] = set()
+        self._log_subscriptions: Dict[str, Tuple[str, str]] = {}
+        # Block from which pushed logs of a filter are complete, reset on reconnect
+        self._logs_since: Dict[Tuple[str, str], int] = {}
+        self._logs: Dict[Tuple[str, str], List[dict]] = {}
+
+        self.blocks = 0
+        self.reconnects = 0
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self.connected = False
+
+    async def wait_for_block(self, timeout: float) -> bool:
+        """Wait for the next pushed block. Returns False on timeout or if the socket is down."""
+        if not self.connected:
+            return False
+        self._new_block.clear()
+        try:
+            await asyncio.wait_for(self._new_block.wait(), timeout)
+            return self.connected
+        except asyncio.TimeoutError:
+            return False
+
+    async def subscribe_logs(self, address: str, topic: str) -> None:
+        """Subscribe to logs of a contract event, kept across reconnects."""
+        log_filter = (AsyncWeb3.to_checksum_address(address), topic)
+        if log_filter in self._log_filters:
+            return
+        self._log_filters.add(log_filter)
+        if self.connected:
+            await self._subscribe_log_filter(log_filter)
+
+    def drain_logs(self, address: str, topic: str, from_block: int) -> Optional[List[dict]]:
+        """
+        Pushed logs of a filter since the last drain.
+
+        Returns:
+            Logs, or None if pushed logs don't cover from_block (socket down,
+            reconnected or subscribed later) and logs must be read over HTTP
+        """
+        log_filter = (AsyncWeb3.to_checksum_address(address), topic)
+        since = self._logs_since.get(log_filter)
+        logs = self._logs.pop(log_filter, [])
+        if not self.connected or since is None or since > from_block:
+            return None
+        return [log for log in logs if _to_int(log["blockNumber"]) >= from_block]
+
+    async def _subscribe_log_filter(self, log_filter: Tuple[str, str]) -> None:
+        address, topic = log_filter
+        subscription_id = await self._web3.eth.subscribe(
+            "logs", {"address": address, "topics": [topic]}
+        )
+        self._log_subscriptions[subscription_id] = log_filter
+        self._logs_since[log_filter] = (self.latest_block or 0) + 1
+
+    async def _run(self) -> None:
+        delay = 1
+        while True:
+            try:
+                async with AsyncWeb3(WebSocketProvider(self.ws_url)) as web3:
+                    self._web3 = web3
+                    self.chain_id = await web3.eth.chain_id
+                    self.latest_block = await web3.eth.block_number
+                    _chain_subscribers[self.chain_id] = self
+
+                    heads_subscription = await web3.eth.subscribe("newHeads")
+                    self._log_subscriptions = {}
+                    self._logs_since = {}
+                    self.connected = True
+                    for log_filter in list(self._log_filters):
+                        await self._subscribe_log_filter(log_filter)
+                    logger.info(f"WebSocket subscriptions to {self.ws_url} are active")
+                    delay = 1
+
+                    async for payload in web3.socket.process_subscriptions():
+                        subscription = payload["subscription"]
+                        result = payload["result"]
+                        if subscription == heads_subscription:
+                            self.latest_block = _to_int(result["number"])
+                            self.blocks += 1
+                            self._new_block.set()
+                        elif subscription in self._log_subscriptions:
+                            log_filter = self._log_subscriptions[subscription]
+                            logs = self._logs.setdefault(log_filter, [])
+                            logs.append(result)
+                            if len(logs) > MAX_BUFFERED_LOGS:
+                                logs.clear()
+                                self._logs_since[log_filter] = self.latest_block + 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    f"WebSocket {self.ws_url} disconnected: {str(e)}. Falling back to HTTP polling, reconnecting in {delay}s..."
+                )
+            finally:
+                self.connected = False
+                self._web3 = None
+                self._new_block.set()
+
+            self.reconnects += 1
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_RECONNECT_DELAY)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "connected": int(self.connected),
+            "blocks": self.blocks,
+            "reconnects": self.reconnects,
+        }
+
+
+_chain_subscribers: Dict[int, ChainSubscriber] = {}
+_subscribers: List[ChainSubscriber] = []
+
+
+def get_chain_subscriber(chain_id: int) -> Optional[ChainSubscriber]:
+    """Get the WebSocket subscriber of a chain if one is running and connected."""
+    subscriber = _chain_subscribers.get(chain_id)
+    if subscriber is None or not subscriber.connected:
+        return None
+    return subscriber
+
+
+def start_chain_subscriber(ws_url: str) -> ChainSubscriber:
+    """Start a shared WebSocket subscriber. It registers itself for its chain once connected."""
+    subscriber = ChainSubscriber(ws_url)
+    _subscribers.append(subscriber)
+    subscriber.start()
+    return subscriber
+
+
+async def stop_chain_subscribers() -> None:
+    for subscriber in _subscribers:
+        await subscriber.stop()
+    _subscribers.clear()
+    _chain_subscribers.clear()
@@ -1,5 +1,19 @@
 from .instance import CampLoyalty
 from .constants import CampLoyaltyProtocol
 from .connect_socials import ConnectLoyaltySocials
+from .api_client import LoyaltyApiClient
+from .catalog import CampaignCatalog, get_campaign_catalog
+from .status_poller import QuestStatusPoller
+from .verifier import QuestVerifier, get_quest_verifier
 
-__all__ = ["CampLoyalty", "CampLoyaltyProtocol", "ConnectLoyaltySocials"]
+__all__ = [
+    "CampLoyalty",
+    "CampLoyaltyProtocol",
+    "ConnectLoyaltySocials",
+    "LoyaltyApiClient",
+    "CampaignCatalog",
+    "get_campaign_catalog",
+    "QuestStatusPoller",
+    "QuestVerifier",
+    "get_quest_verifier",
+]
@@ -0,0 +1,255 @@
+from typing import Any, Dict, Mapping, Optional
+from loguru import logger
+
+from src.model.camp_network.constants import CampNetworkProtocol
+from src.model.projects.camp_loyalty.constants import (
+    ALREADY_DONE_MARKERS,
+    API_HEADERS,
+    CALLBACK_URL_COOKIE,
+    CROSS_SITE_DOCUMENT_HEADERS,
+    CSRF_TOKEN_COOKIE,
+    DOCUMENT_HEADERS,
+    FORM_HEADERS,
+    JSON_HEADERS,
+    LOYALTY_RATE_LIMITER,
+    LOYALTY_REQUESTS_BURST,
+    LOYALTY_REQUESTS_PER_SECOND,
+    LOYALTY_URL,
+    ORGANIZATION_ID,
+    QUEUED_MESSAGES,
+    RATE_LIMIT_PAUSE,
+    SESSION_TOKEN_COOKIE,
+    WEBSITE_ID,
+    LoyaltyResponse,
+    LoyaltyStatus,
+)
+from src.utils import json_codec
+from src.utils.rate_limiter import RateLimiter, get_rate_limiter
+
+
+# The HTTP client only accepts real dicts, keep one plain copy of every header set
+_PLAIN_HEADERS: Dict[int, dict] = {
+    id(headers): dict(headers)
+    for headers in (
+        API_HEADERS,
+        JSON_HEADERS,
+        FORM_HEADERS,
+        DOCUMENT_HEADERS,
+        CROSS_SITE_DOCUMENT_HEADERS,
+    )
+}
+
+
+RULE_GROUPS_PARAMS = {
+    "limit": "1000",
+    "websiteId": WEBSITE_ID,
+    "organizationId": ORGANIZATION_ID,
+}
+
+
+def _decode(text: str) -> Any:
+    if not text or text.lstrip()[:1] not in ("{", "["):
+        return None
+    try:
+        return json_codec.loads(text)
+    except json_codec.DecodeError:
+        return None
+
+
+def get_loyalty_rate_limiter() -> RateLimiter:
+    """Rate limiter shared by every account's requests to loyalty.campnetwork.xyz."""
+    return get_rate_limiter(
+        LOYALTY_RATE_LIMITER, LOYALTY_REQUESTS_PER_SECOND, LOYALTY_REQUESTS_BURST
+    )
+
+
+def classify(status_code: int, text: str, data: Any) -> LoyaltyStatus:
+    """Classify a Loyalty response from its status code, body and decoded JSON."""
+    if data is None and "Just a moment" in text:
+        return LoyaltyStatus.CLOUDFLARE
+    if any(marker in text for marker in ALREADY_DONE_MARKERS):
+        return LoyaltyStatus.ALREADY_DONE
+    if status_code == 304:
+        return LoyaltyStatus.NOT_MODIFIED
+    if status_code == 429 or (status_code != 200 and "Too many requests" in text):
+        return LoyaltyStatus.RATE_LIMITED
+    if "try again" in text:
+        return LoyaltyStatus.TRY_AGAIN
+    if status_code != 200:
+        return LoyaltyStatus.ERROR
+    if isinstance(data, dict) and data.get("message") in QUEUED_MESSAGES:
+        return LoyaltyStatus.QUEUED
+    return LoyaltyStatus.OK
+
+
+class LoyaltyApiClient:
+    """
+    HTTP client of loyalty.campnetwork.xyz for one account.
+
+    Sends precomputed header sets and the account's cookie jar (cf_clearance,
+    next-auth session and csrf tokens) with every request, keeps the session
+    token up to date from response cookies, and decodes every body once into a
+    classified LoyaltyResponse. All accounts share one rate limiter, which is
+    paused for everyone when the server answers "Too many requests".
+    """
+
+    def __init__(self, camp_network: CampNetworkProtocol):
+        self.camp_network = camp_network
+        self.cookies: Dict[str, str] = {
+            CALLBACK_URL_COOKIE: "https%3A%2F%2Floyalty.campnetwork.xyz"
+        }
+        # Only sent with OAuth navigations, next-auth checks it against its own cookie on login
+        self.csrf_token: Optional[str] = None
+
+    def _set_cookie(self, name: str, value: Optional[str]) -> None:
+        if value:
+            self.cookies[name] = value
+        else:
+            self.cookies.pop(name, None)
+
+    @property
+    def cf_clearance(self) -> Optional[str]:
+        return self.cookies.get("cf_clearance")
+
+    @cf_clearance.setter
+    def cf_clearance(self, value: Optional[str]) -> None:
+        self._set_cookie("cf_clearance", value)
+
+    @property
+    def session_token(self) -> Optional[str]:
+        return self.cookies.get(SESSION_TOKEN_COOKIE)
+
+    @session_token.setter
+    def session_token(self, value: Optional[str]) -> None:
+        self._set_cookie(SESSION_TOKEN_COOKIE, value)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str] = API_HEADERS,
+        send_csrf: bool = False,
+        extra_headers: Optional[Dict[str, str]] = None,
+        **kwargs,
+    ) -> LoyaltyResponse:
+        """
+        Send a request with the account's cookies and classify the response.
+
+        Args:
+            method: "get" or "post"
+            url: Absolute URL or a path on loyalty.campnetwork.xyz
+            headers: One of the header sets from constants
+            send_csrf: Also send the next-auth csrf token cookie
+            extra_headers: Per-request headers added on top of the header set
+            kwargs: params, json or data of the request
+        """
+        if url.startswith("/"):
+            url = LOYALTY_URL + url
+
+        cookies = self.cookies
+        if send_csrf and self.csrf_token:
+            cookies = cookies | {CSRF_TOKEN_COOKIE: self.csrf_token}
+
+        request_headers = _PLAIN_HEADERS[id(headers)]
+        if extra_headers:
+            request_headers = request_headers | extra_headers
+
+        limiter = get_loyalty_rate_limiter()
+        await limiter.acquire()
+        response = await getattr(self.camp_network.session, method)(
+            url,
+            headers=request_headers,
+            cookies=cookies,
+            **kwargs,
+        )
+
+        session_token = response.cookies.get(SESSION_TOKEN_COOKIE)
+        if session_token:
+            self.session_token = session_token
+
+        text = response.text
+        data = _decode(text)
+        status = classify(response.status_code, text, data)
+        if status is LoyaltyStatus.RATE_LIMITED:
+            logger.warning(
+                f"{self.camp_network.account_index} | Too many requests to Loyalty. Pausing all accounts for {RATE_LIMIT_PAUSE} seconds..."
+            )
+            limiter.pause(RATE_LIMIT_PAUSE)
+        return LoyaltyResponse(
+            status=status,
+            status_code=response.status_code,
+            text=text,
+            data=data,
+            url=str(response.url),
+            raw=response,
+        )
+
+    async def get(
+        self, url: str, headers: Mapping[str, str] = API_HEADERS, **kwargs
+    ) -> LoyaltyResponse:
+        return await self.request("get", url, headers, **kwargs)
+
+    async def post(
+        self, url: str, headers: Mapping[str, str] = JSON_HEADERS, **kwargs
+    ) -> LoyaltyResponse:
+        return await self.request("post", url, headers, **kwargs)
+
+    async def csrf(self) -> LoyaltyResponse:
+        return await self.get("/api/auth/csrf")
+
+    async def auth_session(self) -> LoyaltyResponse:
+        """next-auth session of the token, an empty object if the token is not accepted."""
+        return await self.get("/api/auth/session")
+
+    async def users(self) -> LoyaltyResponse:
+        return await self.get(
+            "/api/users",
+            params={
+                "walletAddress": self.camp_network.wallet.address,
+                "includeDelegation": "false",
+                "websiteId": WEBSITE_ID,
+                "organizationId": ORGANIZATION_ID,
+            },
+        )
+
+    async def update_user(self, user_id: str, json_data: dict) -> LoyaltyResponse:
+        return await self.post(f"/api/users/{user_id}", json=json_data)
+
+    async def accounts(self) -> LoyaltyResponse:
+        return await self.get(
+            "/api/loyalty/accounts",
+            params={
+                "limit": "1000",
+                "websiteId": WEBSITE_ID,
+                "organizationId": ORGANIZATION_ID,
+                "walletAddress": self.camp_network.wallet.address,
+            },
+        )
+
+    async def rule_groups(
+        self, etag: Optional[str] = None, last_modified: Optional[str] = None
+    ) -> LoyaltyResponse:
+        """Campaign list, conditional on a previously seen ETag or Last-Modified."""
+        conditional = {}
+        if etag:
+            conditional["if-none-match"] = etag
+        if last_modified:
+            conditional["if-modified-since"] = last_modified
+        return await self.get(
+            "/api/loyalty/rule_groups",
+            params=RULE_GROUPS_PARAMS,
+            extra_headers=conditional,
+        )
+
+    async def complete_rule(self, rule_id: str) -> LoyaltyResponse:
+        return await self.post(f"/api/loyalty/rules/{rule_id}/complete", json={})
+
+    async def rules_status(self, user_id: str) -> LoyaltyResponse:
+        return await self.get(
+            "/api/loyalty/rules/status",
+            params={
+                "websiteId": WEBSITE_ID,
+                "organizationId": ORGANIZATION_ID,
+                "userId": user_id,
+            },
+        )
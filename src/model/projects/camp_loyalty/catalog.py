@@ -0,0 +1,190 @@
+import asyncio
+import os
+import time
+from typing import Dict, List, Optional
+from loguru import logger
+
+from src.model.projects.camp_loyalty.api_client import LoyaltyApiClient
+from src.model.projects.camp_loyalty.constants import (
+    ALL_CAMPAIGNS_TASK,
+    DOABLE_QUESTS,
+    DOABLE_RULE_TYPES,
+    QUESTS_NAMES,
+    CampaignPlan,
+    LoyaltyStatus,
+)
+from src.utils import json_codec
+
+
+CATALOG_FILE = "data/loyalty_catalog.json"
+# The campaign list is refreshed (conditionally) after this many seconds
+CATALOG_TTL = 600
+
+
+def _is_doable(quest: dict) -> bool:
+    rule = quest["loyaltyRule"]
+    return rule["type"] in DOABLE_RULE_TYPES or rule["name"] in DOABLE_QUESTS
+
+
+def build_plans(campaigns: List[dict]) -> Dict[str, List[CampaignPlan]]:
+    """Index task name -> campaigns of the task -> quests the bot can do."""
+    all_plans = [
+        CampaignPlan(
+            name=campaign["name"],
+            quests=tuple(
+                quest for quest in campaign["loyaltyGroupItems"] if _is_doable(quest)
+            ),
+        )
+        for campaign in campaigns
+    ]
+    plans = {ALL_CAMPAIGNS_TASK: all_plans}
+    for task, campaign_name in QUESTS_NAMES.items():
+        plans[task] = [plan for plan in all_plans if plan.name == campaign_name]
+    return plans
+
+
+class CampaignCatalog:
+    """
+    Process-wide cache of the Loyalty campaign list.
+
+    The rule_groups response is the same for every account, so it is downloaded
+    once and shared. After CATALOG_TTL it is revalidated with If-None-Match /
+    If-Modified-Since, and a 304 keeps the cached copy. The last copy is kept on
+    disk for warm restarts. Doable quests per task are indexed once per copy.
+    """
+
+    def __init__(self, path: str = CATALOG_FILE, ttl: float = CATALOG_TTL):
+        self.path = path
+        self.ttl = ttl
+
+        self._campaigns: Optional[List[dict]] = None
+        self._plans: Dict[str, List[CampaignPlan]] = {}
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._fetched_at = 0.0
+        self._loaded = False
+        self._lock = asyncio.Lock()
+
+        self.hits = 0
+        self.downloads = 0
+        self.not_modified = 0
+
+    def _fresh(self) -> bool:
+        return self._campaigns is not None and time.time() - self._fetched_at < self.ttl
+
+    async def campaigns(self, api: LoyaltyApiClient) -> List[dict]:
+        """
+        Get the campaign list, refreshing it through the account's API client if stale.
+
+        Args:
+            api: Loyalty client of the account that asks, used only for refreshes
+        """
+        self._load()
+        if self._fresh():
+            self.hits += 1
+            return self._campaigns
+
+        async with self._lock:
+            # Another account may have refreshed it while we waited
+            if self._fresh():
+                self.hits += 1
+                return self._campaigns
+            await self._refresh(api)
+            return self._campaigns
+
+    async def plans(self, api: LoyaltyApiClient, task: str) -> List[CampaignPlan]:
+        """Campaigns of a camp_loyalty_* task with their doable quests."""
+        await self.campaigns(api)
+        return self._plans.get(task, [])
+
+    async def _refresh(self, api: LoyaltyApiClient) -> None:
+        response = await api.rule_groups(
+            etag=self._etag if self._campaigns is not None else None,
+            last_modified=self._last_modified if self._campaigns is not None else None,
+        )
+
+        if response.status is LoyaltyStatus.NOT_MODIFIED:
+            self.not_modified += 1
+            self._fetched_at = time.time()
+            self._save()
+            return
+
+        if response.status_code != 200:
+            raise Exception(
+                f"Failed to get all campaigns: {response.status_code} | {response.text}"
+            )
+
+        self.downloads += 1
+        self._set(
+            response.data["data"],
+            response.header("etag"),
+            response.header("last-modified"),
+            time.time(),
+        )
+        self._save()
+
+    def _set(
+        self,
+        campaigns: List[dict],
+        etag: Optional[str],
+        last_modified: Optional[str],
+        fetched_at: float,
+    ) -> None:
+        self._campaigns = campaigns
+        self._plans = build_plans(campaigns)
+        self._etag = etag
+        self._last_modified = last_modified
+        self._fetched_at = fetched_at
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "rb") as file:
+                cached = json_codec.loads(file.read())
+            self._set(
+                cached["campaigns"],
+                cached.get("etag"),
+                cached.get("last_modified"),
+                cached.get("fetched_at", 0.0),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to load Loyalty campaigns from {self.path}: {str(e)}")
+
+    def _save(self) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "wb") as file:
+                file.write(
+                    json_codec.dumps_bytes(
+                        {
+                            "campaigns": self._campaigns,
+                            "etag": self._etag,
+                            "last_modified": self._last_modified,
+                            "fetched_at": self._fetched_at,
+                        }
+                    )
+                )
+        except Exception as e:
+            logger.warning(f"Failed to save Loyalty campaigns to {self.path}: {str(e)}")
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "downloads": self.downloads,
+            "not_modified": self.not_modified,
+        }
+
+
+_campaign_catalog: Optional[CampaignCatalog] = None
+
+
+def get_campaign_catalog() -> CampaignCatalog:
+    """Get the process-wide Loyalty campaign catalog."""
+    global _campaign_catalog
+    if _campaign_catalog is None:
+        _campaign_catalog = CampaignCatalog()
+    return _campaign_catalog
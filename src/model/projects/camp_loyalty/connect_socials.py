@@ -3,7 +3,12 @@ import asyncio
 import secrets
 from loguru import logger
 
-from src.model.projects.camp_loyalty.constants import CampLoyaltyProtocol
+from src.model.projects.camp_loyalty.constants import (
+    CROSS_SITE_DOCUMENT_HEADERS,
+    DOCUMENT_HEADERS,
+    CampLoyaltyProtocol,
+)
+from src.utils import json_codec
 from src.utils.decorators import retry_async
 
 
@@ -81,37 +86,8 @@ class ConnectLoyaltySocials:
                 f"{self.camp_loyalty.camp_network.account_index} | Starting connect twitter..."
             )
 
-            cookies = {
-                "__Secure-next-auth.callback-url": "https%3A%2F%2Floyalty.campnetwork.xyz",
-                "cf_clearance": self.camp_loyalty.cf_clearance,
-                "__Secure-next-auth.session-token": self.camp_loyalty.login_session_token,
-                "__Secure-next-auth.csrf-token": self.camp_loyalty.login_csrf_token,
-            }
-
-            headers = {
-                "cache-control": "max-age=0",
-                "sec-ch-ua": '"Chromium";v="133", "Google Chrome";v="133", "Not.A/Brand";v="99"',
-                "sec-ch-ua-mobile": "?0",
-                "sec-ch-ua-arch": '"x86"',
-                "sec-ch-ua-platform": '"Windows"',
-                "sec-ch-ua-model": '""',
-                "sec-ch-ua-bitness": '"64"',
-                "origin": "https://loyalty.campnetwork.xyz",
-                "content-type": "application/x-www-form-urlencoded",
-                "upgrade-insecure-requests": "1",
-                "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36",
-                "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-                "sec-fetch-site": "same-origin",
-                "sec-fetch-mode": "navigate",
-                "sec-fetch-dest": "document",
-                "accept-language": "ru,en-US;q=0.9,en;q=0.8,ru-RU;q=0.7,zh-TW;q=0.6,zh;q=0.5,uk;q=0.4",
-                "priority": "u=0, i",
-            }
-
-            response = await self.camp_loyalty.camp_network.session.get(
-                "https://loyalty.campnetwork.xyz/api/twitter/auth",
-                cookies=cookies,
-                headers=headers,
+            response = await self.camp_loyalty.api.get(
+                "/api/twitter/auth", DOCUMENT_HEADERS, send_csrf=True
             )
 
             response_url = response.url
@@ -155,12 +131,13 @@ class ConnectLoyaltySocials:
             if "X / Error" in response.text:
                 raise Exception("X error. Just try again, if it doesn't work, change the token. Platform bugs :)")
             
-            if not response.json().get("auth_code"):
+            authorization = json_codec.response_json(response)
+            if not authorization.get("auth_code"):
                 raise Exception(
                     f"Failed to connect twitter: no auth_code in response: {response.status_code} | {response.text}"
                 )
 
-            auth_code = response.json().get("auth_code")
+            auth_code = authorization.get("auth_code")
 
             data = {
                 "approval": "true",
@@ -171,39 +148,16 @@ class ConnectLoyaltySocials:
                 "https://x.com/i/api/2/oauth2/authorize", headers=headers, data=data
             )
 
-            redirect_url = response.json()["redirect_uri"]
+            redirect_url = json_codec.response_json(response)["redirect_uri"]
             code = redirect_url.split("code=")[1]
 
-            headers = {
-                "upgrade-insecure-requests": "1",
-                "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36",
-                "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-                "sec-ch-ua": '"Chromium";v="133", "Google Chrome";v="133", "Not.A/Brand";v="99"',
-                "sec-ch-ua-mobile": "?0",
-                "sec-ch-ua-arch": '"x86"',
-                "sec-ch-ua-platform": '"Windows"',
-                "sec-ch-ua-model": '""',
-                "sec-ch-ua-bitness": '"64"',
-                "sec-fetch-site": "cross-site",
-                "sec-fetch-mode": "navigate",
-                "sec-fetch-user": "?1",
-                "sec-fetch-dest": "document",
-                "accept-language": "ru,en-US;q=0.9,en;q=0.8,ru-RU;q=0.7,zh-TW;q=0.6,zh;q=0.5,uk;q=0.4",
-                "priority": "u=0, i",
-            }
-
-            cookies = {
-                "cf_clearance": self.camp_loyalty.cf_clearance,
-                "__Secure-next-auth.session-token": self.camp_loyalty.login_session_token,
-                "__Secure-next-auth.callback-url": "https://loyalty.campnetwork.xyz",
-                "__Secure-next-auth.csrf-token": self.camp_loyalty.login_csrf_token,
-            }
-
-            response = await self.camp_loyalty.camp_network.session.get(
-                f"https://loyalty.campnetwork.xyz/api/twitter/auth/connect?code={code}&state={state}",
-                cookies=cookies,
-                headers=headers,
+            response = await self.camp_loyalty.api.get(
+                f"/api/twitter/auth/connect?code={code}&state={state}",
+                CROSS_SITE_DOCUMENT_HEADERS,
+                send_csrf=True,
             )
+            # The connection changed the user, check it with fresh info
+            self.camp_loyalty.invalidate_user_info()
 
             random_pause = random.randint(5, 10)
             logger.info(
@@ -253,36 +207,8 @@ class ConnectLoyaltySocials:
                 f"{self.camp_loyalty.camp_network.account_index} | Starting connect discord..."
             )
 
-            cookies = {
-                "__Secure-next-auth.callback-url": "https%3A%2F%2Floyalty.campnetwork.xyz",
-                "cf_clearance": self.camp_loyalty.cf_clearance,
-                "__Secure-next-auth.session-token": self.camp_loyalty.login_session_token,
-                "__Secure-next-auth.csrf-token": self.camp_loyalty.login_csrf_token,
-            }
-
-            headers = {
-                "sec-ch-ua": '"Chromium";v="133", "Google Chrome";v="133", "Not.A/Brand";v="99"',
-                "sec-ch-ua-mobile": "?0",
-                "sec-ch-ua-arch": '"x86"',
-                "sec-ch-ua-platform": '"Windows"',
-                "sec-ch-ua-model": '""',
-                "sec-ch-ua-bitness": '"64"',
-                "upgrade-insecure-requests": "1",
-                "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36",
-                "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-                "sec-fetch-site": "same-origin",
-                "sec-fetch-mode": "navigate",
-                "sec-fetch-user": "?1",
-                "sec-fetch-dest": "document",
-                "referer": "https://loyalty.campnetwork.xyz/home?editProfile=1&modalTab=social",
-                "accept-language": "ru,en-US;q=0.9,en;q=0.8,ru-RU;q=0.7,zh-TW;q=0.6,zh;q=0.5,uk;q=0.4",
-                "priority": "u=0, i",
-            }
-
-            response = await self.camp_loyalty.camp_network.session.get(
-                "https://loyalty.campnetwork.xyz/api/discord/auth",
-                cookies=cookies,
-                headers=headers,
+            response = await self.camp_loyalty.api.get(
+                "/api/discord/auth", DOCUMENT_HEADERS, send_csrf=True
             )
 
             response_url = response.url
@@ -357,7 +283,8 @@ class ConnectLoyaltySocials:
                 json=json_data,
             )
 
-            if not response.json()["location"]:
+            location = json_codec.response_json(response)["location"]
+            if not location:
                 raise Exception("Failed to connect discord: no location in response")
 
             headers = {
@@ -366,38 +293,15 @@ class ConnectLoyaltySocials:
                 "upgrade-insecure-requests": "1",
             }
 
-            code = response.json()["location"].split("code=")[1].split("&")[0]
-
-            headers = {
-                "upgrade-insecure-requests": "1",
-                "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36",
-                "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-                "sec-ch-ua": '"Chromium";v="133", "Google Chrome";v="133", "Not.A/Brand";v="99"',
-                "sec-ch-ua-mobile": "?0",
-                "sec-ch-ua-arch": '"x86"',
-                "sec-ch-ua-platform": '"Windows"',
-                "sec-ch-ua-model": '""',
-                "sec-ch-ua-bitness": '"64"',
-                "sec-fetch-site": "cross-site",
-                "sec-fetch-mode": "navigate",
-                "sec-fetch-user": "?1",
-                "sec-fetch-dest": "document",
-                "accept-language": "ru,en-US;q=0.9,en;q=0.8,ru-RU;q=0.7,zh-TW;q=0.6,zh;q=0.5,uk;q=0.4",
-                "priority": "u=0, i",
-            }
-
-            cookies = {
-                "cf_clearance": self.camp_loyalty.cf_clearance,
-                "__Secure-next-auth.session-token": self.camp_loyalty.login_session_token,
-                "__Secure-next-auth.callback-url": "https://loyalty.campnetwork.xyz",
-                "__Secure-next-auth.csrf-token": self.camp_loyalty.login_csrf_token,
-            }
+            code = location.split("code=")[1].split("&")[0]
 
-            response = await self.camp_loyalty.camp_network.session.get(
-                f"https://loyalty.campnetwork.xyz/api/discord/auth/connect?code={code}&state={state}",
-                cookies=cookies,
-                headers=headers,
+            response = await self.camp_loyalty.api.get(
+                f"/api/discord/auth/connect?code={code}&state={state}",
+                CROSS_SITE_DOCUMENT_HEADERS,
+                send_csrf=True,
             )
+            # The connection changed the user, check it with fresh info
+            self.camp_loyalty.invalidate_user_info()
 
             random_pause = random.randint(5, 10)
             logger.info(
@@ -451,31 +355,6 @@ class ConnectLoyaltySocials:
                 f"{self.camp_loyalty.camp_network.account_index} | Starting set display name at Loyalty..."
             )
 
-            cookies = {
-                "__Secure-next-auth.callback-url": "https://loyalty.campnetwork.xyz",
-                "cf_clearance": self.camp_loyalty.cf_clearance,
-                "__Secure-next-auth.session-token": self.camp_loyalty.login_session_token,
-            }
-
-            headers = {
-                "accept": "application/json, text/plain, */*",
-                "accept-language": "ru,en-US;q=0.9,en;q=0.8,ru-RU;q=0.7,zh-TW;q=0.6,zh;q=0.5,uk;q=0.4",
-                "content-type": "application/json",
-                "origin": "https://loyalty.campnetwork.xyz",
-                "priority": "u=1, i",
-                "referer": "https://loyalty.campnetwork.xyz/home?editProfile=1&modalTab=about",
-                "sec-ch-ua": '"Chromium";v="133", "Google Chrome";v="133", "Not.A/Brand";v="99"',
-                "sec-ch-ua-arch": '"x86"',
-                "sec-ch-ua-bitness": '"64"',
-                "sec-ch-ua-mobile": "?0",
-                "sec-ch-ua-model": '""',
-                "sec-ch-ua-platform": '"Windows"',
-                "sec-fetch-dest": "empty",
-                "sec-fetch-mode": "cors",
-                "sec-fetch-site": "same-origin",
-                "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36",
-            }
-
             # Generate random username 6-10 chars, max 2 consecutive vowels or consonants
             vowels = "aeiouy"
             consonants = "bcdfghjklmnpqrstvwxz"
@@ -520,14 +399,10 @@ class ConnectLoyaltySocials:
 
             user_id = account_info["data"][0]["id"]
 
-            response = await self.camp_loyalty.camp_network.session.post(
-                f"https://loyalty.campnetwork.xyz/api/users/{user_id}",
-                cookies=cookies,
-                headers=headers,
-                json=json_data,
-            )
+            response = await self.camp_loyalty.api.update_user(user_id, json_data)
 
-            if response.json()["success"]:
+            if isinstance(response.data, dict) and response.data.get("success"):
+                self.camp_loyalty.invalidate_user_info()
                 logger.success(
                     f"{self.camp_loyalty.camp_network.account_index} | Successfully set display name at Loyalty: {json_data['displayName']}"
                 )
@@ -1,5 +1,7 @@
 from dataclasses import dataclass
-from typing import Protocol
+from enum import Enum
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Protocol
 from primp import AsyncClient
 from eth_account import Account
 
@@ -8,15 +10,206 @@ from src.model.help.cookies import CookieDatabase
 from src.model.onchain.web3_custom import Web3Custom
 from src.utils.config import Config
 
+if TYPE_CHECKING:
+    from src.model.projects.camp_loyalty.api_client import LoyaltyApiClient
+    from src.model.projects.camp_loyalty.status_poller import QuestStatusPoller
+
 
 class CampLoyaltyProtocol(Protocol):
     """Protocol class for CampLoyalty type hints to avoid circular imports"""
 
     camp_network: CampNetworkProtocol
+    api: "LoyaltyApiClient"
+    status_poller: "QuestStatusPoller"
     cookie_db: CookieDatabase
     cf_clearance: str
     login_session_token: str
     login_csrf_token: str
+    user_info: dict | None
+    quests_skipped: int
     
-    async def get_account_info(self) -> dict | None: ...
-    async def get_user_info(self) -> dict | None: ...
+    async def get_account_info(self, refresh: bool = False) -> dict | None: ...
+    async def get_user_info(self, refresh: bool = False) -> dict | None: ...
+    def invalidate_user_info(self) -> None: ...
+    async def get_completed_rules(self) -> set[str]: ...
+    async def mark_rule_completed(self, rule_id: str): ...
+
+
+# task: campaign name
+QUESTS_NAMES = {
+    "camp_loyalty_storychain": "StoryChain",
+    "camp_loyalty_token_tails": "Token Tails",
+    "camp_loyalty_awana": "AWANA",
+    "camp_loyalty_pictographs": "Pictographs",
+    "camp_loyalty_hitmakr": "Hitmakr",
+    "camp_loyalty_panenka": "Panenka",
+    "camp_loyalty_scoreplay": "Scoreplay",
+    "camp_loyalty_wide_worlds": "Wide Worlds",
+    "camp_loyalty_entertainm": "EntertainM",
+    "camp_loyalty_rewarded_tv": "RewardedTV",
+    "camp_loyalty_sporting_cristal": "Sporting Cristal",
+    "camp_loyalty_belgrano": "Belgrano",
+    "camp_loyalty_arcoin": "ARCOIN",
+    "camp_loyalty_kraft": "Kraft",
+    "camp_loyalty_summitx": "SummitX",
+    "camp_loyalty_pixudi": "Pixudi",
+    "camp_loyalty_clusters": "Clusters",
+    "camp_loyalty_jukeblox": "JukeBlox",
+    "camp_loyalty_camp_network": "Camp Network",
+}
+
+
+DOABLE_QUESTS = [
+    "Mint Pictographs Memory Card",
+    "Create your Bleetz GamerID",
+    # "Login to AWANA for the First Time"
+]
+# Rule types completed by the bot itself, other rules only if listed in DOABLE_QUESTS
+DOABLE_RULE_TYPES = ("drip_x_follow", "link_click")
+# Rule types that are plain server-side acknowledgements, safe to submit concurrently
+INDEPENDENT_RULE_TYPES = ("link_click",)
+# Task that completes every campaign
+ALL_CAMPAIGNS_TASK = "camp_loyalty_complete_quests"
+
+
+@dataclass(frozen=True)
+class CampaignPlan:
+    """A campaign and the quests of it the bot can complete."""
+
+    name: str
+    quests: tuple
+
+
+LOYALTY_URL = "https://loyalty.campnetwork.xyz"
+WEBSITE_ID = "32afc5c9-f0fb-4938-9572-775dee0b4a2b"
+ORGANIZATION_ID = "26a1764f-5637-425e-89fa-2f3fb86e758c"
+
+SESSION_TOKEN_COOKIE = "__Secure-next-auth.session-token"
+CSRF_TOKEN_COOKIE = "__Secure-next-auth.csrf-token"
+CALLBACK_URL_COOKIE = "__Secure-next-auth.callback-url"
+
+# Requests to loyalty.campnetwork.xyz are shared by all accounts under one limit
+LOYALTY_RATE_LIMITER = "loyalty.campnetwork.xyz"
+LOYALTY_REQUESTS_PER_SECOND = 5
+LOYALTY_REQUESTS_BURST = 10
+# Every account holds off this many seconds after a "Too many requests" answer
+RATE_LIMIT_PAUSE = 10
+
+# Status of a queued quest is first checked after FAST_POLL_INTERVAL seconds, every check
+# without a final status stretches the interval by POLL_BACKOFF up to SLOW_POLL_INTERVAL
+FAST_POLL_INTERVAL = 3
+POLL_BACKOFF = 1.6
+SLOW_POLL_INTERVAL = 30
+
+# Accounts whose quest statuses are requested together in one background sweep
+VERIFY_BATCH_SIZE = 20
+# A quest that comes back as "try again" is done and submitted again at most this many times
+MAX_QUEST_REQUEUES = 2
+
+
+_BROWSER_HEADERS = {
+    "accept-language": "ru,en-US;q=0.9,en;q=0.8,ru-RU;q=0.7,zh-TW;q=0.6,zh;q=0.5,uk;q=0.4",
+    "sec-ch-ua": '"Chromium";v="133", "Google Chrome";v="133", "Not.A/Brand";v="99"',
+    "sec-ch-ua-arch": '"x86"',
+    "sec-ch-ua-bitness": '"64"',
+    "sec-ch-ua-mobile": "?0",
+    "sec-ch-ua-model": '""',
+    "sec-ch-ua-platform": '"Windows"',
+    "sec-ch-ua-platform-version": '"19.0.0"',
+    "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36",
+}
+
+_FETCH_HEADERS = _BROWSER_HEADERS | {
+    "priority": "u=1, i",
+    "referer": f"{LOYALTY_URL}/loyalty",
+    "sec-fetch-dest": "empty",
+    "sec-fetch-mode": "cors",
+    "sec-fetch-site": "same-origin",
+}
+
+_DOCUMENT_HEADERS = _BROWSER_HEADERS | {
+    "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
+    "priority": "u=0, i",
+    "sec-fetch-dest": "document",
+    "sec-fetch-mode": "navigate",
+    "sec-fetch-user": "?1",
+    "upgrade-insecure-requests": "1",
+}
+
+# Header sets of Loyalty requests, built once and never modified
+API_HEADERS = MappingProxyType(_FETCH_HEADERS | {"accept": "application/json, text/plain, */*"})
+JSON_HEADERS = MappingProxyType(
+    _FETCH_HEADERS
+    | {
+        "accept": "application/json, text/plain, */*",
+        "content-type": "application/json",
+        "origin": LOYALTY_URL,
+    }
+)
+FORM_HEADERS = MappingProxyType(
+    _FETCH_HEADERS
+    | {
+        "accept": "*/*",
+        "content-type": "application/x-www-form-urlencoded",
+        "origin": LOYALTY_URL,
+    }
+)
+DOCUMENT_HEADERS = MappingProxyType(_DOCUMENT_HEADERS | {"sec-fetch-site": "same-origin"})
+# Redirects back from X and Discord OAuth pages
+CROSS_SITE_DOCUMENT_HEADERS = MappingProxyType(_DOCUMENT_HEADERS | {"sec-fetch-site": "cross-site"})
+
+
+class LoyaltyStatus(Enum):
+    OK = "ok"
+    # Cloudflare challenge page, cf_clearance expired
+    CLOUDFLARE = "cloudflare"
+    RATE_LIMITED = "rate_limited"
+    # Rule was already rewarded or the link already clicked
+    ALREADY_DONE = "already_done"
+    # Completion request accepted and queued for verification
+    QUEUED = "queued"
+    # Verification failed, the quest has to be done again
+    TRY_AGAIN = "try_again"
+    # Conditional request, the cached copy is still current
+    NOT_MODIFIED = "not_modified"
+    ERROR = "error"
+
+
+ALREADY_DONE_MARKERS = (
+    "You have already been rewarded",
+    "You have already clicked the link",
+)
+QUEUED_MESSAGES = (
+    "Completion request added to queue",
+    "Link click being verified, come back later to check the status",
+)
+
+
+@dataclass
+class LoyaltyResponse:
+    """A Loyalty API response, decoded once and classified."""
+
+    status: LoyaltyStatus
+    status_code: int
+    text: str
+    data: Any
+    url: str
+    raw: Any
+
+    @property
+    def ok(self) -> bool:
+        return self.status in (LoyaltyStatus.OK, LoyaltyStatus.QUEUED)
+
+    def header(self, name: str) -> Optional[str]:
+        """Response header by case-insensitive name."""
+        name = name.lower()
+        for key, value in self.raw.headers.items():
+            if key.lower() == name:
+                return value
+        return None
+
+    @property
+    def reason(self) -> str:
+        if isinstance(self.data, dict):
+            return str(self.data.get("reason") or self.data.get("message") or self.text)
+        return self.text
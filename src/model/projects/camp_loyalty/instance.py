@@ -8,6 +8,13 @@ import aiohttp
 
 from src.model.projects.camp_loyalty.quests import LoyaltyQuests
 from src.model.projects.camp_loyalty.connect_socials import ConnectLoyaltySocials
+from src.model.projects.camp_loyalty.api_client import LoyaltyApiClient
+from src.model.projects.camp_loyalty.status_poller import QuestStatusPoller
+from src.model.projects.camp_loyalty.constants import (
+    DOCUMENT_HEADERS,
+    FORM_HEADERS,
+    LoyaltyStatus,
+)
 from src.model.help.captcha import Solvium
 from src.model.help.cookies import CookieDatabase
 from src.model.camp_network.constants import CampNetworkProtocol
@@ -18,12 +25,46 @@ class CampLoyalty:
     def __init__(self, instance: CampNetworkProtocol):
         self.camp_network = instance
 
-        self.cf_clearance = None
+        self.api = LoyaltyApiClient(instance)
         self.cookie_db = CookieDatabase()
+        self.status_poller = QuestStatusPoller(
+            self, instance.config.LOYALTY.MAX_ATTEMPTS_TO_COMPLETE_QUEST
+        )
 
-        self.login_session_token: str | None = None
-        self.login_csrf_token: str | None = None
         self.user_info: dict | None = None
+        self.account_info: dict | None = None
+        # Set when the account was changed, the next get_*_info call refetches
+        self._user_info_stale = False
+        self._account_info_stale = False
+        self.info_requests = 0
+        self.info_requests_avoided = 0
+        # Rule IDs known to be completed, loaded once per run
+        self.completed_rules: set[str] | None = None
+        self.quests_skipped = 0
+
+    @property
+    def cf_clearance(self) -> str | None:
+        return self.api.cf_clearance
+
+    @cf_clearance.setter
+    def cf_clearance(self, value: str | None):
+        self.api.cf_clearance = value
+
+    @property
+    def login_session_token(self) -> str | None:
+        return self.api.session_token
+
+    @login_session_token.setter
+    def login_session_token(self, value: str | None):
+        self.api.session_token = value
+
+    @property
+    def login_csrf_token(self) -> str | None:
+        return self.api.csrf_token
+
+    @login_csrf_token.setter
+    def login_csrf_token(self, value: str | None):
+        self.api.csrf_token = value
 
     async def execute_quest(self, task: str) -> bool:
         task = task.lower()
@@ -47,31 +88,9 @@ class CampLoyalty:
                     f"{self.camp_network.account_index} | Using existing Cloudflare cookie from database"
                 )
             else:
-                headers = {
-                    "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-                    "accept-language": "ru,en-US;q=0.9,en;q=0.8,ru-RU;q=0.7,zh-TW;q=0.6,zh;q=0.5,uk;q=0.4",
-                    "cache-control": "max-age=0",
-                    "priority": "u=0, i",
-                    "sec-ch-ua": '"Chromium";v="133", "Google Chrome";v="133", "Not.A/Brand";v="24"',
-                    "sec-ch-ua-arch": '"x86"',
-                    "sec-ch-ua-bitness": '"64"',
-                    "sec-ch-ua-mobile": "?0",
-                    "sec-ch-ua-model": '""',
-                    "sec-ch-ua-platform": '"Windows"',
-                    "sec-ch-ua-platform-version": '"19.0.0"',
-                    "sec-fetch-dest": "document",
-                    "sec-fetch-mode": "navigate",
-                    "sec-fetch-site": "same-origin",
-                    "sec-fetch-user": "?1",
-                    "upgrade-insecure-requests": "1",
-                    "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36",
-                }
-
-                response = await self.camp_network.session.get(
-                    "https://loyalty.campnetwork.xyz/loyalty", headers=headers
-                )
+                response = await self.api.get("/loyalty", DOCUMENT_HEADERS)
 
-                if "Just a moment" in response.text:
+                if response.status is LoyaltyStatus.CLOUDFLARE:
                     logger.info(
                         f"{self.camp_network.account_index} | Cloudflare challenge detected. Solving..."
                     )
@@ -98,7 +117,7 @@ class CampLoyalty:
                     )
                     cf_clearance = await solvium.solve_cf_clearance(
                         pageurl="https://loyalty.campnetwork.xyz/loyalty",
-                        body_b64=base64.b64encode(response.content).decode(),
+                        body_b64=base64.b64encode(response.raw.content).decode(),
                         proxy=self.camp_network.proxy,
                     )
                     if cf_clearance:
@@ -114,6 +133,10 @@ class CampLoyalty:
                     else:
                         raise Exception("Failed to solve Cloudflare challenge")
 
+            # A session saved by an earlier run spares the whole sign-in exchange
+            if await self._restore_session():
+                return True
+
             current_time = (
                 datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
             )
@@ -138,26 +161,6 @@ class CampLoyalty:
                 message_to_sign, self.camp_network.wallet
             )
 
-            headers = {
-                "accept": "*/*",
-                "accept-language": "ru,en-US;q=0.9,en;q=0.8,ru-RU;q=0.7,zh-TW;q=0.6,zh;q=0.5,uk;q=0.4",
-                "content-type": "application/x-www-form-urlencoded",
-                "origin": "https://loyalty.campnetwork.xyz",
-                "priority": "u=1, i",
-                "referer": "https://loyalty.campnetwork.xyz/loyalty",
-                "sec-ch-ua": '"Chromium";v="135", "Google Chrome";v="135", "Not.A/Brand";v="99"',
-                "sec-ch-ua-arch": '"x86"',
-                "sec-ch-ua-bitness": '"64"',
-                "sec-ch-ua-mobile": "?0",
-                "sec-ch-ua-model": '""',
-                "sec-ch-ua-platform": '"Windows"',
-                "sec-ch-ua-platform-version": '"19.0.0"',
-                "sec-fetch-dest": "empty",
-                "sec-fetch-mode": "cors",
-                "sec-fetch-site": "same-origin",
-                "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36",
-            }
-
             data = {
                 "message": '{"domain":"loyalty.campnetwork.xyz","address":"'
                 + self.camp_network.wallet.address
@@ -177,22 +180,24 @@ class CampLoyalty:
                 "json": "true",
             }
 
-            response = await self.camp_network.session.post(
-                "https://loyalty.campnetwork.xyz/api/auth/callback/credentials",
-                headers=headers,
-                data=data,
-                cookies={"cf_clearance": self.cf_clearance},
+            # A session token in the response cookies is the only sign of success
+            self.login_session_token = None
+            await self.api.post(
+                "/api/auth/callback/credentials", FORM_HEADERS, data=data
             )
 
-            cookies = response.cookies
-            self.login_session_token = cookies.get("__Secure-next-auth.session-token")
-
             if self.login_session_token:
                 logger.success(
                     f"{self.camp_network.account_index} | Login to Loyalty is successful!"
                 )
 
                 self.user_info = await self.get_user_info()
+                if self.user_info:
+                    await self.cookie_db.save_loyalty_session(
+                        self.camp_network.private_key,
+                        self.login_session_token,
+                        self.user_info,
+                    )
 
                 return True
             else:
@@ -209,26 +214,49 @@ class CampLoyalty:
             await asyncio.sleep(random_pause)
             raise
 
+    async def _restore_session(self) -> bool:
+        """Reuse the session token saved by an earlier run if Loyalty still accepts it"""
+        saved = await self.cookie_db.get_valid_loyalty_session(
+            self.camp_network.private_key
+        )
+        if not saved:
+            return False
+
+        self.login_session_token = saved["session_token"]
+        response = await self.api.auth_session()
+        if not (isinstance(response.data, dict) and response.data.get("user")):
+            self.login_session_token = None
+            if response.status_code == 200:
+                logger.info(
+                    f"{self.camp_network.account_index} | Saved Loyalty session is no longer valid. Logging in again..."
+                )
+                await self.cookie_db.delete_loyalty_session(
+                    self.camp_network.private_key
+                )
+            return False
+
+        self.user_info = saved["user_info"]
+        # next-auth may have rolled the token over
+        if self.login_session_token != saved["session_token"]:
+            await self.cookie_db.save_loyalty_session(
+                self.camp_network.private_key,
+                self.login_session_token,
+                self.user_info,
+            )
+        logger.success(
+            f"{self.camp_network.account_index} | Using saved Loyalty session from database"
+        )
+        return True
+
     @retry_async(default_value=None)
     async def _get_nonce(self) -> str:
         try:
-            headers = {
-                "accept": "*/*",
-                "content-type": "application/json",
-                "referer": "https://loyalty.campnetwork.xyz/loyalty",
-                "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36",
-            }
-
-            response = await self.camp_network.session.get(
-                "https://loyalty.campnetwork.xyz/api/auth/csrf",
-                headers=headers,
-                cookies={"cf_clearance": self.cf_clearance},
-            )
+            response = await self.api.csrf()
 
             if response.status_code != 200:
                 raise Exception(f"Failed to get nonce: {response.status_code}")
 
-            return response.json()["csrfToken"]
+            return response.data["csrfToken"]
 
         except Exception as e:
             random_pause = random.randint(
@@ -241,9 +269,14 @@ class CampLoyalty:
             await asyncio.sleep(random_pause)
             raise
 
+    def invalidate_user_info(self):
+        """Refetch user and account info on next use, after the account was changed"""
+        self._user_info_stale = True
+        self._account_info_stale = True
+
     @retry_async(default_value=None)
-    async def get_user_info(self) -> dict:
-        """Get user info from Loyalty
+    async def get_user_info(self, refresh: bool = False) -> dict:
+        """Get user info from Loyalty, memoized until invalidate_user_info is called
         Exampple:
         {
             "data": [
@@ -297,42 +330,24 @@ class CampLoyalty:
             "hasNextPage": false
         }
         """
-        try:
-            headers = {
-                "accept": "application/json, text/plain, */*",
-                "accept-language": "ru,en-US;q=0.9,en;q=0.8,ru-RU;q=0.7,zh-TW;q=0.6,zh;q=0.5,uk;q=0.4",
-                "priority": "u=1, i",
-                "referer": "https://loyalty.campnetwork.xyz/loyalty",
-                "sec-ch-ua": '"Chromium";v="133", "Google Chrome";v="133", "Not.A/Brand";v="99"',
-                "sec-ch-ua-arch": '"x86"',
-                "sec-ch-ua-bitness": '"64"',
-                "sec-ch-ua-mobile": "?0",
-                "sec-ch-ua-model": '""',
-                "sec-ch-ua-platform": '"Windows"',
-                "sec-fetch-dest": "empty",
-                "sec-fetch-mode": "cors",
-                "sec-fetch-site": "same-origin",
-                "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36",
-            }
+        if self.user_info is not None and not refresh and not self._user_info_stale:
+            self.info_requests_avoided += 1
+            return self.user_info
 
-            params = {
-                "walletAddress": self.camp_network.wallet.address,
-                "includeDelegation": "false",
-                "websiteId": "32afc5c9-f0fb-4938-9572-775dee0b4a2b",
-                "organizationId": "26a1764f-5637-425e-89fa-2f3fb86e758c",
-            }
-
-            response = await self.camp_network.session.get(
-                "https://loyalty.campnetwork.xyz/api/users",
-                params=params,
-                cookies={"cf_clearance": self.cf_clearance},
-                headers=headers,
-            )
-            await self.update_session_token(response.cookies)
+        try:
+            self.info_requests += 1
+            response = await self.api.users()
             if response.status_code != 200:
                 raise Exception(f"Failed to get user info: {response.status_code}")
 
-            return response.json()
+            self.user_info = response.data
+            self._user_info_stale = False
+            # Keep the copy saved with the session current
+            if self.login_session_token:
+                await self.cookie_db.update_loyalty_user_info(
+                    self.camp_network.private_key, self.user_info
+                )
+            return self.user_info
 
         except Exception as e:
             random_pause = random.randint(
@@ -346,8 +361,8 @@ class CampLoyalty:
             raise
 
     @retry_async(default_value=None)
-    async def get_account_info(self) -> dict:
-        """Get user info from Loyalty
+    async def get_account_info(self, refresh: bool = False) -> dict:
+        """Get account info from Loyalty, memoized until invalidate_user_info is called
         Exampple:
         {
             "data": [
@@ -385,45 +400,24 @@ class CampLoyalty:
             "hasNextPage": false
         }
         """
-        try:
-
-            headers = {
-                "accept": "*/*",
-                "accept-language": "ru,en-US;q=0.9,en;q=0.8,ru-RU;q=0.7,zh-TW;q=0.6,zh;q=0.5,uk;q=0.4",
-                "priority": "u=1, i",
-                "referer": "https://loyalty.campnetwork.xyz/loyalty",
-                "sec-ch-ua": '"Chromium";v="133", "Google Chrome";v="133", "Not.A/Brand";v="99"',
-                "sec-ch-ua-arch": '"x86"',
-                "sec-ch-ua-bitness": '"64"',
-                "sec-ch-ua-mobile": "?0",
-                "sec-ch-ua-model": '""',
-                "sec-ch-ua-platform": '"Windows"',
-                "sec-fetch-dest": "empty",
-                "sec-fetch-mode": "cors",
-                "sec-fetch-site": "same-origin",
-                "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36",
-            }
-
-            params = {
-                "limit": "1000",
-                "websiteId": "32afc5c9-f0fb-4938-9572-775dee0b4a2b",
-                "organizationId": "26a1764f-5637-425e-89fa-2f3fb86e758c",
-                "walletAddress": self.camp_network.wallet.address,
-            }
+        if (
+            self.account_info is not None
+            and not refresh
+            and not self._account_info_stale
+        ):
+            self.info_requests_avoided += 1
+            return self.account_info
 
-            response = await self.camp_network.session.get(
-                "https://loyalty.campnetwork.xyz/api/loyalty/accounts",
-                params=params,
-                cookies={"cf_clearance": self.cf_clearance},
-                headers=headers,
-            )
-
-            await self.update_session_token(response.cookies)
+        try:
+            self.info_requests += 1
+            response = await self.api.accounts()
 
             if response.status_code != 200:
                 raise Exception(f"Failed to get account info: {response.status_code}")
 
-            return response.json()
+            self.account_info = response.data
+            self._account_info_stale = False
+            return self.account_info
 
         except Exception as e:
             random_pause = random.randint(
@@ -436,10 +430,42 @@ class CampLoyalty:
             await asyncio.sleep(random_pause)
             raise
 
-    async def update_session_token(self, response_cookies: dict):
-        for cookie_name, cookie_value in response_cookies.items():
-            if cookie_name == "__Secure-next-auth.session-token":
-                self.login_session_token = cookie_value
+    async def get_completed_rules(self) -> set[str]:
+        """Rule IDs the account has completed, from earlier runs and one status request"""
+        if self.completed_rules is not None:
+            return self.completed_rules
+
+        completed = await self.cookie_db.get_completed_rules(
+            self.camp_network.private_key
+        )
+        try:
+            response = await self.api.rules_status(self.user_info["data"][0]["id"])
+            if response.status_code == 200 and isinstance(response.data, dict):
+                fetched = {
+                    rule_status["loyaltyRuleId"]
+                    for rule_status in response.data.get("data", [])
+                    if rule_status.get("status") == "completed"
+                    and rule_status.get("loyaltyRuleId")
+                }
+                if fetched - completed:
+                    await self.cookie_db.add_completed_rules(
+                        self.camp_network.private_key, fetched - completed
+                    )
+                completed |= fetched
+        except Exception as e:
+            logger.warning(
+                f"{self.camp_network.account_index} | Failed to get completed Loyalty quests: {e}. Using saved ones only"
+            )
+
+        self.completed_rules = completed
+        return completed
+
+    async def mark_rule_completed(self, rule_id: str):
+        if self.completed_rules is not None:
+            self.completed_rules.add(rule_id)
+        await self.cookie_db.add_completed_rules(
+            self.camp_network.private_key, [rule_id]
+        )
 
     async def connect_socials(self):
         self.connect_socials_service = ConnectLoyaltySocials(self)
@@ -7,6 +7,8 @@ from faker import Faker
 from src.model.help.cookies import CookieDatabase
 from src.model.camp_network.constants import CampNetworkProtocol
 from src.utils.decorators import retry_async
+from src.model.onchain.constants import ERC721_BALANCE_OF_ABI
+from src.model.onchain.contract_cache import get_contract
 from src.utils.constants import EXPLORER_URL_CAMP_NETWORK
 
 
@@ -18,32 +20,23 @@ class Pictographs:
     @retry_async(default_value=False)
     async def mint_nft(self) -> bool:
         try:
-                        # Check if wallet already has a Pictographs NFT
-            contract = self.camp_network.web3.web3.eth.contract(
-                address=self.camp_network.web3.web3.to_checksum_address(
-                    self.contract_address
-                ),
-                abi=[
-                    {
-                        "inputs": [
-                            {
-                                "internalType": "address",
-                                "name": "owner",
-                                "type": "address",
-                            }
-                        ],
-                        "name": "balanceOf",
-                        "outputs": [
-                            {"internalType": "uint256", "name": "", "type": "uint256"}
-                        ],
-                        "stateMutability": "view",
-                        "type": "function",
-                    }
-                ],
+            if not await self.camp_network.web3.is_contract(self.contract_address):
+                logger.error(
+                    f"{self.camp_network.account_index} | Pictographs contract {self.contract_address} is not deployed"
+                )
+                return False
+
+            # Check if wallet already has a Pictographs NFT
+            contract = get_contract(
+                self.camp_network.web3.chain_id,
+                self.contract_address,
+                ERC721_BALANCE_OF_ABI,
+            )
+            nft_balance = await contract.call(
+                self.camp_network.web3.web3,
+                "balanceOf",
+                self.camp_network.wallet.address,
             )
-            nft_balance = await contract.functions.balanceOf(
-                self.camp_network.wallet.address
-            ).call()
 
             if nft_balance > 0:
                 logger.info(
@@ -67,7 +60,7 @@ class Pictographs:
             # Base payload with method ID 0x14f710fe
             payload = "0x14f710fe"
 
-            chain_id = await self.camp_network.web3.web3.eth.chain_id
+            chain_id = await self.camp_network.web3.get_chain_id()
 
             # Prepare transaction with 0 ETH value
             transaction = {
@@ -76,9 +69,6 @@ class Pictographs:
                     self.contract_address
                 ),
                 "value": Web3.to_wei(0, "ether"),
-                "nonce": await self.camp_network.web3.web3.eth.get_transaction_count(
-                    self.camp_network.wallet.address
-                ),
                 "chainId": chain_id,
                 "data": payload,
             }
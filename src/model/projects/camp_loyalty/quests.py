@@ -8,41 +8,21 @@ from src.model.projects.camp_loyalty.other_quests.awana import Awana
 from src.model.projects.camp_loyalty.other_quests.pictographs import Pictographs
 from src.model.projects.camp_loyalty.connect_socials import ConnectLoyaltySocials
 from src.model.help import email_parser
-from src.model.projects.camp_loyalty.constants import CampLoyaltyProtocol
+from src.model.projects.camp_loyalty.constants import (
+    ALL_CAMPAIGNS_TASK,
+    DOABLE_QUESTS,
+    INDEPENDENT_RULE_TYPES,
+    QUESTS_NAMES,
+    CampaignPlan,
+    CampLoyaltyProtocol,
+    LoyaltyStatus,
+)
+from src.model.projects.camp_loyalty.catalog import get_campaign_catalog
+from src.model.projects.camp_loyalty.verifier import get_quest_verifier
 from src.utils.decorators import retry_async
 from src.model.help.twitter import Twitter
 from src.model.help.discord import DiscordInviter
 
-# task: campaign name
-QUESTS_NAMES = {
-    "camp_loyalty_storychain": "StoryChain",
-    "camp_loyalty_token_tails": "Token Tails",
-    "camp_loyalty_awana": "AWANA",
-    "camp_loyalty_pictographs": "Pictographs",
-    "camp_loyalty_hitmakr": "Hitmakr",
-    "camp_loyalty_panenka": "Panenka",
-    "camp_loyalty_scoreplay": "Scoreplay",
-    "camp_loyalty_wide_worlds": "Wide Worlds",
-    "camp_loyalty_entertainm": "EntertainM",
-    "camp_loyalty_rewarded_tv": "RewardedTV",
-    "camp_loyalty_sporting_cristal": "Sporting Cristal",
-    "camp_loyalty_belgrano": "Belgrano",
-    "camp_loyalty_arcoin": "ARCOIN",
-    "camp_loyalty_kraft": "Kraft",
-    "camp_loyalty_summitx": "SummitX",
-    "camp_loyalty_pixudi": "Pixudi",
-    "camp_loyalty_clusters": "Clusters",
-    "camp_loyalty_jukeblox": "JukeBlox",
-    "camp_loyalty_camp_network": "Camp Network",
-}
-
-
-DOABLE_QUESTS = [
-    "Mint Pictographs Memory Card",
-    "Create your Bleetz GamerID",
-    # "Login to AWANA for the First Time"
-]
-
 
 class LoyaltyQuests:
     def __init__(self, camp_loyalty_instance: CampLoyaltyProtocol):
@@ -52,7 +32,7 @@ class LoyaltyQuests:
 
     async def complete_quests(self, task: str):
         try:
-            if task != "camp_loyalty_complete_quests":
+            if task != ALL_CAMPAIGNS_TASK:
                 campaign_name = QUESTS_NAMES[task]
                 logger.info(
                     f"{self.camp_loyalty.camp_network.account_index} | Completing quest {campaign_name}..."
@@ -62,48 +42,48 @@ class LoyaltyQuests:
                     f"{self.camp_loyalty.camp_network.account_index} | Starting campaigns completion..."
                 )
 
-            campaigns = await self._get_all_campaigns()
+            campaigns = await self._get_campaign_plans(task)
+            completed_rules = await self.camp_loyalty.get_completed_rules()
 
             if not await self._initialize_twitter():
                 return False
 
+            skipped = 0
             for campaign in campaigns:
-                if task != "camp_loyalty_complete_quests":
-                    if campaign["name"] != campaign_name:
-                        continue
-                else:
+                if task == ALL_CAMPAIGNS_TASK:
                     logger.info(
-                        f"{self.camp_loyalty.camp_network.account_index} | Completing campaign {campaign['name']}..."
+                        f"{self.camp_loyalty.camp_network.account_index} | Completing campaign {campaign.name}..."
                     )
 
-                for quest in campaign["loyaltyGroupItems"]:
-                    if (
-                        quest["loyaltyRule"]["type"]
-                        not in [
-                            "drip_x_follow",
-                            "link_click",
-                        ]
-                        and quest["loyaltyRule"]["name"] not in DOABLE_QUESTS
-                    ):
-                        # logger.warning(
-                        #     f"{self.camp_loyalty.camp_network.account_index} | Quest {quest['loyaltyRule']['name']} does not require completion. Skipping..."
-                        # )
-                        continue
-
+                # Known to be done, no need to sleep and ask the API again
+                quests = [
+                    quest
+                    for quest in campaign.quests
+                    if quest["loyaltyRule"]["id"] not in completed_rules
+                ]
+                skipped += len(campaign.quests) - len(quests)
+
+                concurrent = []
+                if self.camp_loyalty.camp_network.config.LOYALTY.CONCURRENT_QUESTS > 1:
+                    concurrent = [
+                        quest
+                        for quest in quests
+                        if quest["loyaltyRule"]["type"] in INDEPENDENT_RULE_TYPES
+                    ]
+                if len(concurrent) > 1:
+                    await self._complete_quests_concurrently(concurrent)
+                    await self._sleep_before_next_quest()
+                    quests = [quest for quest in quests if quest not in concurrent]
+
+                for quest in quests:
                     await self._complete_quest(quest)
-                    random_pause = random.randint(
-                        self.camp_loyalty.camp_network.config.SETTINGS.RANDOM_PAUSE_BETWEEN_ACTIONS[
-                            0
-                        ],
-                        self.camp_loyalty.camp_network.config.SETTINGS.RANDOM_PAUSE_BETWEEN_ACTIONS[
-                            1
-                        ],
-                    )
-                    logger.info(
-                        f"{self.camp_loyalty.camp_network.account_index} | Sleeping {random_pause} seconds before next quest..."
-                    )
-                    await asyncio.sleep(random_pause)
+                    await self._sleep_before_next_quest()
 
+            if skipped:
+                logger.info(
+                    f"{self.camp_loyalty.camp_network.account_index} | Skipped {skipped} already completed quests"
+                )
+            self.camp_loyalty.quests_skipped += skipped
             return True
 
         except Exception as e:
@@ -111,30 +91,77 @@ class LoyaltyQuests:
                 f"{self.camp_loyalty.camp_network.account_index} | Campaigns error: {e}."
             )
             return False
+        finally:
+            if self.twitter:
+                # Quests verified in the background may have to be done again with it
+                await get_quest_verifier().after(self.camp_loyalty, self.twitter.close)
+
+    async def _complete_quests_concurrently(self, quests: list[dict]):
+        """
+        Submit independent quests at once and wait for their verification together.
 
-    async def _complete_quest(self, quest: dict):
+        At most LOYALTY.CONCURRENT_QUESTS quests of the account are in flight, and
+        requests of all accounts share the Loyalty rate limiter. The poller settles
+        all of them with one status request per poll.
+        """
+        logger.info(
+            f"{self.camp_loyalty.camp_network.account_index} | Submitting {len(quests)} link click quests at once..."
+        )
+        semaphore = asyncio.Semaphore(
+            self.camp_loyalty.camp_network.config.LOYALTY.CONCURRENT_QUESTS
+        )
+
+        async def complete(quest: dict):
+            async with semaphore:
+                return await self._complete_quest(quest)
+
+        results = await asyncio.gather(
+            *(complete(quest) for quest in quests), return_exceptions=True
+        )
+        # A failed quest fails the campaign, as in sequential mode
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def _sleep_before_next_quest(self):
+        random_pause = random.randint(
+            self.camp_loyalty.camp_network.config.SETTINGS.RANDOM_PAUSE_BETWEEN_ACTIONS[
+                0
+            ],
+            self.camp_loyalty.camp_network.config.SETTINGS.RANDOM_PAUSE_BETWEEN_ACTIONS[
+                1
+            ],
+        )
+        logger.info(
+            f"{self.camp_loyalty.camp_network.account_index} | Sleeping {random_pause} seconds before next quest..."
+        )
+        await asyncio.sleep(random_pause)
+
+    async def _redo_quest(self, quest: dict):
+        """Do a quest again after its verification asked to, and submit it."""
+        return await self._complete_quest(quest, check_first=False)
+
+    async def _complete_quest(self, quest: dict, check_first: bool = True):
         try:
             if quest["loyaltyRule"]["name"] in DOABLE_QUESTS:
                 if quest["loyaltyRule"]["name"] == "Mint Pictographs Memory Card":
                     pictographs = Pictographs(self.camp_loyalty.camp_network)
-                    await pictographs.mint_nft()
-                    return True
+                    return await pictographs.mint_nft()
                 elif (
                     quest["loyaltyRule"]["name"] == "Login to AWANA for the First Time"
                 ):
                     awana = Awana(self.camp_loyalty.camp_network)
-                    await awana.complete_quest()
-                    return True
+                    return await awana.complete_quest()
                 elif quest["loyaltyRule"]["name"] == "Create your Bleetz GamerID":
                     bleetz = Bleetz(self.camp_loyalty.camp_network)
-                    await bleetz.mint_nft()
-                    return True
+                    return await bleetz.mint_nft()
 
-            is_completed = await self._verify_quest_completion(quest)
-            if is_completed == "need_to_complete_quest":
-                pass
-            elif is_completed:
-                return True
+            if check_first:
+                is_completed = await self._verify_quest_completion(quest)
+                if is_completed == "need_to_complete_quest":
+                    pass
+                elif is_completed:
+                    return is_completed
 
             logger.info(
                 f"{self.camp_loyalty.camp_network.account_index} | Completing quest {quest['loyaltyRule']['name']}..."
@@ -171,7 +198,7 @@ class LoyaltyQuests:
                     f"Failed to complete quest {quest['loyaltyRule']['name']}."
                 )
             else:
-                return True
+                return status
 
         except Exception as e:
             random_pause = random.randint(
@@ -189,51 +216,10 @@ class LoyaltyQuests:
             raise
 
     @retry_async(default_value=None)
-    async def _get_all_campaigns(self):
+    async def _get_campaign_plans(self, task: str) -> list[CampaignPlan]:
         try:
-            cookies = {
-                "__Secure-next-auth.callback-url": "https%3A%2F%2Floyalty.campnetwork.xyz",
-                "cf_clearance": self.camp_loyalty.cf_clearance,
-                "__Secure-next-auth.session-token": self.camp_loyalty.login_session_token,
-            }
-
-            headers = {
-                "accept": "*/*",
-                "accept-language": "ru,en-US;q=0.9,en;q=0.8,ru-RU;q=0.7,zh-TW;q=0.6,zh;q=0.5,uk;q=0.4",
-                "priority": "u=1, i",
-                "referer": "https://loyalty.campnetwork.xyz/loyalty",
-                "sec-ch-ua": '"Chromium";v="133", "Google Chrome";v="133", "Not.A/Brand";v="99"',
-                "sec-ch-ua-arch": '"x86"',
-                "sec-ch-ua-bitness": '"64"',
-                "sec-ch-ua-mobile": "?0",
-                "sec-ch-ua-model": '""',
-                "sec-ch-ua-platform": '"Windows"',
-                "sec-ch-ua-platform-version": '"19.0.0"',
-                "sec-fetch-dest": "empty",
-                "sec-fetch-mode": "cors",
-                "sec-fetch-site": "same-origin",
-                "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36",
-            }
-
-            params = {
-                "limit": "1000",
-                "websiteId": "32afc5c9-f0fb-4938-9572-775dee0b4a2b",
-                "organizationId": "26a1764f-5637-425e-89fa-2f3fb86e758c",
-            }
-
-            response = await self.camp_loyalty.camp_network.session.get(
-                "https://loyalty.campnetwork.xyz/api/loyalty/rule_groups",
-                params=params,
-                cookies=cookies,
-                headers=headers,
-            )
-
-            if response.status_code != 200:
-                raise Exception(
-                    f"Failed to get all campaigns: {response.status_code} | {response.text}"
-                )
-
-            return response.json()["data"]
+            # The campaign list and its doable quests are shared by all accounts
+            return await get_campaign_catalog().plans(self.camp_loyalty.api, task)
 
         except Exception as e:
             random_pause = random.randint(
@@ -254,6 +240,8 @@ class LoyaltyQuests:
         """Initialize Twitter instance for campaign completion"""
         try:
             while True:
+                if self.twitter:
+                    await self.twitter.close()
                 self.twitter = Twitter(
                     self.camp_loyalty.camp_network.account_index,
                     self.camp_loyalty.camp_network.twitter_token,
@@ -381,53 +369,22 @@ class LoyaltyQuests:
             )
             await asyncio.sleep(random_pause)
 
-            cookies = {
-                "__Secure-next-auth.callback-url": "https%3A%2F%2Floyalty.campnetwork.xyz",
-                "cf_clearance": self.camp_loyalty.cf_clearance,
-                "__Secure-next-auth.session-token": self.camp_loyalty.login_session_token,
-            }
-
-            headers = {
-                "accept": "application/json, text/plain, */*",
-                "accept-language": "ru,en-US;q=0.9,en;q=0.8,ru-RU;q=0.7,zh-TW;q=0.6,zh;q=0.5,uk;q=0.4",
-                "origin": "https://loyalty.campnetwork.xyz",
-                "priority": "u=1, i",
-                "referer": "https://loyalty.campnetwork.xyz/loyalty",
-                "sec-ch-ua": '"Chromium";v="133", "Google Chrome";v="133", "Not.A/Brand";v="99"',
-                "sec-ch-ua-arch": '"x86"',
-                "sec-ch-ua-bitness": '"64"',
-                "sec-ch-ua-mobile": "?0",
-                "sec-ch-ua-model": '""',
-                "sec-ch-ua-platform": '"Windows"',
-                "sec-fetch-dest": "empty",
-                "sec-fetch-mode": "cors",
-                "sec-fetch-site": "same-origin",
-                "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36",
-            }
-
-            json_data = {}
-
-            response = await self.camp_loyalty.camp_network.session.post(
-                f'https://loyalty.campnetwork.xyz/api/loyalty/rules/{quest["loyaltyRule"]["id"]}/complete',
-                cookies=cookies,
-                headers=headers,
-                json=json_data,
+            response = await self.camp_loyalty.api.complete_rule(
+                quest["loyaltyRule"]["id"]
             )
 
-            if "Just a moment" in response.text:
+            if response.status is LoyaltyStatus.CLOUDFLARE:
                 logger.error(
                     f"{self.camp_loyalty.camp_network.account_index} | Cloudflare cookies expired. Need to relogin to loyalty.campnetwork.xyz"
                 )
                 await self.camp_loyalty.login()
                 raise Exception("Trying again...")
 
-            if (
-                "You have already been rewarded" in response.text
-                or "You have already clicked the link" in response.text
-            ):
+            if response.status is LoyaltyStatus.ALREADY_DONE:
                 logger.success(
                     f"{self.camp_loyalty.camp_network.account_index} | Quest {quest['loyaltyRule']['name']} already completed"
                 )
+                await self.camp_loyalty.mark_rule_completed(quest["loyaltyRule"]["id"])
                 return True
 
             if response.status_code != 200:
@@ -435,14 +392,13 @@ class LoyaltyQuests:
                     f"Failed to verify quest completion: {response.status_code} | {response.text}"
                 )
 
-            if response.json()["message"] in [
-                "Completion request added to queue",
-                "Link click being verified, come back later to check the status",
-            ]:
-
+            if response.status is LoyaltyStatus.QUEUED:
                 logger.info(
                     f"{self.camp_loyalty.camp_network.account_index} | Quest {quest['loyaltyRule']['name']} added to queue"
                 )
+                if self.camp_loyalty.camp_network.config.LOYALTY.BACKGROUND_VERIFICATION:
+                    get_quest_verifier().submit(self.camp_loyalty, quest, self._redo_quest)
+                    return "submitted"
                 completed = await self._wait_for_quest_completion(quest)
                 if completed == "need_to_complete_quest":
                     return "need_to_complete_quest"
@@ -450,6 +406,7 @@ class LoyaltyQuests:
                     logger.success(
                         f"{self.camp_loyalty.camp_network.account_index} | Quest completed: {quest['loyaltyRule']['name']}"
                     )
+                    await self.camp_loyalty.mark_rule_completed(quest["loyaltyRule"]["id"])
                     return True
                 else:
                     logger.error(
@@ -459,7 +416,7 @@ class LoyaltyQuests:
 
             else:
                 logger.error(
-                    f"{self.camp_loyalty.camp_network.account_index} | Failed to verify quest completion: {response.json()['reason']}"
+                    f"{self.camp_loyalty.camp_network.account_index} | Failed to verify quest completion: {response.reason}"
                 )
                 return False
 
@@ -481,94 +438,10 @@ class LoyaltyQuests:
     @retry_async(default_value=False)
     async def _wait_for_quest_completion(self, quest: dict):
         try:
-            counter = 0
-            while (
-                counter
-                < self.camp_loyalty.camp_network.config.LOYALTY.MAX_ATTEMPTS_TO_COMPLETE_QUEST
-            ):
-                await asyncio.sleep(10)
-                logger.info(
-                    f"{self.camp_loyalty.camp_network.account_index} | Waiting 10 seconds for quest {quest['loyaltyRule']['name']} to be completed..."
-                )
-
-                cookies = {
-                    "__Secure-next-auth.callback-url": "https%3A%2F%2Floyalty.campnetwork.xyz",
-                    "cf_clearance": self.camp_loyalty.cf_clearance,
-                    "__Secure-next-auth.session-token": self.camp_loyalty.login_session_token,
-                }
-
-                headers = {
-                    "accept": "*/*",
-                    "accept-language": "ru,en-US;q=0.9,en;q=0.8,ru-RU;q=0.7,zh-TW;q=0.6,zh;q=0.5,uk;q=0.4",
-                    "priority": "u=1, i",
-                    "referer": "https://loyalty.campnetwork.xyz/loyalty",
-                    "sec-ch-ua": '"Chromium";v="133", "Google Chrome";v="133", "Not.A/Brand";v="99"',
-                    "sec-ch-ua-arch": '"x86"',
-                    "sec-ch-ua-bitness": '"64"',
-                    "sec-ch-ua-mobile": "?0",
-                    "sec-ch-ua-model": '""',
-                    "sec-ch-ua-platform": '"Windows"',
-                    "sec-fetch-dest": "empty",
-                    "sec-fetch-mode": "cors",
-                    "sec-fetch-site": "same-origin",
-                    "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36",
-                }
-
-                params = {
-                    "websiteId": "32afc5c9-f0fb-4938-9572-775dee0b4a2b",
-                    "organizationId": "26a1764f-5637-425e-89fa-2f3fb86e758c",
-                    "userId": self.camp_loyalty.user_info["data"][0]["id"],
-                }
-
-                response = await self.camp_loyalty.camp_network.session.get(
-                    "https://loyalty.campnetwork.xyz/api/loyalty/rules/status",
-                    params=params,
-                    cookies=cookies,
-                    headers=headers,
-                )
-                if "Just a moment" in response.text:
-                    logger.error(
-                        f"{self.camp_loyalty.camp_network.account_index} | Cloudflare cookies expired. Need to relogin to loyalty.campnetwork.xyz"
-                    )
-                    await self.camp_loyalty.login()
-                    raise Exception("Trying again...")
-                if "try again" in response.text:
-                    return "need_to_complete_quest"
-
-                if response.status_code != 200:
-                    if "Too many requests" in response.text:
-                        logger.error(
-                            f"{self.camp_loyalty.camp_network.account_index} | Too many requests. Sleeping 10 seconds..."
-                        )
-                        await asyncio.sleep(10)
-                        continue
-
-                    logger.error(
-                        f"Failed to verify quest completion: {response.status_code} | {response.text}"
-                    )
-                    counter += 1
-                    continue
-
-                if response.json()["data"][0]["status"] == "processing":
-                    logger.info(
-                        f"{self.camp_loyalty.camp_network.account_index} | Quest {quest['loyaltyRule']['name']} is being processed..."
-                    )
-                    counter += 1
-                    continue
-
-                if '"status":"completed"' in response.text:
-                    return True
-
-                else:
-                    logger.error(
-                        f"{self.camp_loyalty.camp_network.account_index} | Failed to verify quest completion: {response.json()['reason']}"
-                    )
-                    return False
-
-            logger.error(
-                f"{self.camp_loyalty.camp_network.account_index} | Quest {quest['loyaltyRule']['name']} not completed after 12 attempts"
+            # One status request per poll settles all queued quests of the account
+            return await self.camp_loyalty.status_poller.wait(
+                quest["loyaltyRule"]["id"], quest["loyaltyRule"]["name"]
             )
-            return False
 
         except Exception as e:
             random_pause = random.randint(
@@ -0,0 +1,241 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Union
+from loguru import logger
+
+from src.model.projects.camp_loyalty.constants import (
+    FAST_POLL_INTERVAL,
+    POLL_BACKOFF,
+    RATE_LIMIT_PAUSE,
+    SLOW_POLL_INTERVAL,
+    CampLoyaltyProtocol,
+    LoyaltyResponse,
+    LoyaltyStatus,
+)
+
+
+# Outcome of a queued quest: True, False or "need_to_complete_quest"
+QuestOutcome = Union[bool, str]
+
+PENDING_STATUSES = ("processing", "pending", "queued")
+
+
+@dataclass
+class TrackedRule:
+    name: str
+    future: asyncio.Future
+    interval: float
+    due_at: float
+    attempts: int = 0
+
+
+def _rule_id(entry: dict) -> Optional[str]:
+    rule = entry.get("loyaltyRule")
+    return (
+        entry.get("loyaltyRuleId")
+        or entry.get("ruleId")
+        or (rule.get("id") if isinstance(rule, dict) else None)
+    )
+
+
+def _outcome(entry: dict) -> Optional[QuestOutcome]:
+    """Final outcome of a status entry, None while it is still being verified."""
+    status = entry.get("status")
+    if status == "completed":
+        return True
+    if status in PENDING_STATUSES:
+        return None
+    if "try again" in str(entry):
+        return "need_to_complete_quest"
+    return False
+
+
+class QuestStatusPoller:
+    """
+    Tracks every queued quest of one account.
+
+    /api/loyalty/rules/status returns the statuses of all rules of the user, so
+    one request per poll settles every tracked quest. A quest is checked after
+    FAST_POLL_INTERVAL seconds and then less and less often up to
+    SLOW_POLL_INTERVAL. "Too many requests" answers pause the Loyalty rate
+    limiter shared by all accounts and don't count as attempts.
+    """
+
+    def __init__(self, camp_loyalty: CampLoyaltyProtocol, max_attempts: int):
+        self.camp_loyalty = camp_loyalty
+        self.max_attempts = max_attempts
+
+        self._tracked: Dict[str, TrackedRule] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+        self.polls = 0
+        self.resolved = 0
+
+    @property
+    def account_index(self) -> int:
+        return self.camp_loyalty.camp_network.account_index
+
+    def track(self, rule_id: str, name: str) -> asyncio.Future:
+        """Start tracking a queued quest. The future resolves to its outcome."""
+        tracked = self._tracked.get(rule_id)
+        if tracked is not None:
+            return tracked.future
+        self._tracked[rule_id] = TrackedRule(
+            name=name,
+            future=asyncio.get_running_loop().create_future(),
+            interval=FAST_POLL_INTERVAL,
+            due_at=time.monotonic() + FAST_POLL_INTERVAL,
+        )
+        self._wakeup.set()
+        return self._tracked[rule_id].future
+
+    async def wait(self, rule_id: str, name: str) -> QuestOutcome:
+        """Track a queued quest and poll until it is settled."""
+        future = self.track(rule_id, name)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return await future
+
+    def due_in(self) -> Optional[float]:
+        """Seconds until the next tracked quest has to be checked, None if nothing is tracked."""
+        if not self._tracked:
+            return None
+        due_at = min(tracked.due_at for tracked in self._tracked.values())
+        return max(0.0, due_at - time.monotonic())
+
+    async def poll(self) -> None:
+        """Check every due quest with a single status request."""
+        now = time.monotonic()
+        due = [
+            rule_id for rule_id, tracked in self._tracked.items() if tracked.due_at <= now
+        ]
+        if not due:
+            return
+
+        self.polls += 1
+        try:
+            response = await self.camp_loyalty.api.rules_status(
+                self.camp_loyalty.user_info["data"][0]["id"]
+            )
+        except Exception as e:
+            logger.error(f"{self.account_index} | Failed to get quests status: {e}")
+            self._reschedule(due)
+            return
+
+        if response.status is LoyaltyStatus.RATE_LIMITED:
+            # The shared limiter is already paused by the client
+            for rule_id in due:
+                self._tracked[rule_id].due_at = time.monotonic() + RATE_LIMIT_PAUSE
+            return
+
+        if response.status is LoyaltyStatus.CLOUDFLARE:
+            logger.error(
+                f"{self.account_index} | Cloudflare cookies expired. Need to relogin to loyalty.campnetwork.xyz"
+            )
+            self._reschedule(due)
+            await self.camp_loyalty.login()
+            return
+
+        entries = self._entries(response)
+        if entries is None:
+            if response.status is LoyaltyStatus.TRY_AGAIN:
+                for rule_id in due:
+                    self._resolve(rule_id, "need_to_complete_quest")
+                return
+            logger.error(
+                f"{self.account_index} | Failed to get quests status: {response.status_code} | {response.text}"
+            )
+            self._reschedule(due)
+            return
+
+        self._settle(entries, due)
+
+    def _entries(self, response: LoyaltyResponse) -> Optional[List[dict]]:
+        if response.status_code != 200 or not isinstance(response.data, dict):
+            return None
+        entries = response.data.get("data")
+        return entries if isinstance(entries, list) else None
+
+    def _settle(self, entries: List[dict], due: List[str]) -> None:
+        outcomes: Dict[str, QuestOutcome] = {}
+        for entry in entries:
+            rule_id = _rule_id(entry)
+            # Newest status of a rule comes first
+            if rule_id in self._tracked and rule_id not in outcomes:
+                outcome = _outcome(entry)
+                if outcome is not None:
+                    outcomes[rule_id] = outcome
+
+        # Quests without a matching status stay pending until max_attempts
+        for rule_id, outcome in outcomes.items():
+            self._resolve(rule_id, outcome)
+
+        still_due = [rule_id for rule_id in due if rule_id in self._tracked]
+        if still_due:
+            self._reschedule(still_due)
+            if self._tracked:
+                logger.info(
+                    f"{self.account_index} | {len(self._tracked)} quests are being processed, next check in {self.due_in():.0f} seconds..."
+                )
+
+    def _reschedule(self, rule_ids: List[str]) -> None:
+        now = time.monotonic()
+        for rule_id in rule_ids:
+            tracked = self._tracked[rule_id]
+            tracked.attempts += 1
+            if tracked.attempts >= self.max_attempts:
+                logger.error(
+                    f"{self.account_index} | Quest {tracked.name} not completed after {tracked.attempts} status checks"
+                )
+                self._resolve(rule_id, False)
+                continue
+            tracked.interval = min(tracked.interval * POLL_BACKOFF, SLOW_POLL_INTERVAL)
+            tracked.due_at = now + tracked.interval
+
+    def _resolve(self, rule_id: str, outcome: QuestOutcome) -> None:
+        tracked = self._tracked.pop(rule_id, None)
+        if tracked is None:
+            return
+        self.resolved += 1
+        if not tracked.future.done():
+            tracked.future.set_result(outcome)
+
+    def _fail_all(self, error: Exception) -> None:
+        for tracked in self._tracked.values():
+            if not tracked.future.done():
+                tracked.future.set_exception(error)
+        self._tracked.clear()
+
+    async def _run(self) -> None:
+        try:
+            while self._tracked:
+                delay = self.due_in()
+                if delay > 0:
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                await self.poll()
+        except asyncio.CancelledError:
+            self._fail_all(Exception("Quest status polling was stopped"))
+            raise
+        except Exception as e:
+            logger.error(f"{self.account_index} | Quest status polling error: {e}")
+            self._fail_all(e)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "tracked": len(self._tracked),
+            "polls": self.polls,
+            "resolved": self.resolved,
+        }
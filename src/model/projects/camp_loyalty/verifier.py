@@ -0,0 +1,208 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from loguru import logger
+
+from src.model.projects.camp_loyalty.constants import (
+    MAX_QUEST_REQUEUES,
+    VERIFY_BATCH_SIZE,
+    CampLoyaltyProtocol,
+)
+from src.model.projects.camp_loyalty.status_poller import QuestStatusPoller
+
+
+# Does a quest again and submits it for verification
+RedoQuest = Callable[[dict], Awaitable]
+Callback = Callable[[], Awaitable]
+
+
+class QuestVerifier:
+    """
+    Verifies queued Loyalty quests of all accounts in the background.
+
+    Account flows submit completions, hand the queued quests over and move on.
+    One sweep task checks the accounts with outstanding quests in batches of
+    VERIFY_BATCH_SIZE, each with a single status request of the account's
+    poller. Completed quests are written to the DB, quests that come back as
+    "try again" are done and submitted again, the rest are logged as failed.
+    Cleanup of an account (its Twitter and HTTP sessions) is deferred until its
+    last quest is settled.
+    """
+
+    def __init__(self, batch_size: int = VERIFY_BATCH_SIZE):
+        self.batch_size = batch_size
+
+        self._pollers: Dict[int, QuestStatusPoller] = {}
+        self._outstanding: Dict[int, int] = {}
+        self._callbacks: Dict[int, List[Callback]] = {}
+        self._requeues: Dict[Tuple[int, str], int] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._sweeper: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.requeued = 0
+        self.sweeps = 0
+
+    @property
+    def outstanding(self) -> int:
+        return sum(self._outstanding.values())
+
+    def submit(self, camp_loyalty: CampLoyaltyProtocol, quest: dict, redo: RedoQuest) -> None:
+        """
+        Verify a queued quest in the background.
+
+        Args:
+            camp_loyalty: Account that submitted the quest
+            quest: Quest from the campaign list
+            redo: Does the quest again and submits it, used when it has to be repeated
+        """
+        key = id(camp_loyalty)
+        rule = quest["loyaltyRule"]
+        future = camp_loyalty.status_poller.track(rule["id"], rule["name"])
+        self._pollers[key] = camp_loyalty.status_poller
+        self._outstanding[key] = self._outstanding.get(key, 0) + 1
+        self.submitted += 1
+
+        task = asyncio.create_task(self._settle(camp_loyalty, quest, redo, future))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.create_task(self._sweep())
+        self._wakeup.set()
+
+    async def after(self, camp_loyalty: CampLoyaltyProtocol, callback: Callback) -> None:
+        """Run the callback once the account has no quests left to verify, right away if it has none."""
+        key = id(camp_loyalty)
+        if self._outstanding.get(key):
+            self._callbacks.setdefault(key, []).append(callback)
+            return
+        await callback()
+
+    async def _settle(
+        self,
+        camp_loyalty: CampLoyaltyProtocol,
+        quest: dict,
+        redo: RedoQuest,
+        future: asyncio.Future,
+    ) -> None:
+        key = id(camp_loyalty)
+        account_index = camp_loyalty.camp_network.account_index
+        rule = quest["loyaltyRule"]
+        try:
+            try:
+                outcome = await future
+            except Exception as e:
+                logger.error(f"{account_index} | Quest {rule['name']} verification error: {e}")
+                outcome = False
+
+            if outcome is True:
+                self.completed += 1
+                logger.success(f"{account_index} | Quest completed: {rule['name']}")
+                await camp_loyalty.mark_rule_completed(rule["id"])
+                return
+
+            requeues = self._requeues.get((key, rule["id"]), 0)
+            if outcome == "need_to_complete_quest" and requeues < MAX_QUEST_REQUEUES:
+                self._requeues[(key, rule["id"])] = requeues + 1
+                self.requeued += 1
+                logger.info(
+                    f"{account_index} | Quest {rule['name']} has to be completed again ({requeues + 1}/{MAX_QUEST_REQUEUES})"
+                )
+                try:
+                    # Submits the quest to the verifier again
+                    await redo(quest)
+                    return
+                except Exception as e:
+                    logger.error(f"{account_index} | Quest {rule['name']} error: {e}")
+
+            self.failed += 1
+            logger.error(f"{account_index} | Quest {rule['name']} not completed")
+        except Exception as e:
+            self.failed += 1
+            logger.error(f"{account_index} | Quest {rule['name']} verification error: {e}")
+        finally:
+            self._outstanding[key] -= 1
+            if not self._outstanding[key]:
+                await self._account_done(key)
+
+    async def _account_done(self, key: int) -> None:
+        self._outstanding.pop(key, None)
+        self._pollers.pop(key, None)
+        self._requeues = {
+            pair: count for pair, count in self._requeues.items() if pair[0] != key
+        }
+        for callback in self._callbacks.pop(key, []):
+            try:
+                await callback()
+            except Exception as e:
+                logger.error(f"Quest verifier cleanup error: {e}")
+
+    async def _sweep(self) -> None:
+        while self._pollers:
+            due = [poller for poller in self._pollers.values() if poller.due_in() == 0]
+            if not due:
+                delays = [
+                    delay
+                    for delay in (poller.due_in() for poller in self._pollers.values())
+                    if delay is not None
+                ]
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), min(delays) if delays else None
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            for start in range(0, len(due), self.batch_size):
+                await asyncio.gather(
+                    *(poller.poll() for poller in due[start : start + self.batch_size]),
+                    return_exceptions=True,
+                )
+            self.sweeps += 1
+
+    async def close(self) -> None:
+        """Wait until every submitted quest is settled."""
+        if self.outstanding:
+            logger.info(f"Waiting for {self.outstanding} Loyalty quests to be verified...")
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            await asyncio.gather(self._sweeper, return_exceptions=True)
+            self._sweeper = None
+        if self.submitted:
+            logger.info(
+                f"Quest verifier closed (submitted: {self.submitted}, completed: {self.completed}, "
+                f"failed: {self.failed}, requeued: {self.requeued}, sweeps: {self.sweeps})"
+            )
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "outstanding": self.outstanding,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "requeued": self.requeued,
+            "sweeps": self.sweeps,
+        }
+
+
+_quest_verifier: Optional[QuestVerifier] = None
+
+
+def get_quest_verifier() -> QuestVerifier:
+    """Get the process-wide background quest verifier."""
+    global _quest_verifier
+    if _quest_verifier is None:
+        _quest_verifier = QuestVerifier()
+    return _quest_verifier
+
+
+async def close_quest_verifier() -> None:
+    if _quest_verifier is not None:
+        await _quest_verifier.close()
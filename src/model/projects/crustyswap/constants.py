@@ -1,3 +1,8 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from web3 import Web3
+
+
 CONTRACT_ADDRESSES = {
     "Arbitrum": "0x12C3E3B84B75ca4a9388de696621ac5F2Ae36953",
     "Optimism": "0x12C3E3B84B75ca4a9388de696621ac5F2Ae36953",
@@ -7,6 +12,10 @@ CONTRACT_ADDRESSES = {
 DESTINATION_CONTRACT_ADDRESS = "0x12C3E3B84B75ca4a9388de696621ac5F2Ae36953"
 DESTINATION_CHAIN_ID = 123420001114
 ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+# Fees of a replacement for a stuck deposit are raised by at least this factor (nodes require +10%)
+REPLACEMENT_FEE_BUMP = 1.125
+# Distribution(address indexed recipient, uint256 amount, uint256 timestamp) on the destination contract
+DISTRIBUTION_EVENT_TOPIC = Web3.to_hex(Web3.keccak(text="Distribution(address,uint256,uint256)"))
 
 CRUSTY_SWAP_RPCS = {
     "Arbitrum": "https://arb1.lava.build",
@@ -27,3 +36,23 @@ CHAINLINK_ETH_PRICE_ABI = [
         "stateMutability":"view",
         "type":"function"}
 ]
+
+
+@dataclass
+class RefuelJob:
+    """One recipient of a pipelined crusty_refuel_from_one_to_all run."""
+
+    address: str
+    initial_balance: float
+    amount_wei: int
+    status: str = "pending"  # pending / sent / confirmed / failed
+    tx_hash: Optional[bytes] = None
+    # Hash of every deposit signed for this recipient, recorded before it is broadcast
+    tx_hashes: List[bytes] = field(default_factory=list)
+    # Nonce of every signed deposit by its hash
+    nonces: Dict[bytes, int] = field(default_factory=dict)
+    # Nonce and fees of the deposit the job waits for
+    nonce: Optional[int] = None
+    fees: Dict[str, int] = field(default_factory=dict)
+    attempts: int = 0
+    arrived: bool = False
@@ -1,11 +1,14 @@
+import itertools
 import random
 from eth_account import Account
 from src.model.onchain.web3_custom import Web3Custom
 from loguru import logger
 import primp
 import asyncio
+import time
 from src.utils.config import Config
 from web3 import AsyncWeb3
+from web3.exceptions import TransactionNotFound
 from eth_account import Account
 from src.model.projects.crustyswap.constants import (
     CONTRACT_ADDRESSES, 
@@ -16,8 +19,16 @@ from src.model.projects.crustyswap.constants import (
     ZERO_ADDRESS,
     CRUSTY_SWAP_RPCS,
     DESTINATION_CHAIN_ID,
-    
+    DISTRIBUTION_EVENT_TOPIC,
+    REPLACEMENT_FEE_BUMP,
+    RefuelJob,
 )
+from src.model.onchain.balance_watcher import get_balance_watcher
+from src.model.onchain.contract_cache import get_contract
+from src.model.onchain.nonce_manager import get_nonce_manager
+from src.model.onchain.provider_pool import get_provider_pool
+from src.model.onchain.rpc_cache import get_rpc_cache
+from src.model.projects.crustyswap.price_oracle import get_price_oracle
 from src.utils.constants import EXPLORER_URLS
 from typing import Dict
 
@@ -41,19 +52,17 @@ class CrustySwap:
         self.private_key = private_key
 
         self.eth_web3 = None
-        self.camp_contract = self.camp_web3.web3.eth.contract(address=DESTINATION_CONTRACT_ADDRESS, abi=CRUSTY_SWAP_ABI)
+        self.camp_contract = get_contract(DESTINATION_CHAIN_ID, DESTINATION_CONTRACT_ADDRESS, CRUSTY_SWAP_ABI)
 
     async def initialize(self):
-        try:
-            self.eth_web3 = await self.create_web3("Ethereum")
-            return True
-        except Exception as e:
-            logger.error(f"{self.account_index} | Error: {e}")
-            return False
+        # The Ethereum mainnet provider is only needed to refresh the shared ETH price,
+        # get_eth_price creates it lazily
+        return True
 
     async def create_web3(self, network: str) -> AsyncWeb3:
+        """Get a pooled Web3Custom for a network, connected once per RPC and proxy."""
         try:
-            web3 = await Web3Custom.create(
+            web3 = await get_provider_pool().get(
                 self.account_index,
                 [CRUSTY_SWAP_RPCS[network]],
                 self.config.OTHERS.USE_PROXY_FOR_RPC,
@@ -65,6 +74,20 @@ class CrustySwap:
             logger.error(f"{self.account_index} | Error: {e}")
             return False
         
+    async def get_eth_price(self) -> int:
+        """Get the ETH price from Chainlink (in USD with 8 decimals), shared by all accounts for a short TTL."""
+        async def fetch():
+            if not self.eth_web3:
+                self.eth_web3 = await self.create_web3("Ethereum")
+            chainlink_eth_price_contract = get_contract(
+                self.eth_web3.chain_id,
+                CHAINLINK_ETH_PRICE_CONTRACT_ADDRESS,
+                CHAINLINK_ETH_PRICE_ABI
+            )
+            return await chainlink_eth_price_contract.call(self.eth_web3.web3, "latestAnswer")
+
+        return await get_price_oracle().get("eth_price", fetch)
+
     async def get_camp_balance(self) -> float:
         """Get native camp balance."""
         try:
@@ -85,36 +108,14 @@ class CrustySwap:
 
     async def wait_for_balance_increase(self, initial_balance: float) -> bool:
         """Wait for camp balance to increase after refuel."""
-        # Use the timeout from config
-        timeout = self.config.CRUSTY_SWAP.MAX_WAIT_TIME
-        
-        logger.info(f"[{self.account_index}] Waiting for balance to increase (max wait time: {timeout} seconds)...")
-        start_time = asyncio.get_event_loop().time()
-        
-        # Check balance every 5 seconds until timeout
-        while asyncio.get_event_loop().time() - start_time < timeout:
-            current_balance = await self.get_camp_balance()
-            if current_balance > initial_balance:
-                logger.success(
-                    f"[{self.account_index}] Balance increased from {initial_balance:.9f} to {current_balance:.9f} camp"
-                )
-                return True
-            
-            # Log progress every 15 seconds
-            elapsed = int(asyncio.get_event_loop().time() - start_time)
-            if elapsed % 15 == 0:
-                logger.info(f"[{self.account_index}] Still waiting for balance to increase... ({elapsed}/{timeout} seconds)")
-            
-            await asyncio.sleep(5)
-        
-        logger.error(f"[{self.account_index}] Balance didn't increase after {timeout} seconds")
-        return False
-    
+        return await self._wait_for_balance_increase(initial_balance, self.wallet.address)
+
     async def get_gas_params(self, web3: AsyncWeb3) -> Dict[str, int]:
         """Get gas parameters for transaction."""
-        latest_block = await web3.web3.eth.get_block('latest')
+        # Identical reads of other accounts on the same RPC share one request
+        latest_block = await web3.shared_read("eth_getBlockByNumber", ("latest",), lambda: web3.web3.eth.get_block('latest'))
         base_fee = latest_block['baseFeePerGas']
-        max_priority_fee = await web3.web3.eth.max_priority_fee
+        max_priority_fee = await web3.shared_read("eth_maxPriorityFeePerGas", (), lambda: web3.web3.eth.max_priority_fee)
         max_fee = int((base_fee + max_priority_fee) * 1.5)
         
         return {
@@ -123,11 +124,16 @@ class CrustySwap:
         }
     
     async def get_minimum_deposit(self, network: str) -> int:
-        """Get minimum deposit amount for a specific network."""
+        """Get minimum deposit amount for a specific network, read through the RPC cache."""
         try:
             web3 = await self.create_web3(network)
-            contract = web3.web3.eth.contract(address=CONTRACT_ADDRESSES[network], abi=CRUSTY_SWAP_ABI)
-            return await contract.functions.minimumDeposit().call()
+            contract = get_contract(web3.chain_id, CONTRACT_ADDRESSES[network], CRUSTY_SWAP_ABI)
+            return await get_rpc_cache().get(
+                web3.chain_id,
+                "minimumDeposit",
+                (contract.address.lower(),),
+                lambda: contract.call(web3.web3, "minimumDeposit"),
+            )
         except Exception as e:
             logger.error(f"[{self.account_index}] Error getting minimum deposit: {str(e)}")
             return 0
@@ -143,15 +149,22 @@ class CrustySwap:
         Returns:
             List of tuples (network, balance) or False if no eligible networks found
         """
+        start_time = time.monotonic()
         for attempt in range(1, max_retries + 1):
             try:
-                eligible_networks = []
-                
                 networks_to_refuel_from = self.config.CRUSTY_SWAP.NETWORKS_TO_REFUEL_FROM
-                for network in networks_to_refuel_from:
-                    balance = await self.get_native_balance(network)
-                    if balance > await self.get_minimum_deposit(network):
+                # Balance and minimum deposit of every network are read concurrently
+                results = await asyncio.gather(*[
+                    asyncio.gather(self.get_native_balance(network), self.get_minimum_deposit(network))
+                    for network in networks_to_refuel_from
+                ])
+
+                eligible_networks = []
+                for network, (balance, minimum_deposit) in zip(networks_to_refuel_from, results):
+                    if balance > minimum_deposit:
                         eligible_networks.append((network, balance))
+
+                logger.info(f"[{self.account_index}] Checked {len(networks_to_refuel_from)} networks for refuel in {time.monotonic() - start_time:.2f}s, eligible: {len(eligible_networks)}")
                 return eligible_networks
             except Exception as e:
                 if attempt < max_retries:
@@ -196,23 +209,21 @@ class CrustySwap:
             # Get web3 for the selected network
             web3 = await self.create_web3(network)
             gas_params = await self.get_gas_params(web3)
-            contract = web3.web3.eth.contract(address=CONTRACT_ADDRESSES[network], abi=CRUSTY_SWAP_ABI)
+            contract = get_contract(web3.chain_id, CONTRACT_ADDRESSES[network], CRUSTY_SWAP_ABI)
+            # Deposit calldata is encoded once, for the estimate and for the transaction
+            deposit_data = contract.encode("deposit", ZERO_ADDRESS, self.wallet.address, DESTINATION_CHAIN_ID)
             
             # Estimate gas using the same gas parameters from get_balances
-            gas_estimate = await web3.web3.eth.estimate_gas({
+            gas_limit = await web3.estimate_gas({
                 'from': self.wallet.address,
                 'to': CONTRACT_ADDRESSES[network],
-                'value': await contract.functions.minimumDeposit().call(),
-                'data': contract.functions.deposit(
-                        ZERO_ADDRESS,
-                        self.wallet.address,
-                        DESTINATION_CHAIN_ID
-                    )._encode_transaction_data(),
+                'value': await self.get_minimum_deposit(network),
+                'data': deposit_data,
             })
 
             if self.config.CRUSTY_SWAP.BRIDGE_ALL:
-                # Calculate exact gas units needed (same as tx)
-                gas_units = int(gas_estimate * 1.2)
+                # Gas units needed (same as tx)
+                gas_units = gas_limit
                 
                 # Calculate maximum possible gas cost
                 max_total_gas_cost = (gas_units * gas_params['maxFeePerGas']) * random.uniform(1.15, 1.2)
@@ -238,35 +249,29 @@ class CrustySwap:
                 
                 amount_wei = int(round(web3.web3.to_wei(amount_ether, 'ether'), random.randint(8, 12)))
                 
-            # Get nonce
-            nonce = await web3.web3.eth.get_transaction_count(self.wallet.address)
-            
-            has_enough_camp = await self.check_available_camp(amount_wei, contract)
+            has_enough_camp = await self.check_available_camp(amount_wei, contract, web3)
             if not has_enough_camp:
                 logger.error(f"[{self.account_index}] Not enough camp in the contract for your amount of ETH deposit, try again later")
                 return False
-                
+
+            chain_id = web3.chain_id
             tx = {
                 'from': self.wallet.address,
                 'to': CONTRACT_ADDRESSES[network],
                 'value': amount_wei,
-                'data': contract.functions.deposit(
-                        ZERO_ADDRESS,
-                        self.wallet.address,
-                        DESTINATION_CHAIN_ID
-                    )._encode_transaction_data(),
-                'nonce': nonce,
-                'gas': int(gas_estimate * 1.1),  # Add 10% buffer to gas estimate
-                'chainId': await web3.web3.eth.chain_id,
+                'data': deposit_data,
+                'gas': gas_limit,  # Learned from receipts or estimated, with a safety margin
+                'chainId': chain_id,
                 **gas_params  # Use the same gas params that we calculated during get_balances
             }
             
-            # Sign and send transaction
-            signed_tx = web3.web3.eth.account.sign_transaction(tx, self.private_key)
-            tx_hash = await web3.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
+            # Sign and send transaction, nonce is assigned by the local nonce manager,
+            # a rejected learned gas limit falls back to a live estimate
+            tx_hash = await web3.send_with_gas_fallback(tx, self.wallet, chain_id)
             
             logger.info(f"[{self.account_index}] Waiting for refuel transaction confirmation...")
-            receipt = await web3.web3.eth.wait_for_transaction_receipt(tx_hash)
+            receipt = await web3.wait_for_transaction_receipt(tx_hash)
+            web3.record_gas_used(tx, receipt)
             
             explorer_url = f"{EXPLORER_URLS[network]}{tx_hash.hex()}"
             
@@ -299,14 +304,15 @@ class CrustySwap:
             addresses.append(Account.from_key(private_key).address)
         return addresses
 
-    async def check_available_camp(self, eth_amount_wei, contract, max_retries=5, retry_delay=5) -> bool:
+    async def check_available_camp(self, eth_amount_wei, contract, web3, max_retries=5, retry_delay=5) -> bool:
         """
         Check if there is enough camp in the Crusty Swap contract to fill a buy order.
         Includes retry mechanism for resilience against temporary failures.
         
         Args:
             eth_amount_wei: Amount of ETH in wei to be used for the purchase
-            contract: The Crusty Swap contract
+            contract: The Crusty Swap contract (cached)
+            web3: Web3Custom of the source network of the contract
             max_retries: Maximum number of retry attempts
             retry_delay: Delay between retries in seconds
             
@@ -315,18 +321,20 @@ class CrustySwap:
         """
         for attempt in range(1, max_retries + 1):
             try:
-                # Get available camp in the contract
-                available_camp_wei = await self.camp_web3.web3.eth.get_balance(DESTINATION_CONTRACT_ADDRESS)
-                
-                # Get ETH price from Chainlink (in USD with 8 decimals)
-                chainlink_eth_price_contract = self.eth_web3.web3.eth.contract(
-                    address=CHAINLINK_ETH_PRICE_CONTRACT_ADDRESS, 
-                    abi=CHAINLINK_ETH_PRICE_ABI
+                # Available camp in the contract, ETH price from Chainlink and camp price from
+                # the contract (both in USD with 8 decimals) are global, read through the shared oracle
+                oracle = get_price_oracle()
+                available_camp_wei, eth_price_usd, camp_price_usd = await asyncio.gather(
+                    oracle.get(
+                        "available_camp",
+                        lambda: self.camp_web3.web3.eth.get_balance(DESTINATION_CONTRACT_ADDRESS),
+                    ),
+                    self.get_eth_price(),
+                    oracle.get(
+                        ("camp_price", web3.chain_id),
+                        lambda: contract.call(web3.web3, "getChainPricePerETH", DESTINATION_CHAIN_ID),
+                    ),
                 )
-                eth_price_usd = await chainlink_eth_price_contract.functions.latestAnswer().call()
-                
-                # Get camp price from contract (in USD with 8 decimals)
-                camp_price_usd = await contract.functions.getChainPricePerETH(DESTINATION_CHAIN_ID).call()
                 
                 # Calculate how many camp we should receive for our ETH
                 # Convert ETH to USD value with proper decimal handling
@@ -379,29 +387,30 @@ class CrustySwap:
             return None
             
     async def _wait_for_balance_increase(self, initial_balance: float, address: str) -> bool:
-        """Wait for camp balance to increase after refuel."""
+        """
+        Wait for camp balance of address to increase after refuel.
+        Arrivals are detected by the shared Camp balance watcher, which follows
+        Distribution events of the destination contract instead of polling every account.
+        """
         # Use the timeout from config
         timeout = self.config.CRUSTY_SWAP.MAX_WAIT_TIME
         
         logger.info(f"[{self.account_index}] Waiting for balance to increase (max wait time: {timeout} seconds)...")
-        start_time = asyncio.get_event_loop().time()
-        
-        # Check balance every 5 seconds until timeout
-        while asyncio.get_event_loop().time() - start_time < timeout:
-            current_balance = await self._get_camp_balance(address)
-            if current_balance > initial_balance:
-                logger.success(
-                    f"[{self.account_index}] Balance increased from {initial_balance} to {current_balance} camp"
-                )
-                return True
-            
-            # Log progress every 15 seconds
-            elapsed = int(asyncio.get_event_loop().time() - start_time)
-            if elapsed % 15 == 0:
-                logger.info(f"[{self.account_index}] Still waiting for balance to increase... ({elapsed}/{timeout} seconds)")
-            
-            await asyncio.sleep(5)
-        
+
+        watcher = get_balance_watcher(await self.camp_web3.get_chain_id())
+        watcher.add_log_source(DESTINATION_CONTRACT_ADDRESS, DISTRIBUTION_EVENT_TOPIC)
+
+        increased = await watcher.wait_for_increase(
+            self.camp_web3.web3,
+            address,
+            initial_balance,
+            timeout,
+            lambda wei: float(self.camp_web3.web3.from_wei(wei, 'ether')),
+        )
+        if increased:
+            logger.success(f"[{self.account_index}] Balance of {address} increased from {initial_balance} camp")
+            return True
+
         logger.error(f"[{self.account_index}] Balance didn't increase after {timeout} seconds")
         return False
         
@@ -448,23 +457,21 @@ class CrustySwap:
             # Get web3 for the selected network
             web3 = await self.create_web3(network)
             gas_params = await self.get_gas_params(web3)
-            contract = web3.web3.eth.contract(address=CONTRACT_ADDRESSES[network], abi=CRUSTY_SWAP_ABI)
+            contract = get_contract(web3.chain_id, CONTRACT_ADDRESSES[network], CRUSTY_SWAP_ABI)
+            # Deposit calldata is encoded once, for the estimate and for the transaction
+            deposit_data = contract.encode("deposit", ZERO_ADDRESS, address, DESTINATION_CHAIN_ID)
             
             # Estimate gas using the same gas parameters
-            gas_estimate = await web3.web3.eth.estimate_gas({
+            gas_limit = await web3.estimate_gas({
                 'from': self.wallet.address,
                 'to': CONTRACT_ADDRESSES[network],
-                'value': await contract.functions.minimumDeposit().call(),
-                'data': contract.functions.deposit(
-                        ZERO_ADDRESS,
-                        address,
-                        DESTINATION_CHAIN_ID
-                    )._encode_transaction_data(),
+                'value': await self.get_minimum_deposit(network),
+                'data': deposit_data,
             })
 
             if self.config.CRUSTY_SWAP.BRIDGE_ALL:
-                # Calculate exact gas units needed (same as tx)
-                gas_units = int(gas_estimate * 1.2)
+                # Gas units needed (same as tx)
+                gas_units = gas_limit
                 
                 # Calculate maximum possible gas cost
                 max_total_gas_cost = (gas_units * gas_params['maxFeePerGas']) * random.uniform(1.15, 1.2)
@@ -490,34 +497,29 @@ class CrustySwap:
                 
                 amount_wei = int(round(web3.web3.to_wei(amount_ether, 'ether'), random.randint(8, 12)))
                 
-            # Get nonce
-            nonce = await web3.web3.eth.get_transaction_count(self.wallet.address)
-            has_enough_camp = await self.check_available_camp(amount_wei, contract)
+            has_enough_camp = await self.check_available_camp(amount_wei, contract, web3)
             if not has_enough_camp:
                 logger.error(f"[{self.account_index}] Not enough camp in the contract for your amount of ETH deposit, try again later")
                 return False
-                
+
+            chain_id = web3.chain_id
             tx = {
                 'from': self.wallet.address,
                 'to': CONTRACT_ADDRESSES[network],
                 'value': amount_wei,
-                'data': contract.functions.deposit(
-                        ZERO_ADDRESS,
-                        address,
-                        DESTINATION_CHAIN_ID
-                    )._encode_transaction_data(),
-                'nonce': nonce,
-                'gas': int(gas_estimate * 1.1),  # Add 10% buffer to gas estimate
-                'chainId': await web3.web3.eth.chain_id,
+                'data': deposit_data,
+                'gas': gas_limit,  # Learned from receipts or estimated, with a safety margin
+                'chainId': chain_id,
                 **gas_params  # Use the same gas params that we calculated during get_balances
             }
             
-            # Sign and send transaction
-            signed_tx = web3.web3.eth.account.sign_transaction(tx, self.private_key)
-            tx_hash = await web3.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
+            # Sign and send transaction, nonce is assigned by the local nonce manager,
+            # a rejected learned gas limit falls back to a live estimate
+            tx_hash = await web3.send_with_gas_fallback(tx, self.wallet, chain_id)
             
             logger.info(f"[{self.account_index}] Waiting for refuel transaction confirmation...")
-            receipt = await web3.web3.eth.wait_for_transaction_receipt(tx_hash)
+            receipt = await web3.wait_for_transaction_receipt(tx_hash)
+            web3.record_gas_used(tx, receipt)
             
             explorer_url = f"{EXPLORER_URLS[network]}{tx_hash.hex()}"
             return await self._handle_transaction_status(receipt, explorer_url, initial_balance, network, address)
@@ -531,6 +533,9 @@ class CrustySwap:
         try:
             await self.initialize()
             addresses = self._convert_private_keys_to_addresses(private_keys_to_distribute)
+            if self.config.CRUSTY_SWAP.PIPELINED_DISTRIBUTION:
+                return await self.pipelined_refuel_from_one_to_all(addresses)
+
             for index, address in enumerate(addresses):
                 logger.info(f"[{self.account_index}] - [{index}/{len(addresses)}] Refueling from MAIN: {self.wallet.address} to: {address} ")
                 status = await self.send_refuel_from_one_to_all(address)
@@ -542,4 +547,294 @@ class CrustySwap:
             return True
         except Exception as e:
             logger.error(f"[{self.account_index}] Refuel failed: {str(e)}")
-            return False
\ No newline at end of file
+            return False
+
+    def _get_refuel_amount_wei(self) -> int:
+        """Random refuel amount from AMOUNT_TO_REFUEL in wei."""
+        amount_ether = random.uniform(
+            self.config.CRUSTY_SWAP.AMOUNT_TO_REFUEL[0],
+            self.config.CRUSTY_SWAP.AMOUNT_TO_REFUEL[1]
+        )
+        return int(round(AsyncWeb3.to_wei(amount_ether, 'ether'), random.randint(8, 12)))
+
+    async def _get_initial_balances(self, addresses: list[str]) -> list:
+        """Read camp balances of many addresses with at most MAX_IN_FLIGHT concurrent requests."""
+        semaphore = asyncio.Semaphore(self.config.CRUSTY_SWAP.MAX_IN_FLIGHT)
+
+        async def read_balance(address):
+            async with semaphore:
+                return await self._get_camp_balance(address)
+
+        return await asyncio.gather(*[read_balance(address) for address in addresses])
+
+    async def _confirm_refuel_job(self, web3: Web3Custom, job: RefuelJob, network: str, window: asyncio.Semaphore, arrival_tasks: list) -> None:
+        """Wait for the deposit receipt of one job, free its in-flight slot and start watching its arrival."""
+        try:
+            receipt = await web3.wait_for_transaction_receipt(job.tx_hash)
+            explorer_url = f"{EXPLORER_URLS[network]}{job.tx_hash.hex()}"
+            if receipt['status'] == 1:
+                job.status = "confirmed"
+                deposit = get_contract(web3.chain_id, CONTRACT_ADDRESSES[network], CRUSTY_SWAP_ABI).function("deposit")
+                web3.record_gas_used({'to': CONTRACT_ADDRESSES[network], 'data': deposit.selector}, receipt)
+                logger.success(f"[{self.account_index}] Refuel to {job.address} confirmed! Explorer URL: {explorer_url}")
+                self._watch_refuel_job_arrival(job, arrival_tasks)
+            else:
+                job.status = "failed"
+                logger.error(f"[{self.account_index}] Refuel to {job.address} failed! Explorer URL: {explorer_url}")
+        except Exception as e:
+            # Receipt is unknown, transaction may still land: it is rechecked before any resend
+            logger.warning(f"[{self.account_index}] No receipt for refuel to {job.address} yet: {str(e)}")
+        finally:
+            window.release()
+
+    async def _wait_for_refuel_job_arrival(self, job: RefuelJob) -> None:
+        job.arrived = await self._wait_for_balance_increase(job.initial_balance, job.address)
+
+    def _watch_refuel_job_arrival(self, job: RefuelJob, arrival_tasks: list) -> None:
+        if self.config.CRUSTY_SWAP.WAIT_FOR_FUNDS_TO_ARRIVE:
+            arrival_tasks.append(asyncio.create_task(self._wait_for_refuel_job_arrival(job)))
+
+    async def _recheck_refuel_job(self, web3: Web3Custom, job: RefuelJob) -> None:
+        """
+        Update the status of a job that was not confirmed, before anything is resent.
+        Every deposit signed for the job is looked up by its hash, so a deposit that is
+        still pending or has already landed is never sent twice.
+        """
+        for tx_hash in reversed(job.tx_hashes):
+            try:
+                receipt = await web3.web3.eth.get_transaction_receipt(tx_hash)
+                if receipt['status'] == 1:
+                    job.tx_hash = tx_hash
+                    job.status = "confirmed"
+                    return
+                # Reverted, its nonce is used up, look at the other deposits
+                continue
+            except TransactionNotFound:
+                pass
+            except Exception as e:
+                # State of the deposit is unknown, don't resend it this round
+                logger.warning(f"[{self.account_index}] Failed to check refuel to {job.address}: {str(e)}")
+                job.tx_hash = tx_hash
+                job.nonce = job.nonces.get(tx_hash, job.nonce)
+                job.status = "sent"
+                return
+            try:
+                await web3.web3.eth.get_transaction(tx_hash)
+                # Still in the mempool
+                job.tx_hash = tx_hash
+                job.nonce = job.nonces.get(tx_hash, job.nonce)
+                job.status = "sent"
+                return
+            except TransactionNotFound:
+                pass
+            except Exception as e:
+                logger.warning(f"[{self.account_index}] Failed to check refuel to {job.address}: {str(e)}")
+                job.tx_hash = tx_hash
+                job.nonce = job.nonces.get(tx_hash, job.nonce)
+                job.status = "sent"
+                return
+
+        current_balance = await self._get_camp_balance(job.address)
+        if current_balance is not None and current_balance > job.initial_balance:
+            job.status = "confirmed"
+        else:
+            job.status = "failed"
+
+    def _record_signed_refuel(self, job: RefuelJob, tx: dict):
+        """on_signed callback that stores the hash, nonce and fees of every deposit signed for a job."""
+        def record(tx_hash) -> None:
+            job.tx_hashes.append(tx_hash)
+            job.nonces[tx_hash] = tx['nonce']
+            job.nonce = tx['nonce']
+            job.fees = {key: tx[key] for key in ('maxFeePerGas', 'maxPriorityFeePerGas')}
+        return record
+
+    async def pipelined_refuel_from_one_to_all(self, addresses: list[str]) -> bool:
+        """
+        Refuel many addresses from one wallet without waiting for each transfer.
+
+        Source network, gas parameters and gas limit are computed once, deposits are
+        signed with sequential local nonces and sent back to back while at most
+        MAX_IN_FLIGHT of them wait for receipts. Receipts and arrivals are confirmed
+        concurrently, failed deposits are resent only after checking they didn't land.
+        Before every retry round the nonce is resynced with the node: resends fill the
+        gaps of dropped deposits and deposits stuck on low fees are replaced.
+        """
+        start_time = time.monotonic()
+
+        network_info = await self.pick_network_to_refuel_from()
+        if not network_info:
+            logger.error(f"[{self.account_index}] No network found")
+            return False
+        network, balance = network_info
+
+        web3 = await self.create_web3(network)
+        if not web3:
+            return False
+        chain_id = web3.chain_id
+        contract = get_contract(chain_id, CONTRACT_ADDRESSES[network], CRUSTY_SWAP_ABI)
+        gas_params = await self.get_gas_params(web3)
+        minimum_deposit = await self.get_minimum_deposit(network)
+        gas_limit = await web3.estimate_gas({
+            'from': self.wallet.address,
+            'to': CONTRACT_ADDRESSES[network],
+            'value': minimum_deposit,
+            'data': contract.encode("deposit", ZERO_ADDRESS, self.wallet.address, DESTINATION_CHAIN_ID),
+        })
+
+        if self.config.CRUSTY_SWAP.BRIDGE_ALL:
+            logger.warning(f"[{self.account_index}] BRIDGE_ALL is ignored in pipelined distribution, using AMOUNT_TO_REFUEL")
+
+        # Build the plan: skip funded recipients and stop when the source balance runs out
+        initial_balances = await self._get_initial_balances(addresses)
+        max_gas_cost = gas_limit * gas_params['maxFeePerGas']
+        remaining_balance = balance
+        jobs = []
+        for index, (address, initial_balance) in enumerate(zip(addresses, initial_balances)):
+            if initial_balance is None:
+                logger.error(f"[{self.account_index}] Failed to get camp balance for address: {address}")
+                continue
+            if initial_balance > self.config.CRUSTY_SWAP.MINIMUM_BALANCE_TO_REFUEL:
+                logger.info(f"[{self.account_index}] {address} balance ({initial_balance}) is above minimum, skipping refuel")
+                continue
+
+            amount_wei = max(self._get_refuel_amount_wei(), minimum_deposit)
+            if amount_wei + max_gas_cost > remaining_balance:
+                logger.warning(f"[{self.account_index}] Not enough funds on {network} for the remaining {len(addresses) - index} addresses")
+                break
+            remaining_balance -= amount_wei + max_gas_cost
+            jobs.append(RefuelJob(address=address, initial_balance=initial_balance, amount_wei=amount_wei))
+
+        if not jobs:
+            logger.info(f"[{self.account_index}] Nothing to refuel")
+            return True
+
+        if not await self.check_available_camp(sum(job.amount_wei for job in jobs), contract, web3):
+            logger.error(f"[{self.account_index}] Not enough camp in the contract for your amount of ETH deposit, try again later")
+            return False
+
+        logger.info(f"[{self.account_index}] Pipelined refuel of {len(jobs)} addresses from {network} (max in flight: {self.config.CRUSTY_SWAP.MAX_IN_FLIGHT})")
+
+        window = asyncio.Semaphore(self.config.CRUSTY_SWAP.MAX_IN_FLIGHT)
+        nonce_manager = get_nonce_manager(chain_id, self.wallet.address)
+        arrival_tasks = []
+
+        def build_tx(job: RefuelJob, fees: Dict[str, int]) -> dict:
+            return {
+                'from': self.wallet.address,
+                'to': CONTRACT_ADDRESSES[network],
+                'value': job.amount_wei,
+                'data': contract.encode("deposit", ZERO_ADDRESS, job.address, DESTINATION_CHAIN_ID),
+                'gas': gas_limit,
+                'chainId': chain_id,
+                **fees
+            }
+
+        round_number = 0
+        for round_number in range(self.config.SETTINGS.ATTEMPTS):
+            receipt_tasks = []
+            stuck = []
+            free_nonces = None
+            # Nonces of resends that failed, reused first so they don't become gaps
+            unused_nonces = []
+            if round_number > 0:
+                unconfirmed = [job for job in jobs if job.status in ("sent", "failed")]
+                await asyncio.gather(*[self._recheck_refuel_job(web3, job) for job in unconfirmed])
+
+                # Deposits below the pending nonce of the node are in line to be mined, the
+                # ones above it wait behind the nonce of a dropped deposit
+                pending_nonce = await nonce_manager.reconcile(web3.web3)
+                held = {job.nonce for job in jobs if job.status == "sent"}
+                free_nonces = (nonce for nonce in itertools.count(pending_nonce) if nonce not in held)
+                for job in unconfirmed:
+                    if job.status == "confirmed":
+                        self._watch_refuel_job_arrival(job, arrival_tasks)
+                    elif job.status == "sent" and job.nonce is not None and job.nonce < pending_nonce:
+                        # Not mined during a whole round, its fees are too low
+                        stuck.append(job)
+                    elif job.status == "sent":
+                        # Waits for a gap that the resends below fill, wait for its receipt again
+                        await window.acquire()
+                        receipt_tasks.append(asyncio.create_task(
+                            self._confirm_refuel_job(web3, job, network, window, arrival_tasks)
+                        ))
+
+            to_send = [job for job in jobs if job.status in ("pending", "failed")]
+            if not to_send and not stuck and not receipt_tasks:
+                break
+
+            if round_number > 0 and (to_send or stuck):
+                logger.info(
+                    f"[{self.account_index}] Retrying {len(to_send)} refuels and replacing {len(stuck)} stuck ones "
+                    f"(round {round_number + 1}/{self.config.SETTINGS.ATTEMPTS})"
+                )
+                gas_params = await self.get_gas_params(web3)
+
+            for job in stuck:
+                await window.acquire()
+                fees = {
+                    key: max(gas_params[key], int(job.fees.get(key, 0) * REPLACEMENT_FEE_BUMP))
+                    for key in gas_params
+                }
+                tx = build_tx(job, fees)
+                job.attempts += 1
+                try:
+                    job.tx_hash = await web3.sign_and_send(
+                        tx, self.wallet, chain_id, nonce=job.nonce, on_signed=self._record_signed_refuel(job, tx)
+                    )
+                    logger.info(f"[{self.account_index}] Replaced stuck refuel to {job.address} (nonce {job.nonce})")
+                except Exception as e:
+                    # E.g. the stuck deposit was mined meanwhile, its receipt is awaited as before
+                    logger.warning(f"[{self.account_index}] Failed to replace refuel to {job.address}: {str(e)}")
+                receipt_tasks.append(asyncio.create_task(
+                    self._confirm_refuel_job(web3, job, network, window, arrival_tasks)
+                ))
+
+            for job in to_send:
+                await window.acquire()
+                tx = build_tx(job, gas_params)
+                job.attempts += 1
+                nonce = None
+                if free_nonces is not None:
+                    nonce = unused_nonces.pop() if unused_nonces else next(free_nonces)
+                try:
+                    # The hash is stored before the broadcast, a deposit the node accepted
+                    # despite an error (e.g. a timeout) is found by it before any resend
+                    tx_hash = await web3.send_with_gas_fallback(
+                        tx, self.wallet, chain_id,
+                        on_signed=self._record_signed_refuel(job, tx),
+                        nonce=nonce,
+                    )
+                except Exception as e:
+                    if nonce is not None:
+                        unused_nonces.append(nonce)
+                    window.release()
+                    job.status = "failed"
+                    logger.error(f"[{self.account_index}] Failed to send refuel to {job.address}: {str(e)}")
+                    continue
+
+                job.tx_hash = tx_hash
+                job.status = "sent"
+                receipt_tasks.append(asyncio.create_task(
+                    self._confirm_refuel_job(web3, job, network, window, arrival_tasks)
+                ))
+
+            await asyncio.gather(*receipt_tasks)
+
+        if round_number > 0:
+            # Retry rounds send with explicit nonces, let the local counter catch up
+            await nonce_manager.reconcile(web3.web3)
+
+        if arrival_tasks:
+            logger.info(f"[{self.account_index}] Waiting for funds to arrive to {len(arrival_tasks)} addresses...")
+            await asyncio.gather(*arrival_tasks)
+
+        confirmed = sum(1 for job in jobs if job.status == "confirmed")
+        arrived = sum(1 for job in jobs if job.arrived)
+        elapsed = time.monotonic() - start_time
+        logger.info(
+            f"[{self.account_index}] Pipelined refuel finished in {elapsed:.1f}s: "
+            f"{confirmed}/{len(jobs)} confirmed, {arrived} arrived, "
+            f"{sum(job.attempts for job in jobs)} transactions sent"
+        )
+        return confirmed == len(jobs)
@@ -0,0 +1,73 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+# Prices and the destination contract balance are refreshed at most this often
+PRICE_ORACLE_TTL = 30
+
+
+class PriceOracle:
+    """
+    Process-wide cache of the global values check_available_camp needs:
+    the Chainlink ETH price, the CAMP price of the Crusty Swap contract and
+    the CAMP balance of the destination contract.
+
+    Each value is read once per TTL and shared by every refuelling account.
+    Concurrent callers of an expired value wait for a single refresh.
+    """
+
+    def __init__(self, ttl: float = PRICE_ORACLE_TTL):
+        self.ttl = ttl
+        self._values: Dict[Hashable, Tuple[Any, float]] = {}
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+
+        self.hits = 0
+        self.refreshes = 0
+
+    async def get(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Get a cached value or refresh it with fetch.
+
+        Args:
+            key: Value key, e.g. "eth_price"
+            fetch: Coroutine function reading the current value
+        """
+        value = self._fresh(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            value = self._fresh(key)
+            if value is not None:
+                self.hits += 1
+                return value
+
+            value = await fetch()
+            self._values[key] = (value, time.monotonic() + self.ttl)
+            self.refreshes += 1
+            return value
+
+    def _fresh(self, key: Hashable) -> Optional[Any]:
+        cached = self._values.get(key)
+        if cached is None or cached[1] < time.monotonic():
+            return None
+        return cached[0]
+
+    def invalidate(self, key: Hashable) -> None:
+        self._values.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "refreshes": self.refreshes}
+
+
+_price_oracle: Optional[PriceOracle] = None
+
+
+def get_price_oracle() -> PriceOracle:
+    """Get the process-wide Crusty Swap price oracle."""
+    global _price_oracle
+    if _price_oracle is None:
+        _price_oracle = PriceOracle()
+    return _price_oracle
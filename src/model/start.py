@@ -7,10 +7,12 @@ import asyncio
 from src.model.offchain.cex.instance import CexWithdraw
 from src.model.projects.crustyswap.instance import CrustySwap
 from src.model.projects.camp_loyalty.instance import CampLoyalty
+from src.model.projects.camp_loyalty.verifier import get_quest_verifier
 from src.model.camp_network import CampNetwork
 from src.model.help.stats import WalletStats
 from src.model.onchain.web3_custom import Web3Custom
 from src.utils.client import create_client
+from src.utils.session_manager import get_session_manager
 from src.utils.config import Config
 from src.model.database.db_manager import Database
 from src.utils.telegram_logger import send_telegram_message
@@ -48,15 +50,17 @@ class Start:
     @retry_async(default_value=False)
     async def initialize(self):
         try:
-            self.session = await create_client(
-                self.proxy, self.config.OTHERS.SKIP_SSL_VERIFICATION
-            )
+            if self.session is None:
+                self.session = await create_client(
+                    self.proxy, self.config.OTHERS.SKIP_SSL_VERIFICATION
+                )
             self.camp_web3 = await Web3Custom.create(
                 self.account_index,
                 self.config.RPCS.CAMP_NETWORK,
                 self.config.OTHERS.USE_PROXY_FOR_RPC,
                 self.proxy,
                 self.config.OTHERS.SKIP_SSL_VERIFICATION,
+                self.config.OTHERS.HEDGE_RPC_REQUESTS,
             )
 
             self.camp_instance = CampNetwork(
@@ -106,8 +110,6 @@ class Start:
                 logger.warning(
                     f"⚠️ [{self.account_index}] No pending tasks found in database for this wallet. Exiting..."
                 )
-                if self.camp_web3:
-                    await self.camp_web3.cleanup()
                 return True
 
             pause = random.randint(
@@ -208,7 +210,9 @@ class Start:
                     f"📝 Total Tasks: {total_tasks}\n"
                     f"✅ Completed: {completed_count}\n"
                     f"❌ Failed: {len(failed_tasks)}\n"
-                    f"📈 Success Rate: {(completed_count/total_tasks)*100:.1f}%\n\n"
+                    f"📈 Success Rate: {(completed_count/total_tasks)*100:.1f}%\n"
+                    f"⏭️ Loyalty Quests Already Done: {self.loyalty.quests_skipped if self.loyalty else 0}\n"
+                    f"♻️ Loyalty Info Requests Avoided: {self.loyalty.info_requests_avoided if self.loyalty else 0}\n\n"
                     f"⚙️ Settings:\n"
                     f"⏭️ Skip Failed: {'Yes' if self.config.FLOW.SKIP_FAILED_TASKS else 'No'}\n"
                 )
@@ -233,8 +237,7 @@ class Start:
         finally:
             # Cleanup resources
             try:
-                if self.camp_web3:
-                    await self.camp_web3.cleanup()
+                await self.close()
                 logger.info(
                     f"✨ [{self.account_index}] All sessions closed successfully"
                 )
@@ -250,6 +253,23 @@ class Start:
             )
             await asyncio.sleep(pause)
 
+    async def close(self):
+        """Clean up the web3 instance and give the HTTP session back to the session manager"""
+        if self.loyalty:
+            # Queued quests may still be verified in the background with this session
+            await get_quest_verifier().after(self.loyalty, self._release)
+        else:
+            await self._release()
+
+    async def _release(self):
+        if self.loyalty:
+            await self.loyalty.status_poller.stop()
+        if self.camp_web3:
+            await self.camp_web3.cleanup()
+        if self.session is not None:
+            await get_session_manager().release(self.session)
+            self.session = None
+
     async def execute_task(self, task):
         """Execute a single task"""
         task = task.lower()
@@ -7,6 +7,7 @@ from .statistics import print_wallets_stats
 from .proxy_parser import Proxy
 from .config_browser import run
 from .check_github_version import check_version
+from .session_manager import SessionKey, SessionManager, get_session_manager
 __all__ = [
     "create_client",
     "create_twitter_client",
@@ -24,4 +25,7 @@ __all__ = [
     "EXPLORER_URL_CAMP_NETWORK",
     "CHAIN_ID_CAMP_NETWORK",
     "check_version",
+    "SessionKey",
+    "SessionManager",
+    "get_session_manager",
 ]
@@ -1,11 +1,16 @@
+import secrets
 import primp
 from curl_cffi.requests import AsyncSession
 
+from src.utils.session_manager import SessionKey, get_session_manager
 
-async def create_client(
-    proxy: str, skip_ssl_verification: bool = True
-) -> primp.AsyncClient:
-    session = primp.AsyncClient(impersonate="chrome_133", verify=skip_ssl_verification, follow_redirects=True)
+
+PRIMP_PROFILE = "chrome_133"
+CURL_PROFILE = "chrome131"
+
+
+def _build_client(proxy: str, verify: bool) -> primp.AsyncClient:
+    session = primp.AsyncClient(impersonate=PRIMP_PROFILE, verify=verify, follow_redirects=True)
 
     if proxy:
         session.proxy = proxy
@@ -17,6 +22,19 @@ async def create_client(
     return session
 
 
+async def create_client(
+    proxy: str, skip_ssl_verification: bool = True
+) -> primp.AsyncClient:
+    """
+    Lease a primp client, give it back with get_session_manager().release.
+    primp clients are closed on release instead of pooled, their cookie jar can't be cleared.
+    """
+    return await get_session_manager().acquire(
+        SessionKey("primp", proxy, PRIMP_PROFILE, skip_ssl_verification),
+        lambda: _build_client(proxy, skip_ssl_verification),
+    )
+
+
 HEADERS = {
     "accept": "*/*",
     "accept-language": "en-GB,en-US;q=0.9,en;q=0.8,ru;q=0.7,zh-TW;q=0.6,zh;q=0.5",
@@ -32,15 +50,9 @@ HEADERS = {
 }
 
 
-import secrets
-
-
-
-async def create_curl_client(
-    proxy: str, verify_ssl: bool = True
-) -> tuple[AsyncSession, str]:
+def _build_curl_session(proxy: str, verify_ssl: bool) -> AsyncSession:
     session = AsyncSession(
-        impersonate="chrome131",
+        impersonate=CURL_PROFILE,
         verify=verify_ssl,
         timeout=60,
     )
@@ -54,21 +66,20 @@ async def create_curl_client(
     return session
 
 
+async def create_curl_client(
+    proxy: str, verify_ssl: bool = True
+) -> AsyncSession:
+    """Lease a pooled curl_cffi session, give it back with get_session_manager().release."""
+    return await get_session_manager().acquire(
+        SessionKey("curl_cffi", proxy, CURL_PROFILE, verify_ssl),
+        lambda: _build_curl_session(proxy, verify_ssl),
+    )
+
 
 async def create_twitter_client(
     proxy: str, auth_token: str, verify_ssl: bool = True
 ) -> tuple[AsyncSession, str]:
-    session = AsyncSession(
-        impersonate="chrome131",
-        verify=verify_ssl,
-        timeout=60,
-    )
-
-    if proxy:
-        session.proxies.update({
-            "http": "http://" + proxy,
-            "https": "http://" + proxy,
-        })
+    session = await create_curl_client(proxy, verify_ssl)
 
     generated_csrf_token = secrets.token_hex(16)
 
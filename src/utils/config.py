@@ -36,17 +36,21 @@ class CaptchaConfig:
 @dataclass
 class RpcsConfig:
     CAMP_NETWORK: List[str]
+    CAMP_NETWORK_WS: str = ""
 
 
 @dataclass
 class LoyaltyConfig:
     REPLACE_FAILED_TWITTER_ACCOUNT: bool
     MAX_ATTEMPTS_TO_COMPLETE_QUEST: int
+    BACKGROUND_VERIFICATION: bool = False
+    CONCURRENT_QUESTS: int = 1
 
 @dataclass
 class OthersConfig:
     SKIP_SSL_VERIFICATION: bool
     USE_PROXY_FOR_RPC: bool
+    HEDGE_RPC_REQUESTS: bool = False
 
 
 @dataclass
@@ -71,6 +75,8 @@ class CrustySwapConfig:
     MAX_WAIT_TIME: int
     BRIDGE_ALL: bool
     BRIDGE_ALL_MAX_AMOUNT: float
+    PIPELINED_DISTRIBUTION: bool = False
+    MAX_IN_FLIGHT: int = 10
 
 
 @dataclass
@@ -161,14 +167,20 @@ class Config:
             ),
             RPCS=RpcsConfig(
                 CAMP_NETWORK=data["RPCS"]["CAMP_NETWORK"],
+                CAMP_NETWORK_WS=data["RPCS"].get("CAMP_NETWORK_WS", ""),
             ),
             OTHERS=OthersConfig(
                 SKIP_SSL_VERIFICATION=data["OTHERS"]["SKIP_SSL_VERIFICATION"],
                 USE_PROXY_FOR_RPC=data["OTHERS"]["USE_PROXY_FOR_RPC"],
+                HEDGE_RPC_REQUESTS=data["OTHERS"].get("HEDGE_RPC_REQUESTS", False),
             ),
             LOYALTY=LoyaltyConfig(
                 REPLACE_FAILED_TWITTER_ACCOUNT=data["LOYALTY"]["REPLACE_FAILED_TWITTER_ACCOUNT"],
                 MAX_ATTEMPTS_TO_COMPLETE_QUEST=data["LOYALTY"]["MAX_ATTEMPTS_TO_COMPLETE_QUEST"],
+                BACKGROUND_VERIFICATION=data["LOYALTY"].get(
+                    "BACKGROUND_VERIFICATION", False
+                ),
+                CONCURRENT_QUESTS=data["LOYALTY"].get("CONCURRENT_QUESTS", 1),
             ),
             EXCHANGES=ExchangesConfig(
                 name=data["EXCHANGES"]["name"],
@@ -201,6 +213,10 @@ class Config:
                 MAX_WAIT_TIME=data["CRUSTY_SWAP"]["MAX_WAIT_TIME"],
                 BRIDGE_ALL=data["CRUSTY_SWAP"]["BRIDGE_ALL"],
                 BRIDGE_ALL_MAX_AMOUNT=data["CRUSTY_SWAP"]["BRIDGE_ALL_MAX_AMOUNT"],
+                PIPELINED_DISTRIBUTION=data["CRUSTY_SWAP"].get(
+                    "PIPELINED_DISTRIBUTION", False
+                ),
+                MAX_IN_FLIGHT=data["CRUSTY_SWAP"].get("MAX_IN_FLIGHT", 10),
             ),
         )
 
@@ -1293,12 +1293,15 @@ function renderConfig(config) {
                 // Карточка для настроек Loyalty
                 createCard(cardsContainer, 'Loyalty Settings', 'heart', [
                     { key: 'REPLACE_FAILED_TWITTER_ACCOUNT', value: config[key]['REPLACE_FAILED_TWITTER_ACCOUNT'] },
-                    { key: 'MAX_ATTEMPTS_TO_COMPLETE_QUEST', value: config[key]['MAX_ATTEMPTS_TO_COMPLETE_QUEST'] }
+                    { key: 'MAX_ATTEMPTS_TO_COMPLETE_QUEST', value: config[key]['MAX_ATTEMPTS_TO_COMPLETE_QUEST'] },
+                    { key: 'BACKGROUND_VERIFICATION', value: config[key]['BACKGROUND_VERIFICATION'], isCheckbox: true },
+                    { key: 'CONCURRENT_QUESTS', value: config[key]['CONCURRENT_QUESTS'] }
                 ], key);
             } else if (key === 'RPCS') {
                 // Карточка для настроек RPCs
                 createCard(cardsContainer, 'RPC Settings', 'server', [
-                    { key: 'CAMP_NETWORK', value: config[key]['CAMP_NETWORK'], isList: true }
+                    { key: 'CAMP_NETWORK', value: config[key]['CAMP_NETWORK'], isList: true },
+                    { key: 'CAMP_NETWORK_WS', value: config[key]['CAMP_NETWORK_WS'] }
                 ], key);
             } else if (key === 'CRUSTY_SWAP') {
                 createCard(cardsContainer, 'Crusty Swap Settings', 'gas-pump', [
@@ -1308,7 +1311,9 @@ function renderConfig(config) {
                     { key: 'WAIT_FOR_FUNDS_TO_ARRIVE', value: config[key]['WAIT_FOR_FUNDS_TO_ARRIVE'], isCheckbox: true },
                     { key: 'MAX_WAIT_TIME', value: config[key]['MAX_WAIT_TIME'] },
                     { key: 'BRIDGE_ALL', value: config[key]['BRIDGE_ALL'], isCheckbox: true },
-                    { key: 'BRIDGE_ALL_MAX_AMOUNT', value: config[key]['BRIDGE_ALL_MAX_AMOUNT'], isFloat: true }
+                    { key: 'BRIDGE_ALL_MAX_AMOUNT', value: config[key]['BRIDGE_ALL_MAX_AMOUNT'], isFloat: true },
+                    { key: 'PIPELINED_DISTRIBUTION', value: config[key]['PIPELINED_DISTRIBUTION'], isCheckbox: true },
+                    { key: 'MAX_IN_FLIGHT', value: config[key]['MAX_IN_FLIGHT'] }
                 ], key);
             } else if (key === 'EXCHANGES') {
                 // General Exchange Settings
@@ -1359,7 +1364,8 @@ function renderConfig(config) {
                 // Карточка для прочих настроек
                 createCard(cardsContainer, 'Other Settings', 'cogs', [
                     { key: 'SKIP_SSL_VERIFICATION', value: config[key]['SKIP_SSL_VERIFICATION'] },
-                    { key: 'USE_PROXY_FOR_RPC', value: config[key]['USE_PROXY_FOR_RPC'] }
+                    { key: 'USE_PROXY_FOR_RPC', value: config[key]['USE_PROXY_FOR_RPC'] },
+                    { key: 'HEDGE_RPC_REQUESTS', value: config[key]['HEDGE_RPC_REQUESTS'] }
                 ], key);
             }
         }
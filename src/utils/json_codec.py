@@ -0,0 +1,147 @@
+import json
+import time
+from typing import Any, Callable, Dict, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+def _stdlib_dumps_bytes(obj: Any, sort_keys: bool = False) -> bytes:
+    return json.dumps(obj, separators=(",", ":"), sort_keys=sort_keys).encode()
+
+
+if orjson is not None:
+    BACKEND = "orjson"
+    DecodeError = orjson.JSONDecodeError
+
+    def loads(data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+    def dumps_bytes(obj: Any, sort_keys: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+
+elif msgspec is not None:
+    BACKEND = "msgspec"
+    DecodeError = msgspec.DecodeError
+    _decoder = msgspec.json.Decoder()
+    _encoder = msgspec.json.Encoder()
+
+    def loads(data: Union[str, bytes]) -> Any:
+        return _decoder.decode(data)
+
+    def dumps_bytes(obj: Any, sort_keys: bool = False) -> bytes:
+        if sort_keys:
+            return _stdlib_dumps_bytes(obj, sort_keys=True)
+        return _encoder.encode(obj)
+
+else:
+    BACKEND = "json"
+    DecodeError = json.JSONDecodeError
+
+    def loads(data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps_bytes(obj: Any, sort_keys: bool = False) -> bytes:
+        return _stdlib_dumps_bytes(obj, sort_keys)
+
+
+def dumps(obj: Any, sort_keys: bool = False) -> str:
+    """Compact JSON string of obj, encoded with the fastest installed backend."""
+    return dumps_bytes(obj, sort_keys).decode()
+
+
+def response_json(response) -> Any:
+    """Decode the body of a primp or curl_cffi response from its raw bytes."""
+    return loads(response.content)
+
+
+def _rule_groups_payload(limit: int = 1000) -> bytes:
+    """A rule_groups response shaped like loyalty.campnetwork.xyz with `limit` rules."""
+    groups = []
+    for group_index in range(limit // 10):
+        groups.append(
+            {
+                "id": f"group-{group_index:08d}",
+                "name": f"Campaign {group_index}",
+                "description": "Complete the quests to earn points " * 4,
+                "isCollapsible": True,
+                "loyaltyGroupItems": [
+                    {
+                        "id": f"item-{group_index:04d}-{item_index:04d}",
+                        "sortId": item_index,
+                        "loyaltyRule": {
+                            "id": f"rule-{group_index:04d}-{item_index:04d}",
+                            "name": f"Follow partner {item_index} on X",
+                            "type": "drip_x_follow" if item_index % 2 else "link_click",
+                            "amount": "10",
+                            "frequency": "once",
+                            "startTime": "2025-04-01T00:00:00.000Z",
+                            "endTime": None,
+                            "hideInUi": False,
+                            "metadata": {
+                                "twitterAccountUrl": f"https://x.com/partner_{item_index}",
+                                "link": f"https://example.com/{group_index}/{item_index}",
+                                "verificationDelay": 30,
+                            },
+                            "loyaltyCurrency": {"id": "points", "decimals": 0},
+                        },
+                    }
+                    for item_index in range(10)
+                ],
+            }
+        )
+    return json.dumps({"data": groups, "hasNextPage": False}).encode()
+
+
+def benchmark(limit: int = 1000, rounds: int = 50) -> Dict[str, Dict[str, float]]:
+    """
+    Time decoding and encoding of a rule_groups-like payload with every installed backend.
+
+    Run with `python -m src.utils.json_codec`.
+
+    Returns:
+        Milliseconds per round of loads and dumps for each backend
+    """
+    payload = _rule_groups_payload(limit)
+    backends: Dict[str, tuple[Callable[[bytes], Any], Callable[[Any], Any]]] = {
+        "json": (json.loads, json.dumps)
+    }
+    if orjson is not None:
+        backends["orjson"] = (orjson.loads, orjson.dumps)
+    if msgspec is not None:
+        backends["msgspec"] = (msgspec.json.decode, msgspec.json.encode)
+
+    results = {}
+    for name, (decode, encode) in backends.items():
+        obj = decode(payload)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            decode(payload)
+        loads_ms = (time.perf_counter() - start) * 1000 / rounds
+        start = time.perf_counter()
+        for _ in range(rounds):
+            encode(obj)
+        dumps_ms = (time.perf_counter() - start) * 1000 / rounds
+        results[name] = {"loads_ms": loads_ms, "dumps_ms": dumps_ms}
+    return results
+
+
+if __name__ == "__main__":
+    payload_size = len(_rule_groups_payload())
+    print(f"rule_groups payload: {payload_size / 1024:.0f} KiB, active backend: {BACKEND}")
+    results = benchmark()
+    baseline = results["json"]
+    for name, timings in results.items():
+        print(
+            f"{name:>8}: loads {timings['loads_ms']:.2f} ms "
+            f"({baseline['loads_ms'] / timings['loads_ms']:.1f}x), "
+            f"dumps {timings['dumps_ms']:.2f} ms "
+            f"({baseline['dumps_ms'] / timings['dumps_ms']:.1f}x)"
+        )
@@ -0,0 +1,70 @@
+import asyncio
+import time
+from typing import Dict
+
+
+class RateLimiter:
+    """
+    Async token bucket shared by many coroutines.
+
+    Allows `rate` calls per second on average with bursts of up to `burst` calls.
+    `pause` holds back every caller for a while, e.g. after the server answered
+    with a rate limit error.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+        self.acquired = 0
+        self.waited = 0.0
+
+    async def acquire(self) -> None:
+        """Wait until a call is allowed."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                else:
+                    self._tokens = min(
+                        self.burst, self._tokens + (now - self._updated) * self.rate
+                    )
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        self.acquired += 1
+                        return
+                    delay = (1 - self._tokens) / self.rate
+                self.waited += delay
+                await asyncio.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out calls for the given number of seconds."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+        self._updated = self._paused_until
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    def stats(self) -> Dict[str, float]:
+        return {"acquired": self.acquired, "waited": round(self.waited, 2)}
+
+
+_rate_limiters: Dict[str, RateLimiter] = {}
+
+
+def get_rate_limiter(name: str, rate: float, burst: int = 1) -> RateLimiter:
+    """Get the process-wide rate limiter registered under name, creating it on first use."""
+    if name not in _rate_limiters:
+        _rate_limiters[name] = RateLimiter(rate, burst)
+    return _rate_limiters[name]
@@ -0,0 +1,190 @@
+import asyncio
+import inspect
+import os
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Union
+from loguru import logger
+
+
+# Released sessions kept open per key, the rest are closed
+MAX_IDLE_SESSIONS_PER_KEY = 4
+
+
+@dataclass(frozen=True)
+class SessionKey:
+    """Sessions with the same key are interchangeable once their cookies are cleared."""
+
+    library: str
+    proxy: str
+    profile: str
+    verify: bool = True
+
+
+SessionFactory = Callable[[], Union[Any, Awaitable[Any]]]
+
+
+class SessionManager:
+    """
+    Owns every HTTP client of the process.
+
+    Clients are pooled by (library, proxy, impersonation profile). A released
+    client keeps its keep-alive connections and goes back to the pool with its
+    cookies cleared and its headers restored, so the next account on the same
+    proxy reuses it instead of opening new sockets.
+
+    Only curl_cffi sessions are pooled. primp clients can't list or clear their
+    cookie jar, so they are closed on release and every account gets a new one;
+    no account ever inherits another wallet's cookies.
+    """
+
+    def __init__(self, max_idle_per_key: int = MAX_IDLE_SESSIONS_PER_KEY):
+        self.max_idle_per_key = max_idle_per_key
+        self._idle: Dict[SessionKey, List[Any]] = {}
+        # id(client) -> (key, client) of leased clients
+        self._in_use: Dict[int, tuple] = {}
+        # Headers set by the factory, restored when a client is released
+        self._base_headers: Dict[int, dict] = {}
+        self._lock = asyncio.Lock()
+
+        self.created = 0
+        self.reused = 0
+        self.closed = 0
+
+    async def acquire(self, key: SessionKey, factory: SessionFactory) -> Any:
+        """
+        Get a pooled client for the key or create one.
+
+        Args:
+            key: Library, proxy and impersonation profile of the client
+            factory: Builds a new client, may be a coroutine function
+        """
+        async with self._lock:
+            idle = self._idle.get(key)
+            client = idle.pop() if idle else None
+
+        if client is not None:
+            self.reused += 1
+        else:
+            client = factory()
+            if inspect.isawaitable(client):
+                client = await client
+            self._base_headers[id(client)] = dict(getattr(client, "headers", {}) or {})
+            self.created += 1
+
+        self._in_use[id(client)] = (key, client)
+        return client
+
+    async def release(self, client: Any) -> None:
+        """Return a client to the pool, or close it if it can't be reused."""
+        if client is None:
+            return
+        entry = self._in_use.pop(id(client), None)
+        if entry is None:
+            return
+        key, _ = entry
+
+        if self._reset(client):
+            async with self._lock:
+                idle = self._idle.setdefault(key, [])
+                if len(idle) < self.max_idle_per_key:
+                    idle.append(client)
+                    return
+        await self._close(client)
+
+    @asynccontextmanager
+    async def session(self, key: SessionKey, factory: SessionFactory) -> AsyncIterator[Any]:
+        """Lease a client for the duration of the block."""
+        client = await self.acquire(key, factory)
+        try:
+            yield client
+        finally:
+            await self.release(client)
+
+    def _reset(self, client: Any) -> bool:
+        """Clear cookies and restore factory headers. False if the jar can't be verified empty."""
+        try:
+            # primp clients only expose cookies per URL, their jar can't be cleared or checked
+            if not hasattr(client, "cookies"):
+                return False
+            cookies = client.cookies
+            if cookies:
+                cookies.clear()
+                # Some clients return a copy of their jar, check it really is empty
+                if getattr(client, "cookies", None):
+                    return False
+            client.headers = dict(self._base_headers.get(id(client), {}))
+            return True
+        except Exception:
+            return False
+
+    async def _close(self, client: Any) -> None:
+        self._base_headers.pop(id(client), None)
+        self.closed += 1
+        close = getattr(client, "close", None)
+        if close is None:
+            return
+        try:
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.warning(f"Failed to close HTTP session: {str(e)}")
+
+    async def close_all(self) -> None:
+        async with self._lock:
+            clients = [client for idle in self._idle.values() for client in idle]
+            self._idle.clear()
+        clients.extend(client for _, client in self._in_use.values())
+        self._in_use.clear()
+        for client in clients:
+            await self._close(client)
+
+    async def __aenter__(self) -> "SessionManager":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close_all()
+
+    def stats(self) -> Dict[str, Optional[int]]:
+        idle = sum(len(clients) for clients in self._idle.values())
+        return {
+            "live": idle + len(self._in_use),
+            "in_use": len(self._in_use),
+            "idle": idle,
+            "created": self.created,
+            "reused": self.reused,
+            "closed": self.closed,
+            "open_fds": open_file_descriptors(),
+        }
+
+
+def open_file_descriptors() -> Optional[int]:
+    """Open file descriptors (sockets included) of the process, None where /proc is unavailable."""
+    try:
+        return len(os.listdir("/proc/self/fd"))
+    except OSError:
+        return None
+
+
+_session_manager: Optional[SessionManager] = None
+
+
+def get_session_manager() -> SessionManager:
+    """Get the process-wide HTTP session manager."""
+    global _session_manager
+    if _session_manager is None:
+        _session_manager = SessionManager()
+    return _session_manager
+
+
+async def close_session_manager() -> None:
+    """Close every HTTP session and log how many were reused."""
+    if _session_manager is None:
+        return
+    stats = _session_manager.stats()
+    logger.info(
+        f"HTTP sessions | created: {stats['created']}, reused: {stats['reused']}, live: {stats['live']}"
+        + (f", open fds: {stats['open_fds']}" if stats["open_fds"] is not None else "")
+    )
+    await _session_manager.close_all()
@@ -0,0 +1,76 @@
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class Singleflight:
+    """
+    Coalesces identical concurrent reads.
+
+    The first caller of a key runs the call, every caller that arrives while it is
+    in flight waits for the same result (or exception) instead of sending its own
+    request. Nothing is cached: once the call finishes, the next caller of the key
+    starts a new one. Only use it for idempotent reads.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+        self.calls: Dict[Hashable, int] = {}
+        self.deduped: Dict[Hashable, int] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fn, or join the in-flight call of the same key.
+
+        Args:
+            key: Identity of the request, e.g. (endpoint, method, params)
+            fn: Coroutine function doing the request
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            self.deduped[key] = self.deduped.get(key, 0) + 1
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        self.calls[key] = self.calls.get(key, 0) + 1
+        try:
+            result = await fn()
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Mark the exception retrieved if nobody else was waiting
+                future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Calls made and calls saved per key."""
+        return {
+            str(key): {"calls": calls, "deduped": self.deduped.get(key, 0)}
+            for key, calls in self.calls.items()
+        }
+
+
+def request_key(method: str, url: str, params: Optional[dict] = None) -> tuple:
+    """Singleflight key of an HTTP request."""
+    return (method.upper(), url, json.dumps(params or {}, sort_keys=True))
+
+
+_singleflight: Optional[Singleflight] = None
+
+
+def get_singleflight() -> Singleflight:
+    """Get the process-wide singleflight group."""
+    global _singleflight
+    if _singleflight is None:
+        _singleflight = Singleflight()
+    return _singleflight
@@ -0,0 +1,28 @@
+import asyncio
+
+from src.model.onchain.hedging import HedgePolicy
+
+
+def test_cancelled_request_is_kept_as_a_latency_sample():
+    async def run():
+        policy = HedgePolicy()
+        # Only the duplicate of a slow read is sent before any sample exists
+        policy.hedge_delay = lambda endpoint: 0.05
+
+        async def slow():
+            await asyncio.sleep(1)
+            return "primary"
+
+        async def fast():
+            return "backup"
+
+        result = await policy.run(("primary", slow), [("backup", fast)])
+        await asyncio.sleep(0)
+
+        assert result == "backup"
+        primary_samples = list(policy._stats("primary").latencies)
+        assert len(primary_samples) == 1
+        assert primary_samples[0] >= 0.05
+        assert len(policy._stats("backup").latencies) == 1
+
+    asyncio.run(run())
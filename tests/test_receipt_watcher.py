@@ -0,0 +1,60 @@
+import asyncio
+
+from hexbytes import HexBytes
+
+from src.model.onchain.receipt_watcher import ReceiptWatcher
+
+
+TX_HASH = HexBytes("0x" + "ab" * 32)
+
+
+class FakeEth:
+    """Chain at block 10 that mines TX_HASH into block 11 right after the first RPC call."""
+
+    def __init__(self):
+        self.head = 10
+        self.receipts = {}
+        self.blocks = {}
+        self.calls = 0
+
+    def _after_call(self):
+        self.calls += 1
+        if self.calls == 1:
+            self.head = 11
+            receipt = {"transactionHash": TX_HASH, "blockNumber": 11, "status": 1}
+            self.receipts[TX_HASH] = receipt
+            self.blocks[11] = [receipt]
+
+    @property
+    def block_number(self):
+        async def read():
+            head = self.head
+            self._after_call()
+            return head
+
+        return read()
+
+    async def get_transaction_receipt(self, tx_hash):
+        receipt = self.receipts.get(HexBytes(tx_hash))
+        self._after_call()
+        return receipt
+
+    async def get_block_receipts(self, block_number):
+        receipts = self.blocks.get(block_number, [])
+        self._after_call()
+        return receipts
+
+
+class FakeWeb3:
+    def __init__(self):
+        self.eth = FakeEth()
+
+
+def test_tx_mined_during_the_first_tick_is_resolved():
+    async def run():
+        watcher = ReceiptWatcher(chain_id=123456, poll_interval=0.01)
+        receipt = await watcher.wait_for_receipt(FakeWeb3(), TX_HASH, timeout=1)
+        assert receipt["blockNumber"] == 11
+        assert watcher.pending_count == 0
+
+    asyncio.run(run())
@@ -0,0 +1,85 @@
+import asyncio
+
+import primp
+from curl_cffi.requests import AsyncSession
+
+from src.utils.session_manager import SessionKey, SessionManager
+
+
+LOYALTY_URL = "https://loyalty.campnetwork.xyz"
+
+
+def test_primp_client_cookies_are_not_carried_over():
+    async def run():
+        manager = SessionManager()
+        key = SessionKey("primp", "", "chrome_133")
+
+        def factory():
+            return primp.AsyncClient(impersonate="chrome_133", cookie_store=True)
+
+        first = await manager.acquire(key, factory)
+        first.set_cookies(
+            LOYALTY_URL,
+            {"cf_clearance": "wallet-1", "__Secure-next-auth.session-token": "wallet-1"},
+        )
+        await manager.release(first)
+
+        second = await manager.acquire(key, factory)
+        assert second is not first
+        # primp 0.15 aborts on get_cookies of an empty jar, read it with a probe cookie
+        second.set_cookies(LOYALTY_URL, {"probe": "1"})
+        assert second.get_cookies(LOYALTY_URL) == {"probe": "1"}
+        assert manager.stats()["reused"] == 0
+        assert manager.stats()["closed"] == 1
+        await manager.close_all()
+
+    asyncio.run(run())
+
+
+def test_curl_session_is_reused_with_an_empty_jar():
+    async def run():
+        manager = SessionManager()
+        key = SessionKey("curl_cffi", "", "chrome131")
+
+        def factory():
+            return AsyncSession(impersonate="chrome131")
+
+        first = await manager.acquire(key, factory)
+        first.cookies.set("cf_clearance", "wallet-1", domain="loyalty.campnetwork.xyz")
+        await manager.release(first)
+
+        second = await manager.acquire(key, factory)
+        assert second is first
+        assert not second.cookies
+        await manager.close_all()
+
+    asyncio.run(run())
+
+
+def test_curl_session_with_cleared_cookies_and_headers_is_reused():
+    async def run():
+        manager = SessionManager()
+        key = SessionKey("curl_cffi", "127.0.0.1:8080", "chrome131")
+
+        def factory():
+            session = AsyncSession(impersonate="chrome131")
+            session.headers.update({"accept": "*/*"})
+            return session
+
+        first = await manager.acquire(key, factory)
+        # What a Twitter client leaves behind
+        first.cookies.update({"auth_token": "wallet-1", "ct0": "csrf-1"})
+        first.headers["x-csrf-token"] = "csrf-1"
+        await manager.release(first)
+
+        second = await manager.acquire(key, factory)
+        assert second is first
+        assert not second.cookies.get_dict()
+        assert "x-csrf-token" not in second.headers
+        assert second.headers["accept"] == "*/*"
+        assert manager.stats()["created"] == 1
+        assert manager.stats()["reused"] == 1
+        assert manager.stats()["closed"] == 0
+        await manager.close_all()
+
+    asyncio.run(run())